@@ -66,6 +66,25 @@ class GenerateObjectABC(GenerateABC, ABC):
             ]
         )
 
+    def _gen_code_container_base_class_property(self) -> str:
+        """Return the method code.
+
+        @property
+        def _base_class(self) -> type[Artifact]:
+            '''Return the type specific object class.'''
+            return Artifact
+        """
+        return '\n'.join(
+            [
+                f'{self.i1}@property',
+                f'{self.i1}def _base_class(self) -> type[{self.type_.singular().pascal_case()}]:',
+                f'{self.i2}"""Return the type specific object class."""',
+                f'{self.i2}return {self.type_.singular().pascal_case()}',
+                '',
+                '',
+            ]
+        )
+
     def _gen_code_container_cached_dict_property(self) -> str:
         """Return the method code.
 
@@ -916,6 +935,9 @@ class GenerateObjectABC(GenerateABC, ABC):
         # generate api_endpoint property method
         _code += self._gen_code_api_endpoint_property()
 
+        # generate base_class property method
+        _code += self._gen_code_container_base_class_property()
+
         # generate cached_dict property method
         _code += self._gen_code_container_cached_dict_property()
 
@@ -88,6 +88,11 @@ class ArtifactTypes(ObjectCollectionABC):
         """Return the type specific API endpoint."""
         return ApiEndpoints.ARTIFACT_TYPES.value
 
+    @property
+    def _base_class(self) -> type[ArtifactType]:
+        """Return the type specific object class."""
+        return ArtifactType
+
     @property
     def filter(self) -> ArtifactTypeFilter:
         """Return the type specific filter object."""
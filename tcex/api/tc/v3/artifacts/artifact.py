@@ -181,6 +181,11 @@ class Artifacts(ObjectCollectionABC):
         """Return the type specific API endpoint."""
         return ApiEndpoints.ARTIFACTS.value
 
+    @property
+    def _base_class(self) -> type[Artifact]:
+        """Return the type specific object class."""
+        return Artifact
+
     @property
     def filter(self) -> ArtifactFilter:
         """Return the type specific filter object."""
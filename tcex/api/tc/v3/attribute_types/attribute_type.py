@@ -95,6 +95,11 @@ class AttributeTypes(ObjectCollectionABC):
         """Return the type specific API endpoint."""
         return ApiEndpoints.ATTRIBUTE_TYPES.value
 
+    @property
+    def _base_class(self) -> type[AttributeType]:
+        """Return the type specific object class."""
+        return AttributeType
+
     @cached_property_filesystem(ttl=86400)
     def cached_dict(self) -> dict[str, dict]:
         """Return cached data as a dict keyed by name."""
@@ -0,0 +1,165 @@
+"""TcEx Framework Module"""
+
+# standard library
+import logging
+import threading
+import time
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+# first-party
+from tcex.api.tc.v3.object_abc import ObjectABC
+from tcex.app.service_context import current_name, current_trigger_id
+from tcex.logger.trace_logger import TraceLogger
+
+# get tcex logger
+_logger: TraceLogger = logging.getLogger(__name__.split('.', maxsplit=1)[0])  # type: ignore
+
+
+@dataclass
+class BulkResult:
+    """Bulk operation result for a single object."""
+
+    obj: ObjectABC
+    success: bool
+    error: Exception | None = None
+    status_code: int | None = None
+
+
+class BulkOperation:
+    """Run create, update, and delete for many v3 objects with bounded concurrency.
+
+    Each object is processed independently, failures (including exceptions) are captured
+    on the returned BulkResult instead of being raised. Requests rejected with a rate limit
+    status code are retried with an exponential backoff, honoring the Retry-After header,
+    whatever the content type of the response.
+
+    .. code-block:: python
+        :linenos:
+        :lineno-start: 1
+
+        v3 = tcex.api.tc.v3
+        notes = [v3.note(case_id=1, text=f'{i}') for i in range(9)]
+        results = v3.bulk(max_workers=5).create(notes)
+        failed = [r for r in results if not r.success]
+
+    Args:
+        max_workers: The maximum number of concurrent requests.
+        max_retries: The number of retries for rate limited requests.
+        backoff_factor: The backoff factor in seconds between rate limited retries.
+    """
+
+    def __init__(self, max_workers: int = 5, max_retries: int = 3, backoff_factor: float = 1.0):
+        """Initialize instance properties."""
+        self.backoff_factor = backoff_factor
+        self.max_retries = max_retries
+        self.max_workers = max_workers
+
+        # properties
+        self.log = _logger
+        self.rate_limit_status_codes = [429, 503]
+
+    def _execute(self, objects: Iterable[ObjectABC], method: str, **kwargs) -> list[BulkResult]:
+        """Execute the method on all objects, returning results in the order provided."""
+        objects = list(objects)
+
+        # the token module selects the API token by thread name or trigger id, so the
+        # context of the calling thread (or asyncio service task) is applied to each worker
+        # thread.
+        context = {'name': current_name(), 'trigger_id': current_trigger_id()}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [
+                executor.submit(self._process, obj, method, context, **kwargs) for obj in objects
+            ]
+            results = [future.result() for future in futures]
+
+        failed = len([r for r in results if not r.success])
+        self.log.info(
+            f'feature=api-tc-v3, event=bulk-{method}, count={len(results)}, failed={failed}'
+        )
+        return results
+
+    def _process(self, obj: ObjectABC, method: str, context: dict, **kwargs) -> BulkResult:
+        """Process a single object, retrying rate limited requests."""
+        worker_thread = threading.current_thread()
+        worker_name = worker_thread.name
+        worker_thread.name = context['name']
+        worker_thread.trigger_id = context['trigger_id']  # type: ignore
+
+        try:
+            for attempt in range(self.max_retries + 1):
+                try:
+                    r = getattr(obj, method)(**kwargs)
+                except RuntimeError as ex:
+                    # handle_error raised for a failed JSON response
+                    error = ex
+                    status_code = self._status_code(obj)
+                except Exception as ex:
+                    # e.g., requests.Timeout or a validation error, not retried
+                    return BulkResult(
+                        obj=obj, success=False, error=ex, status_code=self._status_code(obj)
+                    )
+                else:
+                    # failed responses without a JSON content type (e.g., from a proxy or
+                    # gateway) are not raised by the request, check the response as well
+                    if obj.success(r):
+                        return BulkResult(obj=obj, success=True, status_code=r.status_code)
+                    status_code = r.status_code
+                    error = RuntimeError(
+                        f'The {method} request failed ({status_code} {r.reason}): {r.text[:500]}'
+                    )
+
+                if status_code not in self.rate_limit_status_codes or attempt >= self.max_retries:
+                    return BulkResult(obj=obj, success=False, error=error, status_code=status_code)
+
+                time.sleep(self._retry_after(obj, attempt))
+        finally:
+            worker_thread.name = worker_name
+            worker_thread.trigger_id = None  # type: ignore
+
+        return BulkResult(obj=obj, success=False)  # pragma: no cover
+
+    def _retry_after(self, obj: ObjectABC, attempt: int) -> float:
+        """Return the number of seconds to wait before retrying the request."""
+        retry_after = obj.request.headers.get('Retry-After')
+        if retry_after is not None and retry_after.isdigit():
+            return float(retry_after)
+        return self.backoff_factor * (2**attempt)
+
+    @staticmethod
+    def _status_code(obj: ObjectABC) -> int | None:
+        """Return the status code of the last request for the object, if any."""
+        request = getattr(obj, 'request', None)
+        return request.status_code if request is not None else None
+
+    def create(self, objects: Iterable[ObjectABC], params: dict | None = None) -> list[BulkResult]:
+        """Create all objects.
+
+        Args:
+            objects: The objects to create.
+            params: Additional query params for each request.
+        """
+        return self._execute(objects, 'create', params=params)
+
+    def delete(self, objects: Iterable[ObjectABC], params: dict | None = None) -> list[BulkResult]:
+        """Delete all objects.
+
+        Args:
+            objects: The objects to delete.
+            params: Additional query params for each request.
+        """
+        return self._execute(objects, 'delete', params=params)
+
+    def update(
+        self, objects: Iterable[ObjectABC], mode: str | None = None, params: dict | None = None
+    ) -> list[BulkResult]:
+        """Update all objects.
+
+        Args:
+            objects: The objects to update.
+            mode: The mode for nested objects (e.g., append, delete, replace).
+            params: Additional query params for each request.
+        """
+        return self._execute(objects, 'update', mode=mode, params=params)
@@ -124,6 +124,11 @@ class CaseAttributes(ObjectCollectionABC):
         """Return the type specific API endpoint."""
         return ApiEndpoints.CASE_ATTRIBUTES.value
 
+    @property
+    def _base_class(self) -> type[CaseAttribute]:
+        """Return the type specific object class."""
+        return CaseAttribute
+
     @property
     def filter(self) -> CaseAttributeFilter:
         """Return the type specific filter object."""
@@ -119,7 +119,7 @@ class Case(ObjectABC):
     def associated_cases(self) -> Generator[Self, None, None]:
         """Yield Case from Cases."""
         # Ensure the current item is not returned as a association
-        for case in self._iterate_over_sublist(Cases):  # type: ignore
+        for case in self._iterate_over_sublist(Cases, field='associated_cases'):  # type: ignore
             if case.model.id == self.model.id:
                 continue
             yield case  # type: ignore
@@ -359,6 +359,11 @@ class Cases(ObjectCollectionABC):
         """Return the type specific API endpoint."""
         return ApiEndpoints.CASES.value
 
+    @property
+    def _base_class(self) -> type[Case]:
+        """Return the type specific object class."""
+        return Case
+
     @property
     def filter(self) -> CaseFilter:
         """Return the type specific filter object."""
@@ -124,6 +124,11 @@ class GroupAttributes(ObjectCollectionABC):
         """Return the type specific API endpoint."""
         return ApiEndpoints.GROUP_ATTRIBUTES.value
 
+    @property
+    def _base_class(self) -> type[GroupAttribute]:
+        """Return the type specific object class."""
+        return GroupAttribute
+
     @property
     def filter(self) -> GroupAttributeFilter:
         """Return the type specific filter object."""
@@ -396,6 +396,11 @@ class Groups(ObjectCollectionABC):
         """Return the type specific API endpoint."""
         return ApiEndpoints.GROUPS.value
 
+    @property
+    def _base_class(self) -> type[Group]:
+        """Return the type specific object class."""
+        return Group
+
     @property
     def filter(self) -> GroupFilter:
         """Return the type specific filter object."""
@@ -124,6 +124,11 @@ class IndicatorAttributes(ObjectCollectionABC):
         """Return the type specific API endpoint."""
         return ApiEndpoints.INDICATOR_ATTRIBUTES.value
 
+    @property
+    def _base_class(self) -> type[IndicatorAttribute]:
+        """Return the type specific object class."""
+        return IndicatorAttribute
+
     @property
     def filter(self) -> IndicatorAttributeFilter:
         """Return the type specific filter object."""
@@ -197,7 +197,9 @@ class Indicator(ObjectABC):
     def associated_indicators(self) -> Generator[Self, None, None]:
         """Yield Indicator from Indicators."""
         # Ensure the current item is not returned as a association
-        for indicator in self._iterate_over_sublist(Indicators):  # type: ignore
+        for indicator in self._iterate_over_sublist(  # type: ignore
+            Indicators, field='associated_indicators'
+        ):
             if indicator.model.id == self.model.id:
                 continue
             yield indicator  # type: ignore
@@ -372,6 +374,11 @@ class Indicators(ObjectCollectionABC):
         """Return the type specific API endpoint."""
         return ApiEndpoints.INDICATORS.value
 
+    @property
+    def _base_class(self) -> type[Indicator]:
+        """Return the type specific object class."""
+        return Indicator
+
     @property
     def filter(self) -> IndicatorFilter:
         """Return the type specific filter object."""
@@ -96,6 +96,11 @@ class Categories(ObjectCollectionABC):
         """Return the type specific API endpoint."""
         return ApiEndpoints.CATEGORIES.value
 
+    @property
+    def _base_class(self) -> type[Category]:
+        """Return the type specific object class."""
+        return Category
+
     @property
     def filter(self) -> CategoryFilter:
         """Return the type specific filter object."""
@@ -249,6 +249,11 @@ class IntelRequirements(ObjectCollectionABC):
         """Return the type specific API endpoint."""
         return ApiEndpoints.INTEL_REQUIREMENTS.value
 
+    @property
+    def _base_class(self) -> type[IntelRequirement]:
+        """Return the type specific object class."""
+        return IntelRequirement
+
     @property
     def filter(self) -> IntelRequirementFilter:
         """Return the type specific filter object."""
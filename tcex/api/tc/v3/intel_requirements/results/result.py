@@ -94,6 +94,11 @@ class Results(ObjectCollectionABC):
         """Return the type specific API endpoint."""
         return ApiEndpoints.RESULTS.value
 
+    @property
+    def _base_class(self) -> type[Result]:
+        """Return the type specific object class."""
+        return Result
+
     @property
     def filter(self) -> ResultFilter:
         """Return the type specific filter object."""
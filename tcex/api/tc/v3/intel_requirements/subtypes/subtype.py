@@ -93,6 +93,11 @@ class Subtypes(ObjectCollectionABC):
         """Return the type specific API endpoint."""
         return ApiEndpoints.SUBTYPES.value
 
+    @property
+    def _base_class(self) -> type[Subtype]:
+        """Return the type specific object class."""
+        return Subtype
+
     @property
     def filter(self) -> SubtypeFilter:
         """Return the type specific filter object."""
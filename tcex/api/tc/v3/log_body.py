@@ -0,0 +1,72 @@
+"""TcEx Framework Module"""
+
+# third-party
+from requests import Response
+
+
+class LogBody:
+    """Lazy, truncated rendering of a request or response body for logging.
+
+    The body is only rendered when the log message is formatted. Bodies longer than two
+    segments are sliced before decoding, so only the logged head and tail are decoded.
+
+    Args:
+        body: The request or response body.
+        max_segment: The maximum length of the logged head and tail of the body.
+        encoding: The encoding used to decode a bytes body.
+        binary: If True, the body is not decoded and a placeholder is logged.
+    """
+
+    __slots__ = ('binary', 'body', 'encoding', 'max_segment')
+
+    def __init__(
+        self,
+        body: bytes | str | None,
+        max_segment: int,
+        encoding: str | None = None,
+        binary: bool = False,
+    ):
+        """Initialize instance properties."""
+        self.binary = binary
+        self.body = body
+        self.encoding = encoding or 'utf-8'
+        self.max_segment = max_segment
+
+    def __str__(self) -> str:
+        """Return the truncated body."""
+        if self.body is None:
+            return 'None'
+
+        if self.binary:
+            return '[binary data]'
+
+        body = self.body
+        if len(body) > self.max_segment * 2:
+            head = self._decode(body[: self.max_segment])
+            tail = self._decode(body[-self.max_segment :])
+            return f'{head}... [truncated] ...{tail}'
+        return self._decode(body)
+
+    def _decode(self, value: bytes | str) -> str:
+        """Return the decoded value."""
+        if isinstance(value, bytes):
+            return value.decode(self.encoding, errors='replace')
+        return value
+
+    @classmethod
+    def from_request_body(cls, body: bytes | str | None, max_segment: int) -> 'LogBody':
+        """Return a LogBody for a request body, bytes bodies are treated as binary data."""
+        return cls(body, max_segment, binary=isinstance(body, bytes))
+
+    @classmethod
+    def from_response(cls, response: Response, max_segment: int) -> 'LogBody':
+        """Return a LogBody for a response.
+
+        Streamed responses that have not been read and non text responses are never decoded.
+        """
+        content_type = response.headers.get('Content-Type') or ''
+        if not response._content_consumed or not (  # noqa: SLF001
+            'json' in content_type or content_type.startswith('text/')
+        ):
+            return cls(b'', max_segment, binary=True)
+        return cls(response.content, max_segment, encoding=response.encoding)
@@ -98,6 +98,11 @@ class Notes(ObjectCollectionABC):
         """Return the type specific API endpoint."""
         return ApiEndpoints.NOTES.value
 
+    @property
+    def _base_class(self) -> type[Note]:
+        """Return the type specific object class."""
+        return Note
+
     @property
     def filter(self) -> NoteFilter:
         """Return the type specific filter object."""
@@ -13,7 +13,10 @@ from requests import Response, Session
 from requests.exceptions import ProxyError, RetryError
 
 # first-party
+from tcex.api.tc.v3.log_body import LogBody
+from tcex.api.tc.v3.object_cache import ObjectCache
 from tcex.api.tc.v3.object_collection_abc import ObjectCollectionABC
+from tcex.api.tc.v3.options_cache import OptionsCache
 from tcex.api.tc.v3.tql.tql_operator import TqlOperator
 from tcex.api.tc.v3.v3_model_abc import V3ModelABC
 from tcex.exit.error_code import handle_error
@@ -46,6 +49,7 @@ class ObjectABC(ABC):  # noqa: B024
             'securityLabels': [],
             'tags': [],
         }
+        self._sublist_data: dict[str, list[dict]] = {}
         self.util = Util()
         self.log = _logger
         self.request: Response
@@ -76,11 +80,27 @@ class ObjectABC(ABC):  # noqa: B024
         return {}
 
     def _iterate_over_sublist(
-        self, sublist_type: ObjectCollectionABC, custom_associations: bool = False
+        self,
+        sublist_type: ObjectCollectionABC,
+        custom_associations: bool = False,
+        field: str | None = None,
     ) -> Generator[Self, None, None]:
-        """Iterate over any nested collections."""
+        """Iterate over any nested collections.
+
+        Args:
+            sublist_type: The collection class of the sublist.
+            custom_associations: If True, iterate over the custom associations.
+            field: The model field of the sublist, required to use preloaded data when
+                several fields of the model share the sublist type (e.g., associated_cases).
+        """
         sublist = sublist_type(session=self._session)  # type: ignore
 
+        # use the sublist data loaded by ObjectCollectionABC.bulk_load_sublists, if available
+        if custom_associations is False:
+            sublist._preloaded_data = self._preloaded_sublist(  # noqa: SLF001
+                type(sublist.model), field
+            )
+
         # determine the filter type and value based on the available object fields.
         unique_id_data = self._calculate_unique_id()
 
@@ -106,7 +126,52 @@ class ObjectABC(ABC):  # noqa: B024
                 'unique_id': unique_id_data.get('value'),
             }
             yield obj
-        self.request = sublist.request
+
+        if hasattr(sublist, 'request'):
+            self.request = sublist.request
+
+    def _invalidate_object_cache(self):
+        """Remove all cached GET responses for this object."""
+        object_cache = ObjectCache()
+        if not object_cache.enabled:
+            return
+
+        unique_ids = [getattr(self.model, field, None) for field in ['id', 'xid', 'summary']]
+        object_cache.invalidate(
+            [
+                object_cache.object_key(self._session, self._api_endpoint, unique_id)
+                for unique_id in unique_ids
+                if unique_id
+            ]
+        )
+
+    def _preload_sublists(self, data: dict, fields: list[str]):
+        """Store the nested sublist data returned from a bulk request.
+
+        Args:
+            data: The raw API response data for this object.
+            fields: The nested field names (camel case) that were requested.
+        """
+        for field in self.model.__fields__.values():
+            if field.alias in fields:
+                self._sublist_data[field.alias] = (data.get(field.alias) or {}).get('data', [])
+
+    def _preloaded_sublist(self, model_type: type, field: str | None = None) -> list[dict] | None:
+        """Return the preloaded data of a sublist field or None if not preloaded.
+
+        Without a field name the field is resolved by the sublist model type, the preloaded
+        data is not used if the type is ambiguous (e.g., associated_cases and related).
+
+        Args:
+            model_type: The model type of the sublist (e.g., CasesModel).
+            field: The model field of the sublist (e.g., associated_cases).
+        """
+        if field is None:
+            aliases = [f.alias for f in self.model.__fields__.values() if f.type_ is model_type]
+            if len(aliases) != 1:
+                return None
+            return self._sublist_data.get(aliases[0])
+        return self._sublist_data.get(self.model.__fields__[field].alias)
 
     @property
     def _max_logging_segment(self) -> int:
@@ -197,6 +262,7 @@ class ObjectABC(ABC):  # noqa: B024
         """
         method = 'POST'
         body = self.model.gen_body_json(method=method)
+        self._sublist_data.clear()
         params = self.gen_params(params) if params else None
         self._request(
             method,
@@ -211,6 +277,7 @@ class ObjectABC(ABC):  # noqa: B024
 
         # update the model with the response from the API
         self.model = type(self.model)(**response_json.get('data'))
+        self._invalidate_object_cache()
 
         return self.request
 
@@ -218,6 +285,7 @@ class ObjectABC(ABC):  # noqa: B024
         """Delete the object."""
         method = 'DELETE'
         body = self.model.gen_body_json(method)
+        self._sublist_data.clear()
 
         # get the unique id value for id, xid, summary, etc ...
         unique_id = self._calculate_unique_id().get('value')
@@ -226,17 +294,14 @@ class ObjectABC(ABC):  # noqa: B024
         self._validate_id(unique_id, self.url(method, unique_id))
 
         self._request(method, self.url(method, unique_id), body, params=params)
+        self._invalidate_object_cache()
 
         return self.request
 
     @cached_property
     def fields(self) -> list[dict[str, str]]:
         """Return the field data for this object."""
-        _fields = []
-        r = self._session.options(f'{self._api_endpoint}/fields', params={})
-        if r.ok:
-            _fields = r.json().get('data', [])
-        return _fields
+        return OptionsCache.get(self._session, f'{self._api_endpoint}/fields')
 
     def gen_params(self, params: dict) -> dict:
         """Return appropriate params values."""
@@ -289,44 +354,53 @@ class ObjectABC(ABC):  # noqa: B024
         # validate an id is available
         self._validate_id(unique_id, self.url(method, unique_id))
 
+        # use the cached response when the object cache is enabled
+        object_cache = ObjectCache()
+        object_key = object_cache.object_key(self._session, self._api_endpoint, unique_id)
+        if object_cache.enabled:
+            cached = object_cache.get(object_key, params)
+            if cached is not None:
+                self.request, data = cached
+                self.model = data
+                return self.request
+
         body = self.model.gen_body_json(method)
         self._request(method, self.url(method, unique_id), body, params)
 
         # update model
-        self.model = self.request.json().get('data')
+        data = self.request.json().get('data')
+        self.model = data
+
+        if object_cache.enabled:
+            object_cache.set(object_key, params, self.request, data)
 
         return self.request
 
     def log_request(
         self, method: str, url: str, body: bytes | str | None = None, params: dict | None = None
     ):
-        """Log the response text."""
-        max_log_segment = self._max_logging_segment
-
-        if isinstance(body, bytes):
-            body = '[binary data]'
-
-        if body is not None and len(body) > (max_log_segment * 2):
-            body = body[:max_log_segment] + '... [truncated] ...' + body[-max_log_segment:]
-
-        self.log.info(
-            f'feature=api-tc-v3, request-method={method}, request-url={url}, '
-            f'request-body={body}, request-params={params}',
-        )
+        """Log the request body (rendered only if the log event is handled)."""
+        if self.log.isEnabledFor(logging.INFO):
+            self.log.info(
+                'feature=api-tc-v3, request-method=%s, request-url=%s, '
+                'request-body=%s, request-params=%s',
+                method,
+                url,
+                LogBody.from_request_body(body, self._max_logging_segment),
+                params,
+            )
 
     def log_response(self, response: Response):
-        """Log the response text."""
-        max_log_segment = self._max_logging_segment
-
-        body = response.text
-        if body is not None and len(body) > (max_log_segment * 2):
-            body = body[:max_log_segment] + '... [truncated] ...' + body[-max_log_segment:]
-
-        self.log.info(
-            f'feature=api-tc-v3, response-status={response.status_code}, '
-            f'response-body={body}, response-elapsed={response.elapsed.total_seconds()}, '
-            f'response-url={response.request.url}'
-        )
+        """Log the response text (rendered only if the log event is handled)."""
+        if self.log.isEnabledFor(logging.INFO):
+            self.log.info(
+                'feature=api-tc-v3, response-status=%s, response-body=%s, '
+                'response-elapsed=%s, response-url=%s',
+                response.status_code,
+                LogBody.from_response(response, self._max_logging_segment),
+                response.elapsed.total_seconds(),
+                response.request.url,
+            )
 
     @property
     def model(self) -> V3ModelABC:
@@ -411,6 +485,7 @@ class ObjectABC(ABC):  # noqa: B024
         """
         method = 'PUT'
         body = self.model.gen_body_json(method=method, mode=mode)
+        self._sublist_data.clear()
         params = self.gen_params(params) if params else None
 
         # get the unique id value for id, xid, summary, etc ...
@@ -431,6 +506,7 @@ class ObjectABC(ABC):  # noqa: B024
         response_json = self.request.json()
 
         self.model = type(self.model)(**response_json.get('data'))
+        self._invalidate_object_cache()
 
         return self.request
 
@@ -0,0 +1,156 @@
+"""TcEx Framework Module"""
+
+# standard library
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+# third-party
+from requests import Response, Session
+
+# first-party
+from tcex.logger.trace_logger import TraceLogger
+from tcex.pleb.singleton import Singleton
+
+# get tcex logger
+_logger: TraceLogger = logging.getLogger(__name__.split('.', maxsplit=1)[0])  # type: ignore
+
+
+class ObjectCache(metaclass=Singleton):
+    """Read-through cache for v3 single object GET requests.
+
+    The cache is disabled by default. When enabled, ObjectABC.get() returns the
+    cached response for the same endpoint, unique id (id, xid, or summary), and
+    params. Entries are evicted on a least recently used basis and after **ttl**
+    seconds. Calling create(), update(), or delete() on an object invalidates all
+    entries for that object.
+
+    .. code-block:: python
+        :linenos:
+        :lineno-start: 1
+
+        cache = tcex.api.tc.v3.object_cache
+        cache.enable(max_size=10_000, ttl=300)
+        ...
+        tcex.log.info(f'object cache stats: {cache.stats}')
+    """
+
+    def __init__(self):
+        """Initialize instance properties."""
+        self.enabled = False
+        self.log = _logger
+        self.max_size = 1_000
+        self.ttl = 300
+
+        # properties
+        self._cache: OrderedDict[str, tuple[float, tuple, Response, dict]] = OrderedDict()
+        self._index: dict[tuple, set[str]] = {}
+        self._lock = threading.Lock()
+        self._stats = {'evictions': 0, 'hits': 0, 'invalidations': 0, 'misses': 0}
+
+    def _remove(self, key: str):
+        """Remove a cache entry and its index reference (lock must be held)."""
+        cached = self._cache.pop(key, None)
+        if cached is not None:
+            keys = self._index.get(cached[1], set())
+            keys.discard(key)
+            if not keys:
+                self._index.pop(cached[1], None)
+
+    def clear(self):
+        """Clear all cached data and reset the stats."""
+        with self._lock:
+            self._cache.clear()
+            self._index.clear()
+            self._stats = dict.fromkeys(self._stats, 0)
+
+    def disable(self):
+        """Disable the cache and clear all cached data."""
+        self.enabled = False
+        self.clear()
+
+    def enable(self, max_size: int | None = None, ttl: int | None = None):
+        """Enable the cache.
+
+        Args:
+            max_size: The maximum number of cached responses.
+            ttl: The number of seconds a cached response is valid.
+        """
+        self.enabled = True
+        self.max_size = max_size or self.max_size
+        self.ttl = ttl or self.ttl
+        self.log.debug(
+            f'feature=object-cache, event=cache-enabled, max-size={self.max_size}, ttl={self.ttl}'
+        )
+
+    def get(self, object_key: tuple, params: dict | None) -> tuple[Response, dict] | None:
+        """Return the cached response and response data, or None on a cache miss.
+
+        Args:
+            object_key: The key identifying the object (see object_key method).
+            params: The query params of the request.
+        """
+        key = json.dumps([object_key, params], default=str, sort_keys=True)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is None or time.monotonic() - cached[0] >= self.ttl:
+                if cached is not None:
+                    self._remove(key)
+                self._stats['misses'] += 1
+                return None
+
+            self._cache.move_to_end(key)
+            self._stats['hits'] += 1
+            return cached[2], cached[3]
+
+    def invalidate(self, object_keys: list[tuple]):
+        """Remove all cached responses for an object.
+
+        Args:
+            object_keys: The keys for all unique ids of the object (e.g., id and xid).
+        """
+        with self._lock:
+            for object_key in object_keys:
+                for key in self._index.pop(object_key, set()):
+                    self._remove(key)
+                    self._stats['invalidations'] += 1
+
+    @staticmethod
+    def object_key(session: Session, api_endpoint: str, unique_id: int | str) -> tuple:
+        """Return the key identifying a single object.
+
+        Args:
+            session: The configured TC API session.
+            api_endpoint: The type specific API endpoint.
+            unique_id: The unique id (id, xid, or summary) of the object.
+        """
+        # the TC session can point to different TC instances, include base url in the key
+        return (getattr(session, 'base_url', None), api_endpoint, str(unique_id))
+
+    def set(self, object_key: tuple, params: dict | None, response: Response, data: dict):
+        """Add a response to the cache.
+
+        Args:
+            object_key: The key identifying the object (see object_key method).
+            params: The query params of the request.
+            response: The response of the request.
+            data: The response data for the object.
+        """
+        key = json.dumps([object_key, params], default=str, sort_keys=True)
+        with self._lock:
+            self._cache[key] = (time.monotonic(), object_key, response, data)
+            self._cache.move_to_end(key)
+            self._index.setdefault(object_key, set()).add(key)
+
+            while len(self._cache) > self.max_size:
+                oldest_key = next(iter(self._cache))
+                self._remove(oldest_key)
+                self._stats['evictions'] += 1
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Return the cache hit, miss, eviction, and invalidation counts."""
+        with self._lock:
+            return {**self._stats, 'size': len(self._cache)}
@@ -5,20 +5,28 @@ import json
 import logging
 import urllib.parse
 from abc import ABC
-from collections.abc import Generator
-from typing import Any
+from collections.abc import Generator, Iterable
+from typing import TYPE_CHECKING, Any
 
 # third-party
 from requests import Response, Session
 from requests.exceptions import ProxyError, RetryError
 
 # first-party
+from tcex.api.tc.v3.log_body import LogBody
+from tcex.api.tc.v3.options_cache import OptionsCache
 from tcex.api.tc.v3.tql.tql import Tql
+from tcex.api.tc.v3.tql.tql_operator import TqlOperator
+from tcex.api.tc.v3.tql.tql_type import TqlType
 from tcex.exit.error_code import handle_error
 from tcex.logger.trace_logger import TraceLogger
 from tcex.pleb.cached_property import cached_property
 from tcex.util import Util
 
+if TYPE_CHECKING:  # pragma: no cover
+    # first-party
+    from tcex.api.tc.v3.object_abc import ObjectABC  # CIRCULAR-IMPORT
+
 # get tcex logger
 _logger: TraceLogger = logging.getLogger(__name__.split('.', maxsplit=1)[0])  # type: ignore
 
@@ -40,6 +48,8 @@ class ObjectCollectionABC(ABC):  # noqa: B024
     ):
         """Initialize instance properties."""
         self._params = params or {}
+        self._query_cache: dict[str, Any] = {}
+        self._preloaded_data: list[dict] | None = None
         self._tql_filters = tql_filters or []
 
         # properties
@@ -53,34 +63,8 @@ class ObjectCollectionABC(ABC):  # noqa: B024
         self.util = Util()
 
     def __len__(self) -> int:
-        """Return the length of the collection."""
-        parameters = self._params.copy()
-        parameters['resultLimit'] = 1
-        parameters['count'] = True
-        tql_string = self.tql.raw_tql
-        if self.type_ and self.type_.lower() in {'exclusion_lists'}:
-            ex_msg = f'len op not supported for {self.type_} API endpoint.'
-            raise NotImplementedError(ex_msg)
-        if not self.tql.raw_tql:
-            tql_string = self.tql.as_str
-        if tql_string:
-            parameters['tql'] = tql_string
-
-        # convert all keys to camel case
-        for k, v in list(parameters.items()):
-            k_ = self.util.snake_to_camel(k)
-            # if result_limit and resultLimit both show up use the proper cased version
-            if k_ not in parameters:
-                parameters[k_] = v
-
-        self._request(
-            'GET',
-            self._api_endpoint,
-            body=None,
-            params=parameters,
-            headers={'content-type': 'application/json'},
-        )
-        return self.request.json().get('count', len(self.request.json().get('data', [])))
+        """Return the length of the collection (not cached, see count)."""
+        return self.count(refresh=True)
 
     @property
     def _api_endpoint(self):  # pragma: no cover
@@ -88,6 +72,12 @@ class ObjectCollectionABC(ABC):  # noqa: B024
         ex_msg = 'Child class must implement this method.'
         raise NotImplementedError(ex_msg)
 
+    @property
+    def _base_class(self) -> type:  # pragma: no cover
+        """Return the type specific object class."""
+        ex_msg = 'Child class must implement this method.'
+        raise NotImplementedError(ex_msg)
+
     @property
     def _max_logging_segment(self) -> int:
         """Return the maximum logging length based on the log level."""
@@ -101,6 +91,24 @@ class ObjectCollectionABC(ABC):  # noqa: B024
             case _:
                 return 200
 
+    def _query_cache_key(self, query_type: str, params: dict) -> str:
+        """Return the cache key for a query, which changes whenever the filters change."""
+        return json.dumps([query_type, params], default=str, sort_keys=True)
+
+    def _query_params(self, result_limit: int = 1) -> dict:
+        """Return the params for a minimal query using the current filters."""
+        # convert all keys to camel case (lists are copied as iterate extends fields)
+        parameters = {
+            self.util.snake_to_camel(k): list(v) if isinstance(v, list) else v
+            for k, v in self._params.items()
+        }
+        parameters['resultLimit'] = result_limit
+
+        tql_string = self.tql.raw_tql or self.tql.as_str
+        if tql_string:
+            parameters['tql'] = tql_string
+        return parameters
+
     def _request(
         self,
         method: str,
@@ -150,42 +158,160 @@ class ObjectCollectionABC(ABC):  # noqa: B024
         # log content for debugging
         self.log_response(self.request)
 
+    def bulk_load_sublists(
+        self, objects: Iterable['ObjectABC'], fields: list[str], chunk_size: int = 100
+    ):
+        """Load nested sublists (e.g., tags, attributes) for many parent objects at once.
+
+        Instead of one TQL query per parent object, the parents are fetched in chunks
+        using an "id IN (...)" TQL filter with the nested fields expanded. The nested
+        data is stored on each parent object and used by the sublist properties (e.g.,
+        group.tags) in place of a new API request.
+
+        Nested data returned through field expansion is subject to the server side
+        limits for nested data (e.g., v3ApiIntelLinkLimit for associations).
+
+        .. code-block:: python
+            :linenos:
+            :lineno-start: 1
+
+            groups = list(tcex.api.tc.v3.groups())
+            tcex.api.tc.v3.groups().bulk_load_sublists(
+                groups, ['associatedGroups', 'tags']
+            )
+            for group in groups:
+                for tag in group.tags:  # no API request
+                    ...
+
+        Args:
+            objects: The parent objects, which must be of the same type as the collection.
+            fields: The nested field names (e.g., associatedGroups, attributes, tags).
+            chunk_size: The number of parent objects to fetch per request.
+        """
+        fields = [self.util.snake_to_camel(f) for f in fields]
+
+        # group the parent objects by id, objects without an id can't be bulk loaded
+        parents: dict[int, list[ObjectABC]] = {}
+        for obj in objects:
+            if obj.model.id is None:
+                self.log.warning(
+                    f'feature=api-tc-v3, event=bulk-load-sublists, '
+                    f'message=object-missing-id, type={obj.type_}'
+                )
+                continue
+            parents.setdefault(obj.model.id, []).append(obj)
+
+        parent_ids = list(parents)
+        for index in range(0, len(parent_ids), chunk_size):
+            chunk = parent_ids[index : index + chunk_size]
+
+            tql = Tql()
+            tql.add_filter('id', TqlOperator.IN, chunk, TqlType.INTEGER)
+            params: dict = {'fields': fields, 'resultLimit': len(chunk), 'tql': tql.as_str}
+
+            url = self._api_endpoint
+            while url:
+                self._request(
+                    'GET',
+                    body=None,
+                    url=url,
+                    headers={'content-type': 'application/json'},
+                    params=params,
+                )
+
+                # reset params as the next url contains all params
+                params = {}
+
+                response = self.request.json()
+                for result in response.get('data', []):
+                    for obj in parents.get(result.get('id'), []):
+                        obj._preload_sublists(result, fields)  # noqa: SLF001
+
+                url = response.get('next')
+
+    def count(self, refresh: bool = False) -> int:
+        """Return the number of objects matching the current filters.
+
+        The result is cached per TQL string and params for the life of the collection,
+        changing the filters results in a new request.
+
+        Args:
+            refresh: If True, request the count even if a cached result exists.
+        """
+        if self.type_ and self.type_.lower() in {'exclusion_lists'}:
+            ex_msg = f'len op not supported for {self.type_} API endpoint.'
+            raise NotImplementedError(ex_msg)
+
+        parameters = self._query_params()
+        parameters['count'] = True
+
+        cache_key = self._query_cache_key('count', parameters)
+        if refresh or cache_key not in self._query_cache:
+            self._request(
+                'GET',
+                self._api_endpoint,
+                body=None,
+                params=parameters,
+                headers={'content-type': 'application/json'},
+            )
+            response = self.request.json()
+            self._query_cache[cache_key] = response.get('count', len(response.get('data', [])))
+        return self._query_cache[cache_key]
+
+    def exists(self) -> bool:
+        """Return True if any object matches the current filters.
+
+        The count request (resultLimit=1) is used, a cached count is reused when available.
+        """
+        return self.count() > 0
+
     @property
     def filter(self):  # pragma: no cover
         """Return filter method."""
         ex_msg = 'Child class must implement this method.'
         raise NotImplementedError(ex_msg)
 
-    def log_request(
-        self, method: str, url: str, body: bytes | str | None = None, params: dict | None = None
-    ):
-        """Log the response text."""
-        max_log_segment = self._max_logging_segment
+    def first(self) -> Any | None:
+        """Return the first object matching the current filters or None.
 
-        if isinstance(body, bytes):
-            body = '[binary data]'
+        The result is cached per TQL string and params for the life of the collection,
+        changing the filters results in a new request.
+        """
+        parameters = self._query_params()
 
-        if body is not None and len(body) > (max_log_segment * 2):
-            body = body[:max_log_segment] + '... [truncated] ...' + body[-max_log_segment:]
+        cache_key = self._query_cache_key('first', parameters)
+        if cache_key not in self._query_cache:
+            # the limited params are passed to the request, the collection params are unchanged
+            self._query_cache[cache_key] = next(
+                self.iterate(base_class=self._base_class, params=parameters), None
+            )
+        return self._query_cache[cache_key]
 
-        self.log.info(
-            f'feature=api-tc-v3, request-method={method}, request-url={url}, '
-            f'request-body={body}, request-params={params}',
-        )
+    def log_request(
+        self, method: str, url: str, body: bytes | str | None = None, params: dict | None = None
+    ):
+        """Log the request body (rendered only if the log event is handled)."""
+        if self.log.isEnabledFor(logging.INFO):
+            self.log.info(
+                'feature=api-tc-v3, request-method=%s, request-url=%s, '
+                'request-body=%s, request-params=%s',
+                method,
+                url,
+                LogBody.from_request_body(body, self._max_logging_segment),
+                params,
+            )
 
     def log_response(self, response: Response):
-        """Log the response text."""
-        max_log_segment = self._max_logging_segment
-
-        body = response.text
-        if body is not None and len(body) > (max_log_segment * 2):
-            body = body[:max_log_segment] + '... [truncated] ...' + body[-max_log_segment:]
-
-        self.log.info(
-            f'feature=api-tc-v3, response-status={response.status_code}, '
-            f'response-body={body}, response-elapsed={response.elapsed.total_seconds()}, '
-            f'response-url={response.request.url}'
-        )
+        """Log the response text (rendered only if the log event is handled)."""
+        if self.log.isEnabledFor(logging.INFO):
+            self.log.info(
+                'feature=api-tc-v3, response-status=%s, response-body=%s, '
+                'response-elapsed=%s, response-url=%s',
+                response.status_code,
+                LogBody.from_response(response, self._max_logging_segment),
+                response.elapsed.total_seconds(),
+                response.request.url,
+            )
 
     @property
     def model(self):
@@ -203,6 +329,12 @@ class ObjectCollectionABC(ABC):  # noqa: B024
         params: dict | None = None,
     ) -> Generator:
         """Iterate over CM/TI objects."""
+        # sublist data was already loaded by the parent (see bulk_load_sublists)
+        if self._preloaded_data is not None and api_endpoint is None:
+            for result in self._preloaded_data:
+                yield base_class(session=self._session, **result)  # type: ignore
+            return
+
         url = api_endpoint or self._api_endpoint
         params = params or self.params
 
@@ -288,11 +420,7 @@ class ObjectCollectionABC(ABC):  # noqa: B024
     @cached_property
     def tql_options(self):
         """Return TQL data keywords."""
-        _data = []
-        r = self._session.options(f'{self._api_endpoint}/tql', params={})
-        if r.ok:
-            _data = r.json()['data']
-        return _data
+        return OptionsCache.get(self._session, f'{self._api_endpoint}/tql')
 
     @property
     def tql_keywords(self):
@@ -0,0 +1,67 @@
+"""TcEx Framework Module"""
+
+# standard library
+import logging
+import threading
+import time
+from typing import ClassVar
+
+# third-party
+from requests import Session
+
+# first-party
+from tcex.logger.trace_logger import TraceLogger
+
+# get tcex logger
+_logger: TraceLogger = logging.getLogger(__name__.split('.', maxsplit=1)[0])  # type: ignore
+
+
+class OptionsCache:
+    """Process-wide cache for v3 OPTIONS metadata (e.g., /fields and /tql).
+
+    The metadata for an endpoint does not change during the life of an App, so the
+    data is shared by all ObjectABC and ObjectCollectionABC instances instead of
+    being requested for every new object instance. Cached data expires after
+    **ttl** seconds (default: 1 hour).
+    """
+
+    _cache: ClassVar[dict[tuple[str | None, str], tuple[float, list]]] = {}
+    _lock = threading.Lock()
+    ttl: int = 3_600
+
+    @classmethod
+    def clear(cls):
+        """Clear all cached data."""
+        with cls._lock:
+            cls._cache.clear()
+
+    @classmethod
+    def get(cls, session: Session, url: str) -> list:
+        """Return the OPTIONS data for the provided url, using cached data if available.
+
+        Args:
+            session: The configured TC API session.
+            url: The relative OPTIONS url (e.g., /v3/groups/fields).
+        """
+        # the TC session can point to different TC instances, include base url in the key
+        key = (getattr(session, 'base_url', None), url)
+
+        with cls._lock:
+            cached = cls._cache.get(key)
+            if cached is not None and time.monotonic() - cached[0] < cls.ttl:
+                return cached[1]
+
+        _data = []
+        r = session.options(url, params={})
+        if r.ok:
+            _data = r.json().get('data', [])
+
+            with cls._lock:
+                cls._cache[key] = (time.monotonic(), _data)
+        else:
+            _logger.warning(
+                f'feature=api-tc-v3, event=options-request-failed, '
+                f'url={url}, status-code={r.status_code}'
+            )
+
+        return _data
@@ -94,6 +94,11 @@ class ExclusionLists(ObjectCollectionABC):
         """Return the type specific API endpoint."""
         return ApiEndpoints.EXCLUSION_LISTS.value
 
+    @property
+    def _base_class(self) -> type[ExclusionList]:
+        """Return the type specific object class."""
+        return ExclusionList
+
     @property
     def filter(self) -> ExclusionListFilter:
         """Return the type specific filter object."""
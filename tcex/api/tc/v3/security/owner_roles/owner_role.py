@@ -82,6 +82,11 @@ class OwnerRoles(ObjectCollectionABC):
         """Return the type specific API endpoint."""
         return ApiEndpoints.OWNER_ROLES.value
 
+    @property
+    def _base_class(self) -> type[OwnerRole]:
+        """Return the type specific object class."""
+        return OwnerRole
+
     @cached_property_filesystem(ttl=86400)
     def cached_dict(self) -> dict[str, dict]:
         """Return cached data as a dict keyed by name."""
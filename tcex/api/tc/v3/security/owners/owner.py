@@ -82,6 +82,11 @@ class Owners(ObjectCollectionABC):
         """Return the type specific API endpoint."""
         return ApiEndpoints.OWNERS.value
 
+    @property
+    def _base_class(self) -> type[Owner]:
+        """Return the type specific object class."""
+        return Owner
+
     @cached_property_filesystem(ttl=86400)
     def cached_dict(self) -> dict[str, dict]:
         """Return cached data as a dict keyed by name."""
@@ -82,6 +82,11 @@ class SystemRoles(ObjectCollectionABC):
         """Return the type specific API endpoint."""
         return ApiEndpoints.SYSTEM_ROLES.value
 
+    @property
+    def _base_class(self) -> type[SystemRole]:
+        """Return the type specific object class."""
+        return SystemRole
+
     @cached_property_filesystem(ttl=86400)
     def cached_dict(self) -> dict[str, dict]:
         """Return cached data as a dict keyed by name."""
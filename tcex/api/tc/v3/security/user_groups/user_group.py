@@ -82,6 +82,11 @@ class UserGroups(ObjectCollectionABC):
         """Return the type specific API endpoint."""
         return ApiEndpoints.USER_GROUPS.value
 
+    @property
+    def _base_class(self) -> type[UserGroup]:
+        """Return the type specific object class."""
+        return UserGroup
+
     @cached_property_filesystem(ttl=86400)
     def cached_dict(self) -> dict[str, dict]:
         """Return cached data as a dict keyed by name."""
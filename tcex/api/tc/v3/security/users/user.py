@@ -82,6 +82,11 @@ class Users(ObjectCollectionABC):
         """Return the type specific API endpoint."""
         return ApiEndpoints.USERS.value
 
+    @property
+    def _base_class(self) -> type[User]:
+        """Return the type specific object class."""
+        return User
+
     @cached_property_filesystem(ttl=86400)
     def cached_dict(self) -> dict[str, dict]:
         """Return cached data as a dict keyed by name."""
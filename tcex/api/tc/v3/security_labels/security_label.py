@@ -127,6 +127,11 @@ class SecurityLabels(ObjectCollectionABC):
         """Return the type specific API endpoint."""
         return ApiEndpoints.SECURITY_LABELS.value
 
+    @property
+    def _base_class(self) -> type[SecurityLabel]:
+        """Return the type specific object class."""
+        return SecurityLabel
+
     @property
     def filter(self) -> SecurityLabelFilter:
         """Return the type specific filter object."""
@@ -127,6 +127,11 @@ class Tags(ObjectCollectionABC):
         """Return the type specific API endpoint."""
         return ApiEndpoints.TAGS.value
 
+    @property
+    def _base_class(self) -> type[Tag]:
+        """Return the type specific object class."""
+        return Tag
+
     @property
     def filter(self) -> TagFilter:
         """Return the type specific filter object."""
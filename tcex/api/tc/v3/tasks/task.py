@@ -198,6 +198,11 @@ class Tasks(ObjectCollectionABC):
         """Return the type specific API endpoint."""
         return ApiEndpoints.TASKS.value
 
+    @property
+    def _base_class(self) -> type[Task]:
+        """Return the type specific object class."""
+        return Task
+
     @property
     def filter(self) -> TaskFilter:
         """Return the type specific filter object."""
@@ -2,8 +2,10 @@
 
 # first-party
 from tcex.api.tc.v3.attribute_types.attribute_type import AttributeType, AttributeTypes
+from tcex.api.tc.v3.bulk_operation import BulkOperation
 from tcex.api.tc.v3.case_management.case_management import CaseManagement
 from tcex.api.tc.v3.intel_requirement.ir import IR
+from tcex.api.tc.v3.object_cache import ObjectCache
 from tcex.api.tc.v3.security.security import Security
 from tcex.api.tc.v3.threat_intelligence.threat_intelligence import ThreatIntelligence
 from tcex.pleb.cached_property import cached_property
@@ -24,6 +26,19 @@ class V3(CaseManagement, Security, ThreatIntelligence, IR):
         """Return a instance of Attribute Types object."""
         return AttributeTypes(session=self.session, **kwargs)
 
+    def bulk(self, **kwargs) -> BulkOperation:
+        """Return a instance of Bulk Operation object.
+
+        Args:
+            **kwargs: Additional keyword arguments.
+
+        Keyword Args:
+            max_workers (int, kwargs): The maximum number of concurrent requests.
+            max_retries (int, kwargs): The number of retries for rate limited requests.
+            backoff_factor (float, kwargs): The backoff factor between rate limited retries.
+        """
+        return BulkOperation(**kwargs)
+
     @cached_property
     def cm(self) -> CaseManagement:
         """Return Case Management API collection."""
@@ -34,6 +49,11 @@ class V3(CaseManagement, Security, ThreatIntelligence, IR):
         """Return Intel Requirement API collection."""
         return IR(self.session)
 
+    @property
+    def object_cache(self) -> ObjectCache:
+        """Return the read-through cache for single object GET requests."""
+        return ObjectCache()
+
     @cached_property
     def security(self) -> Security:
         """Return Security API collection."""
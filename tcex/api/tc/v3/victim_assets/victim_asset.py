@@ -154,6 +154,11 @@ class VictimAssets(ObjectCollectionABC):
         """Return the type specific API endpoint."""
         return ApiEndpoints.VICTIM_ASSETS.value
 
+    @property
+    def _base_class(self) -> type[VictimAsset]:
+        """Return the type specific object class."""
+        return VictimAsset
+
     @property
     def filter(self) -> VictimAssetFilter:
         """Return the type specific filter object."""
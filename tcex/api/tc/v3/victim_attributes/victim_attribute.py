@@ -124,6 +124,11 @@ class VictimAttributes(ObjectCollectionABC):
         """Return the type specific API endpoint."""
         return ApiEndpoints.VICTIM_ATTRIBUTES.value
 
+    @property
+    def _base_class(self) -> type[VictimAttribute]:
+        """Return the type specific object class."""
+        return VictimAttribute
+
     @property
     def filter(self) -> VictimAttributeFilter:
         """Return the type specific filter object."""
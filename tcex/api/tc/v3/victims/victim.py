@@ -211,6 +211,11 @@ class Victims(ObjectCollectionABC):
         """Return the type specific API endpoint."""
         return ApiEndpoints.VICTIMS.value
 
+    @property
+    def _base_class(self) -> type[Victim]:
+        """Return the type specific object class."""
+        return Victim
+
     @property
     def filter(self) -> VictimFilter:
         """Return the type specific filter object."""
@@ -128,6 +128,11 @@ class WorkflowEvents(ObjectCollectionABC):
         """Return the type specific API endpoint."""
         return ApiEndpoints.WORKFLOW_EVENTS.value
 
+    @property
+    def _base_class(self) -> type[WorkflowEvent]:
+        """Return the type specific object class."""
+        return WorkflowEvent
+
     @property
     def filter(self) -> WorkflowEventFilter:
         """Return the type specific filter object."""
@@ -98,6 +98,11 @@ class WorkflowTemplates(ObjectCollectionABC):
         """Return the type specific API endpoint."""
         return ApiEndpoints.WORKFLOW_TEMPLATES.value
 
+    @property
+    def _base_class(self) -> type[WorkflowTemplate]:
+        """Return the type specific object class."""
+        return WorkflowTemplate
+
     @property
     def filter(self) -> WorkflowTemplateFilter:
         """Return the type specific filter object."""
@@ -1,18 +1,18 @@
 """TcEx Framework Module"""
 
 # standard library
-import concurrent.futures
 import json
 import sys
 import threading
-from collections.abc import Callable
-from functools import reduce
+import time
 from io import BytesIO
 from typing import Any
 
 # first-party
 from tcex.app.key_value_store.key_value_store import KeyValueStore
+from tcex.app.service.async_runtime import is_async_callable
 from tcex.app.service.common_service import CommonService
+from tcex.app.service.wsgi_body import FileWrapper, join_body
 from tcex.app.token import Token
 from tcex.input.field_type.sensitive import Sensitive
 from tcex.input.model.module_app_model import ModuleAppModel
@@ -33,13 +33,23 @@ class ApiService(CommonService):
         super().__init__(key_value_store, logger, model, token)
 
         # properties
-        self._metrics = {'Errors': 0, 'Requests': 0, 'Responses': 0}
+        self._in_flight = 0
+        self._in_flight_lock = threading.Lock()
+        self.metrics_registry.replace({'Errors': 0, 'Requests': 0, 'Responses': 0})
+        self.metrics_registry.gauge('In Flight', lambda: self._in_flight)
+        self.metrics_registry.histogram('Queue Wait', self.event_executor.queue_wait)
+        self.callback_time = self.metrics_registry.histogram('Callback Time')
+        self.body_write_time = self.metrics_registry.histogram('Body Write Time')
 
         # config callbacks
         self.api_event_callback: Any = None
 
-        # thread pool to handle HTTP requests
-        self.request_thread_pool = concurrent.futures.ThreadPoolExecutor(max_workers=5)
+    @property
+    def async_command_map(self) -> dict:
+        """Return the commands run as tasks on the async runtime."""
+        if is_async_callable(self.api_event_callback):
+            return {'runservice': self.process_run_service_command_async}
+        return {}
 
     @property
     def command_map(self) -> dict:
@@ -48,6 +58,25 @@ class ApiService(CommonService):
         command_map.update({'runservice': self.process_run_service_command})
         return command_map
 
+    def dispatch_rejected(self, command: str, message: dict):
+        """Reply with a 503 response to a rejected RunService command.
+
+        Args:
+            command: The lowercase command name.
+            message: The message payload from the server topic.
+        """
+        super().dispatch_rejected(command, message)
+        if command == 'runservice':
+            self.increment_metric('Errors')
+            self.publish_run_service_response(
+                '503 Service Unavailable', [], message.get('requestKey')
+            )
+
+    @property
+    def event_commands(self) -> set[str]:
+        """Return the commands dispatched on the event worker pool."""
+        return {'runservice'}
+
     def format_query_string(self, params: dict) -> str:
         """Convert name/value array to a query string.
 
@@ -106,6 +135,75 @@ class ApiService(CommonService):
             )
         return headers_
 
+    async def process_run_service_command_async(self, message: dict):
+        """Process the RunService command with an async api_event_callback.
+
+        The command runs as a task on the async runtime. The App callback is awaited and may
+        return an iterable or an async iterable of body chunks.
+
+        Args:
+            message: The message payload from the server topic.
+        """
+        # register config apiToken (before any logging)
+        self.token.register_token(
+            self.thread_name, Sensitive(message['apiToken']), message.get('expireSeconds')
+        )
+        self.log.info(f'feature=api-service, event=runservice-command, message="{message}"')
+
+        # process message
+        request_key: str = message['requestKey']
+        body = None
+        try:
+            # read body from redis
+            body_variable: str = message.pop('bodyVariable', None)
+            if body_variable is not None:
+                body: Any = await self.async_key_value_client.read(request_key, body_variable)
+                if body is not None:
+                    # for API service the data in Redis is not b64 encoded
+                    body = BytesIO(body)
+        except Exception:
+            self.log.exception('feature=api-service, event=failed-reading-body')
+
+        environ = self.run_service_environ(message, body)
+        if environ is None:
+            return  # stop processing
+
+        # the response is published after the body is written, no thread is required
+        response: list = []
+
+        def response_handler(*args, **_kwargs):
+            """Handle WSGI Response"""
+            response[:] = args[:2]
+
+        with self._in_flight_lock:
+            self._in_flight += 1
+        try:
+            start = time.perf_counter()
+            body_data: Any = await self.api_event_callback(environ, response_handler)
+            if hasattr(body_data, '__aiter__'):
+                body_data = [chunk async for chunk in body_data]
+            body_data = join_body(body_data)
+            self.callback_time.observe((time.perf_counter() - start) * 1000)
+
+            # write body to Redis
+            if body_data:
+                start = time.perf_counter()
+                await self.async_key_value_client.create(request_key, 'response.body', body_data)
+                self.body_write_time.observe((time.perf_counter() - start) * 1000)
+                self.log.info('feature=api-service, event=response-body-written')
+
+            if response:
+                self.publish_run_service_response(response[0], response[1], request_key)
+        except Exception:
+            self.log.exception('feature=api-service, event=api-event-callback-failed')
+            self.increment_metric('Errors')
+        finally:
+            with self._in_flight_lock:
+                self._in_flight -= 1
+
+        # unregister config apiToken
+        self.token.unregister_token(self.thread_name)
+
     def process_run_service_response(self, *args, **kwargs):
         """Handle service event responses.
 
@@ -114,23 +212,7 @@ class ApiService(CommonService):
         self.log.info('feature=api-service, event=response-received, status=waiting-for-body')
         kwargs['event'].wait(30)  # wait for thread event - (set on body write)
         self.log.trace(f'feature=api-service, event=response, args={args}')
-        try:
-            status_code, status = args[0].split(' ', 1)
-            response = {
-                'bodyVariable': 'response.body',
-                'command': 'Acknowledged',
-                'headers': self.format_response_headers(args[1]),
-                'requestKey': kwargs.get('request_key'),
-                'status': status,
-                'statusCode': status_code,
-                'type': 'RunService',
-            }
-            self.log.info('feature=api-service, event=response-sent')
-            self.message_broker.publish(json.dumps(response), self.model.tc_svc_client_topic)
-            self.increment_metric('Responses')
-        except Exception:
-            self.log.exception('feature=api-service, event=failed-creating-response-body')
-            self.increment_metric('Errors')
+        self.publish_run_service_response(args[0], args[1], kwargs.get('request_key'))
 
     def process_run_service_command(self, message: dict):
         """Process the RunService command.
@@ -178,6 +260,86 @@ class ApiService(CommonService):
                     body = BytesIO(body)
         except Exception:
             self.log.exception('feature=api-service, event=failed-reading-body')
+
+        environ = self.run_service_environ(message, body)
+        if environ is None:
+            return  # stop processing
+
+        def response_handler(*args, **kwargs):
+            """Handle WSGI Response"""
+            kwargs['event'] = event  # add event to kwargs for blocking
+            kwargs['request_key'] = request_key
+            self.service_thread(
+                name='response-handler',
+                target=self.process_run_service_response,
+                args=args,
+                kwargs=kwargs,
+            )
+
+        if callable(self.api_event_callback):
+            with self._in_flight_lock:
+                self._in_flight += 1
+            try:
+                start = time.perf_counter()
+                body_data: Any = join_body(self.api_event_callback(environ, response_handler))
+                self.callback_time.observe((time.perf_counter() - start) * 1000)
+
+                # write body to Redis
+                if body_data:
+                    start = time.perf_counter()
+                    self.key_value_store.client.create(request_key, 'response.body', body_data)
+                    self.body_write_time.observe((time.perf_counter() - start) * 1000)
+
+                    # set thread event to True to trigger response
+                    self.log.info('feature=api-service, event=response-body-written')
+
+                # release event lock
+                event.set()
+            except Exception:
+                self.log.exception('feature=api-service, event=api-event-callback-failed')
+                self.increment_metric('Errors')
+            finally:
+                with self._in_flight_lock:
+                    self._in_flight -= 1
+
+        # unregister config apiToken
+        self.token.unregister_token(self.thread_name)
+
+    def publish_run_service_response(
+        self, status_line: str, response_headers: list, request_key: str | None
+    ):
+        """Publish the RunService response (Acknowledged command).
+
+        Args:
+            status_line: The WSGI status line (e.g., "200 OK").
+            response_headers: The WSGI response headers.
+            request_key: The request key of the RunService command.
+        """
+        try:
+            status_code, status = status_line.split(' ', 1)
+            response = {
+                'bodyVariable': 'response.body',
+                'command': 'Acknowledged',
+                'headers': self.format_response_headers(response_headers),
+                'requestKey': request_key,
+                'status': status,
+                'statusCode': status_code,
+                'type': 'RunService',
+            }
+            self.log.info('feature=api-service, event=response-sent')
+            self.message_broker.publish(json.dumps(response), self.model.tc_svc_client_topic)
+            self.increment_metric('Responses')
+        except Exception:
+            self.log.exception('feature=api-service, event=failed-creating-response-body')
+            self.increment_metric('Errors')
+
+    def run_service_environ(self, message: dict, body: BytesIO | None) -> dict | None:
+        """Return the WSGI environ for a RunService command, None on failure.
+
+        Args:
+            message: The message payload from the server topic.
+            body: The request body.
+        """
         headers = self.format_request_headers(message.pop('headers'))
         method: str = message.pop('method')
         params: dict = message.pop('queryParams')
@@ -186,6 +348,7 @@ class ApiService(CommonService):
         try:
             environ = {
                 'wsgi.errors': sys.stderr,
+                'wsgi.file_wrapper': FileWrapper,
                 'wsgi.input': body,
                 'wsgi.multithread': True,
                 'wsgi.multiprocess': False,
@@ -228,77 +391,5 @@ class ApiService(CommonService):
         except Exception:
             self.log.exception('feature=api-service, event=failed-building-environ')
             self.increment_metric('Errors')
-            return  # stop processing
-
-        def response_handler(*args, **kwargs):
-            """Handle WSGI Response"""
-            kwargs['event'] = event  # add event to kwargs for blocking
-            kwargs['request_key'] = request_key
-            self.service_thread(
-                name='response-handler',
-                target=self.process_run_service_response,
-                args=args,
-                kwargs=kwargs,
-            )
-
-        if callable(self.api_event_callback):
-            try:
-                body_data: Any = self.api_event_callback(environ, response_handler)
-                if body_data:
-                    body_data = reduce(lambda a, b: a + b, body_data)
-
-                # write body to Redis
-                if body_data:
-                    self.key_value_store.client.create(request_key, 'response.body', body_data)
-
-                    # set thread event to True to trigger response
-                    self.log.info('feature=api-service, event=response-body-written')
-
-                # release event lock
-                event.set()
-            except Exception:
-                self.log.exception('feature=api-service, event=api-event-callback-failed')
-                self.increment_metric('Errors')
-
-        # unregister config apiToken
-        self.token.unregister_token(self.thread_name)
-
-    def process_shutdown_command(self, message: dict):
-        """Handle shutdown command."""
-        super().process_shutdown_command(message)
-        self.request_thread_pool.shutdown()
-
-    def service_thread(
-        self,
-        name: str,
-        target: Callable[..., bool | None],
-        args: tuple | None = None,
-        kwargs: dict | None = None,
-        session_id: str | None = None,
-        trigger_id: int | None = None,
-    ):
-        """If this is a run-service command, run it with the thread pool.
-
-        For everything else, use parent's implementation.
-
-        Args:
-            name: The name of the thread.
-            target: The method to call for the thread.
-            args: The args to pass to the target method.
-            kwargs: Additional args.
-            session_id: The current session id.
-            trigger_id: The current trigger id.
-        """
-        args = args or ()
-        kwargs = kwargs or {}
-
-        def _thread_wrapper():
-            t = threading.current_thread()
-            t.name = name
-            target(*args, **kwargs)
-
-        if target is self.process_run_service_command:
-            self.log.info(f'feature=service, event=request-thread-creation, name={name}')
-            self.request_thread_pool.submit(_thread_wrapper)
-        else:
-            super().service_thread(name, target, args, kwargs, session_id, trigger_id)
+            return None
+        return environ
@@ -0,0 +1,279 @@
+"""TcEx Framework Module"""
+
+# standard library
+import asyncio
+import concurrent.futures
+import contextvars
+import functools
+import inspect
+import logging
+import threading
+from collections.abc import Awaitable, Callable, Coroutine
+from typing import Any
+
+# first-party
+from tcex.app.service.mqtt_message_broker import MqttMessageBroker
+from tcex.app.service_context import task_name, task_session_id, task_trigger_id
+from tcex.logger.trace_logger import TraceLogger
+
+# get tcex logger
+_logger: TraceLogger = logging.getLogger(__name__.split('.', maxsplit=1)[0])  # type: ignore
+
+
+def is_async_callable(obj: Any) -> bool:
+    """Return True if the object is a coroutine function or has an async __call__ method.
+
+    Args:
+        obj: The object to check (e.g., an App callback).
+    """
+    return inspect.iscoroutinefunction(obj) or inspect.iscoroutinefunction(
+        getattr(obj, '__call__', None)  # noqa: B004
+    )
+
+
+class AsyncRuntime:
+    """Optional asyncio runtime for service Apps.
+
+    The runtime runs an event loop in a single background thread. Service commands with an
+    async App callback are run as tasks on the loop instead of a worker thread, so I/O bound
+    Apps can serve many concurrent requests without a thread per request. Each task has the
+    name, session_id and trigger_id context a service thread has (see service_context), so
+    Token.key and trigger logging work unchanged.
+
+    Blocking calls (e.g., key-value store access) are run with **run_sync** on a bounded
+    thread pool.
+
+    Args:
+        name: The name of the event loop thread.
+        max_sync_workers: The maximum number of threads for blocking calls.
+    """
+
+    def __init__(self, name: str = 'tcex-async-runtime', max_sync_workers: int = 10):
+        """Initialize instance properties."""
+        self.log = _logger
+        self.loop = asyncio.new_event_loop()
+        self.name = name
+
+        # properties
+        self._started = threading.Event()
+        self._sync_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_sync_workers, thread_name_prefix=f'{name}-sync'
+        )
+        self._tasks: set[asyncio.Task] = set()
+        self._thread = threading.Thread(name=name, target=self._run, daemon=True)
+
+    def _run(self):
+        """Run the event loop until stopped."""
+        asyncio.set_event_loop(self.loop)
+        self.loop.call_soon(self._started.set)
+        self.loop.run_forever()
+
+    async def _run_task(
+        self, coro: Awaitable, name: str, session_id: str | None, trigger_id: int | None
+    ) -> Any:
+        """Run the coroutine with the service task context."""
+        # each task runs in its own copy of the context, so values don't leak between tasks
+        task_name.set(name)
+        task_session_id.set(session_id)
+        # trigger id is used in Token module for the unique key for a token
+        task_trigger_id.set(str(trigger_id))
+
+        task = asyncio.current_task()
+        if task is not None:
+            self._tasks.add(task)
+        try:
+            return await coro
+        except Exception:
+            self.log.exception(f'feature=async-runtime, event=task-error, name={name}')
+            raise
+        finally:
+            if task is not None:
+                self._tasks.discard(task)
+
+    @property
+    def active_tasks(self) -> int:
+        """Return the number of running service tasks."""
+        return len(self._tasks)
+
+    @property
+    def running(self) -> bool:
+        """Return True if the event loop is running."""
+        return self._thread.is_alive()
+
+    async def run_sync(self, func: Callable[..., Any], *args) -> Any:
+        """Run a blocking call on the sync thread pool and return the result.
+
+        Args:
+            func: The blocking callable.
+            *args: The args to pass to the callable.
+        """
+        # run with a copy of the task context so logging and tokens use the task context
+        context = contextvars.copy_context()
+        return await self.loop.run_in_executor(
+            self._sync_executor, functools.partial(context.run, func, *args)
+        )
+
+    def schedule_periodic(
+        self, interval: float, callback: Callable[[], bool | None], name: str = 'periodic'
+    ) -> concurrent.futures.Future:
+        """Call the callback every interval seconds on the loop until it returns False.
+
+        Args:
+            interval: The number of seconds between calls.
+            callback: The callback, it must not block the loop.
+            name: The task name.
+        """
+
+        async def _periodic():
+            while True:
+                await asyncio.sleep(interval)
+                if callback() is False:
+                    break
+
+        return self.submit(_periodic(), name=name)
+
+    def start(self):
+        """Start the event loop thread."""
+        if not self._thread.is_alive():
+            self._thread.start()
+            self._started.wait()
+            self.log.info(f'feature=async-runtime, event=started, name={self.name}')
+
+    def stop(self, timeout: float | None = None):
+        """Cancel running tasks and stop the event loop.
+
+        Args:
+            timeout: The maximum seconds to wait for the event loop thread.
+        """
+        if not self._thread.is_alive():
+            return
+
+        def _stop():
+            for task in list(self._tasks):
+                task.cancel()
+            self.loop.stop()
+
+        self.loop.call_soon_threadsafe(_stop)
+        if threading.current_thread() is not self._thread:
+            self._thread.join(timeout)
+        self._sync_executor.shutdown(wait=False)
+        self.log.info(f'feature=async-runtime, event=stopped, name={self.name}')
+
+    def submit(
+        self,
+        coro: Coroutine,
+        name: str,
+        *,
+        session_id: str | None = None,
+        trigger_id: int | None = None,
+    ) -> concurrent.futures.Future:
+        """Run the coroutine as a service task on the event loop (thread-safe).
+
+        Args:
+            coro: The coroutine to run.
+            name: The task name (used in place of the thread name).
+            session_id: The current session id.
+            trigger_id: The current trigger id.
+        """
+        self.start()
+        return asyncio.run_coroutine_threadsafe(
+            self._run_task(coro, name, session_id, trigger_id), self.loop
+        )
+
+
+class AsyncMessageBroker:
+    """Asyncio adapter for the MQTT message broker.
+
+    The paho-mqtt network loop runs in its own thread, messages are handed to async
+    callbacks on the runtime event loop.
+
+    Args:
+        message_broker: The MQTT message broker.
+        runtime: The async runtime.
+    """
+
+    def __init__(self, message_broker: MqttMessageBroker, runtime: AsyncRuntime):
+        """Initialize instance properties."""
+        self.message_broker = message_broker
+        self.runtime = runtime
+
+    def add_on_message_callback(
+        self, callback: Callable[..., Coroutine], topics: list[str] | None = None
+    ) -> Callable:
+        """Add an async callback for on_message events.
+
+        Args:
+            callback: A coroutine function that accepts the MQTT message.
+            topics: A optional list of topics to call callback.
+
+        Returns:
+            Callable: The sync callback registered with the message broker (for removal).
+        """
+
+        def _on_message(_client, _userdata, message):
+            self.runtime.submit(callback(message), name='async-on-message')
+
+        self.message_broker.add_on_message_callback(_on_message, topics=topics)
+        return _on_message
+
+    async def publish(self, message: str, topic: str):
+        """Publish a message on client topic.
+
+        The paho-mqtt publish call only queues the message, so it is safe to call from the
+        event loop.
+
+        Args:
+            message: The message to be sent on client topic.
+            topic: The broker topic.
+        """
+        self.message_broker.publish(message, topic)
+
+    async def wait_connected(self, timeout: float, interval: float = 0.5) -> bool:
+        """Wait for the broker connection without blocking the event loop.
+
+        Args:
+            timeout: The maximum seconds to wait.
+            interval: The seconds between connection checks.
+        """
+        deadline = self.runtime.loop.time() + timeout
+        while not self.message_broker._connected:  # noqa: SLF001
+            if self.message_broker.shutdown or self.runtime.loop.time() > deadline:
+                return False
+            await asyncio.sleep(interval)
+        return True
+
+
+class AsyncKeyValueClient:
+    """Asyncio adapter for a key-value store client.
+
+    The reads and writes run on the runtime sync thread pool, so the event loop is never
+    blocked by key-value store round trips.
+
+    Args:
+        client: The key-value store client (e.g., key_value_store.client).
+        runtime: The async runtime.
+    """
+
+    def __init__(self, client: Any, runtime: AsyncRuntime):
+        """Initialize instance properties."""
+        self.client = client
+        self.runtime = runtime
+
+    async def create(self, context: str, key: str, value: Any) -> Any:
+        """Create key/value pair in the key-value store.
+
+        Args:
+            context: A specific context for the create.
+            key: The key to create in the key-value store.
+            value: The value to store in the key-value store.
+        """
+        return await self.runtime.run_sync(self.client.create, context, key, value)
+
+    async def read(self, context: str, key: str) -> Any:
+        """Read data from the key-value store for the provided key.
+
+        Args:
+            context: A specific context for the read.
+            key: The key to read in the key-value store.
+        """
+        return await self.runtime.run_sync(self.client.read, context, key)
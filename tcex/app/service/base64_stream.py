@@ -0,0 +1,100 @@
+"""TcEx Framework Module"""
+
+# standard library
+import base64
+import io
+
+
+class Base64Stream(io.BufferedIOBase):
+    """Binary stream that decodes base64 data incrementally.
+
+    The base64 data is decoded in chunks as the stream is read, so a large payload is not
+    held in memory decoded (and as str) in addition to the encoded data. The **size**
+    property returns the decoded size without decoding.
+
+    .. code-block:: python
+        :linenos:
+        :lineno-start: 1
+
+        def webhook_event_callback(
+            self, body: Base64Stream, **kwargs
+        ):
+            self.log.info(f'body size: {body.size}')
+            for alert in ijson.items(body, 'alerts.item'):
+                ...
+
+    Args:
+        encoded: The base64 encoded data.
+        chunk_size: The number of encoded bytes decoded at once.
+    """
+
+    def __init__(self, encoded: bytes | str, chunk_size: int = 65536):
+        """Initialize instance properties."""
+        super().__init__()
+        if isinstance(encoded, str):
+            encoded = encoded.encode('ascii')
+        if b'\n' in encoded or b'\r' in encoded:
+            # line breaks would misalign the decoded chunks
+            encoded = encoded.replace(b'\r', b'').replace(b'\n', b'')
+
+        # chunks must be a multiple of 4 encoded bytes to decode independently
+        self.chunk_size = max(4, chunk_size - chunk_size % 4)
+
+        # properties
+        self._buffer = bytearray()
+        self._encoded = memoryview(encoded)
+        self._position = 0
+
+    def _decode_chunk(self) -> bool:
+        """Decode the next chunk into the buffer, returning False at the end of the data."""
+        if self._position >= len(self._encoded):
+            return False
+        end = self._position + self.chunk_size
+        self._buffer += base64.b64decode(self._encoded[self._position : end])
+        self._position = end
+        return True
+
+    def read(self, size: int | None = -1) -> bytes:
+        """Return up to size decoded bytes (all remaining bytes if size is negative or None).
+
+        Args:
+            size: The maximum number of bytes to return.
+        """
+        self._checkClosed()  # type: ignore
+        if size is None or size < 0:
+            data = bytes(self._buffer) + base64.b64decode(self._encoded[self._position :])
+            self._buffer.clear()
+            self._position = len(self._encoded)
+            return data
+
+        while len(self._buffer) < size and self._decode_chunk():
+            pass
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return data
+
+    def read1(self, size: int | None = -1) -> bytes:
+        """Return up to size decoded bytes, decoding at most one chunk.
+
+        Args:
+            size: The maximum number of bytes to return (the decoded chunk if negative or None).
+        """
+        self._checkClosed()  # type: ignore
+        if not self._buffer:
+            self._decode_chunk()
+        if size is None or size < 0:
+            size = len(self._buffer)
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return data
+
+    def readable(self) -> bool:
+        """Return True, the stream is readable."""
+        return True
+
+    @property
+    def size(self) -> int:
+        """Return the size of the decoded data."""
+        encoded_length = len(self._encoded)
+        padding = bytes(self._encoded[-2:]).count(b'=') if encoded_length else 0
+        return encoded_length // 4 * 3 - padding
@@ -6,14 +6,22 @@ import logging
 import threading
 import time
 import uuid
-from collections.abc import Callable
+from collections.abc import Callable, Coroutine
 from datetime import UTC, datetime
+from functools import partial
 
 # first-party
 from tcex.app.config import InstallJson
+from tcex.app.key_value_store import KeyValueRedis
 from tcex.app.key_value_store.key_value_store import KeyValueStore
 from tcex.app.playbook.playbook import Playbook
+from tcex.app.service.async_runtime import AsyncKeyValueClient, AsyncRuntime
+from tcex.app.service.dispatch_executor import DispatchExecutor
+from tcex.app.service.key_value_batch import KeyValueStoreBatch
 from tcex.app.service.mqtt_message_broker import MqttMessageBroker
+from tcex.app.service.scheduler import Scheduler
+from tcex.app.service.service_metrics import MetricsRegistry, MetricsSnapshot
+from tcex.app.service_context import current_name, task_session_id
 from tcex.app.token import Token
 from tcex.input.model.module_app_model import ModuleAppModel
 from tcex.logger.logger import Logger
@@ -42,16 +50,36 @@ class CommonService:
     ):
         """Initialize the Class properties."""
         # properties
+        self._async_key_value_client: AsyncKeyValueClient | None = None
+        self._async_runtime: AsyncRuntime | None = None
+        # the runtime is created on first use from the broker, heartbeat, or worker threads
+        self._async_runtime_lock = threading.Lock()
         self._ready = False
         self._start_time = datetime.now(UTC)
         self.model = model
         self.configs = {}
+        self.control_executor = DispatchExecutor(
+            name='control',
+            max_workers=self.model.tc_svc_control_workers,
+            queue_size=self.model.tc_svc_control_queue_size,
+        )
+        self.event_executor = DispatchExecutor(
+            name='event',
+            max_workers=self.model.tc_svc_event_workers,
+            queue_size=self.model.tc_svc_event_queue_size,
+            full_policy=self.model.tc_svc_event_full_policy,
+            queue_timeout=self.model.tc_svc_event_queue_timeout,
+        )
+        # heartbeat and shutdown commands have their own pool, so slow control commands
+        # (e.g., App create config callbacks) can't delay them
+        self.priority_executor = DispatchExecutor(name='priority', max_workers=2, queue_size=100)
         self.heartbeat_sleep_time = 1
         self.heartbeat_watchdog = 0
         self.ij = InstallJson()
         self.key_value_store = key_value_store
         self.log = _logger
         self.logger = logger
+        self.metrics_registry = MetricsRegistry()
         self.message_broker = MqttMessageBroker(
             broker_host=self.model.tc_svc_broker_host,
             broker_port=self.model.tc_svc_broker_port,
@@ -61,12 +89,44 @@ class CommonService:
         )
         self.ready = False
         self.redis_client = self.key_value_store.redis_client
+        self.scheduler = Scheduler(name='scheduler')
         self.token = token
         self.util = Util()
 
         # config callbacks
         self.shutdown_callback = None
 
+        # worker pool metrics (e.g., "Event Queued")
+        for executor in (self.control_executor, self.event_executor):
+            for label in ('active', 'queued', 'rejected', 'shed'):
+                self.metrics_registry.gauge(
+                    f'{executor.name.title()} {label.title()}',
+                    lambda executor=executor, label=label: executor.metrics[label],
+                )
+
+    def get_batch_playbook(
+        self, context: str | None = None, output_variables: list | None = None
+    ) -> Playbook:
+        """Return a new instance of playbook module that buffers key-value store writes.
+
+        With the Redis key-value store, the writes of the Playbook (e.g., output variables)
+        are sent in a single round trip when **flush_playbook** is called. Other key-value
+        stores write immediately.
+
+        Args:
+            context: The KV Store context/session_id. For PB Apps the context is provided on
+                startup, but for service Apps each request gets a different context.
+            output_variables: The requested output variables. For PB Apps outputs are provided
+                on startup, but for service Apps each request gets different outputs.
+        """
+        if isinstance(self.key_value_store.client, KeyValueRedis):
+            return Playbook(
+                KeyValueStoreBatch(self.key_value_store),  # type: ignore
+                context,
+                output_variables,
+            )
+        return self.get_playbook(context, output_variables)
+
     def get_playbook(
         self, context: str | None = None, output_variables: list | None = None
     ) -> Playbook:
@@ -88,6 +148,36 @@ class CommonService:
         """
         self.log.info(f'feature=service, event=acknowledge, message={message}')
 
+    @property
+    def async_command_map(self) -> dict[str, Callable[[dict], Coroutine]]:
+        """Return the commands run as tasks on the async runtime.
+
+        Service types add async command handlers when the App registered an async callback.
+        """
+        return {}
+
+    @property
+    def async_key_value_client(self) -> AsyncKeyValueClient:
+        """Return the async key-value store client."""
+        runtime = self.async_runtime
+        with self._async_runtime_lock:
+            if self._async_key_value_client is None:
+                self._async_key_value_client = AsyncKeyValueClient(
+                    self.key_value_store.client, runtime
+                )
+        return self._async_key_value_client
+
+    @property
+    def async_runtime(self) -> AsyncRuntime:
+        """Return the async runtime, started on first use."""
+        with self._async_runtime_lock:
+            if self._async_runtime is None:
+                runtime = AsyncRuntime(max_sync_workers=self.model.tc_svc_event_workers)
+                runtime.start()
+                self.metrics_registry.gauge('Async Tasks', lambda: runtime.active_tasks)
+                self._async_runtime = runtime
+            return self._async_runtime
+
     def add_metric(self, label: str, value: int | str):
         """Add a metric.
 
@@ -97,7 +187,7 @@ class CommonService:
             label: The metric label (e.g., hits) to add.
             value: The value for the metric.
         """
-        self._metrics[label] = value
+        self.metrics_registry.add(label, value)
 
     @property
     def command_map(self) -> dict[str, Callable[[dict], None]]:
@@ -119,9 +209,99 @@ class CommonService:
         """
         return str(uuid.uuid4())
 
+    def dispatch(
+        self,
+        name: str,
+        target: Callable[..., bool | None],
+        args: tuple | None = None,
+        kwargs: dict | None = None,
+        *,
+        session_id: str | None = None,
+        trigger_id: int | None = None,
+        event: bool = False,
+        priority: bool = False,
+        block: bool = True,
+        on_reject: Callable[[], None] | None = None,
+    ) -> bool:
+        """Run a short-lived task on the control, event, or priority worker pool.
+
+        Long running tasks (e.g., heartbeat monitor) should use service_thread instead.
+
+        Args:
+            name: The name of the thread while running the task.
+            target: The method to call for the task.
+            args: The args to pass to the target method.
+            kwargs: Additional args.
+            session_id: The current session id.
+            trigger_id: The current trigger id.
+            event: If True, run the task on the event worker pool.
+            priority: If True, run the task on the priority worker pool (e.g., heartbeat).
+            block: If False, never block on a full queue (the task is rejected instead).
+            on_reject: Called if the task is rejected or shed.
+
+        Returns:
+            bool: False if the task was rejected.
+        """
+        executor = self.control_executor
+        if event:
+            executor = self.event_executor
+        elif priority:
+            executor = self.priority_executor
+        self.log.debug(
+            f'feature=service, event=service-dispatch, executor={executor.name}, name={name}'
+        )
+        return executor.submit(
+            name,
+            target,
+            args,
+            kwargs,
+            session_id=session_id,
+            trigger_id=trigger_id,
+            block=block,
+            on_reject=on_reject,
+        )
+
+    def dispatch_rejected(self, command: str, message: dict):  # noqa: ARG002
+        """Handle a command that was rejected or shed by the worker pool.
+
+        Service types reply to the commands the platform waits on (e.g., RunService) so
+        the caller gets an error response instead of a timeout.
+
+        Args:
+            command: The lowercase command name.
+            message: The message payload from the server topic.
+        """
+        self.log.warning(f'feature=service, event=command-rejected, command={command}')
+
+    @property
+    def event_commands(self) -> set[str]:
+        """Return the commands dispatched on the event worker pool."""
+        return set()
+
+    def flush_playbook(self, playbook: Playbook | None):
+        """Write the buffered key-value store writes of a playbook from get_batch_playbook.
+
+        Args:
+            playbook: The playbook instance (other playbooks are ignored).
+        """
+        if playbook is not None and isinstance(playbook.key_value_store, KeyValueStoreBatch):
+            count = playbook.key_value_store.execute()
+            self.log.trace(
+                f'feature=service, event=playbook-flush, context={playbook.context}, count={count}'
+            )
+
     def heartbeat(self):
         """Start heartbeat process."""
-        self.service_thread(name='heartbeat', target=self.heartbeat_monitor)
+        if self.model.tc_svc_async_runtime:
+            self.log.info('feature=service, event=heartbeat-monitor-started, runtime=async')
+            self.async_runtime.schedule_periodic(
+                self.heartbeat_sleep_time, self.heartbeat_tick, name='heartbeat'
+            )
+        else:
+            self.log.info('feature=service, event=heartbeat-monitor-started')
+            self.scheduler.schedule_periodic(
+                self.heartbeat_sleep_time, self.heartbeat_tick, name='heartbeat'
+            )
 
     def heartbeat_broker_check(self):
         """Send self check message to ensure communications with message broker."""
@@ -137,24 +317,34 @@ class CommonService:
         # allow time for message to be received
         time.sleep(5)
 
-    def heartbeat_monitor(self):
-        """Publish heartbeat on timer."""
-        self.log.info('feature=service, event=heartbeat-monitor-started')
-        while True:
-            # check heartbeat is not missed
-            if self.heartbeat_watchdog > (
-                int(self.model.tc_svc_hb_timeout_seconds) / int(self.heartbeat_sleep_time)
-            ):
-                # send self check message
-                self.heartbeat_broker_check()
-
-                self.log.error(
-                    'feature=service, event=missed-heartbeat, action=shutting-service-down'
-                )
-                self.process_shutdown_command({'reason': 'Missed heartbeat commands.'})
-                break
-            time.sleep(self.heartbeat_sleep_time)
-            self.heartbeat_watchdog += 1
+    @property
+    def heartbeat_missed(self) -> bool:
+        """Return True if heartbeat commands were missed."""
+        return self.heartbeat_watchdog > (
+            int(self.model.tc_svc_hb_timeout_seconds) / int(self.heartbeat_sleep_time)
+        )
+
+    def heartbeat_missed_shutdown(self):
+        """Shut down the service after missed heartbeat commands."""
+        # send self check message
+        self.heartbeat_broker_check()
+
+        self.log.error('feature=service, event=missed-heartbeat, action=shutting-service-down')
+        self.process_shutdown_command({'reason': 'Missed heartbeat commands.'})
+
+    def heartbeat_tick(self) -> bool:
+        """Check the heartbeat on the scheduler timer, returning False on shutdown."""
+        if self.heartbeat_missed:
+            # the broker check and shutdown block, run them off the timer thread (or event loop)
+            # without blocking it on a full queue, if rejected the shutdown runs inline
+            dispatched = self.dispatch(
+                name='heartbeat', target=self.heartbeat_missed_shutdown, priority=True, block=False
+            )
+            if not dispatched:
+                self.heartbeat_missed_shutdown()
+            return False
+        self.heartbeat_watchdog += 1
+        return True
 
     def increment_metric(self, label: str, value: int = 1):
         """Increment a metric if already exists.
@@ -163,8 +353,7 @@ class CommonService:
             label: The metric label (e.g., hits) to increment.
             value: The increment value. Defaults to 1.
         """
-        if self._metrics.get(label) is not None:
-            self._metrics[label] += value
+        self.metrics_registry.increment(label, value)
 
     def listen(self):
         """List for message coming from broker."""
@@ -186,27 +375,22 @@ class CommonService:
         Returns:
             Bool: Returns True until shutdown received.
         """
-        while True:
-            deadline = time.time() + sleep
-            while time.time() < deadline:
-                if self.message_broker.shutdown:
-                    return False
-                time.sleep(1)
-            return True
+        return not self.message_broker.wait_shutdown(timeout=sleep)
 
     @property
     def metrics(self) -> dict:
-        """Return current metric."""
-        # TODO: move to trigger command and handle API Service
-        if self._metrics.get('Active Playbooks') is not None:
-            self.update_metric('Active Playbooks', len(self.configs))
-        return self._metrics
+        """Return a snapshot of the current metrics.
+
+        Values assigned to the snapshot (e.g., metrics['Alerts'] = 1) are written through to
+        the metrics registry, use metrics_registry.increment to update a counter atomically.
+        """
+        return MetricsSnapshot(self.metrics_registry)
 
     @metrics.setter
     def metrics(self, metrics: dict):
-        """Return current metric."""
+        """Replace the current metric values."""
         if isinstance(metrics, dict):
-            self._metrics = metrics
+            self.metrics_registry.replace(metrics)
         else:
             self.log.error('feature=service, event=invalid-metric')
 
@@ -220,40 +404,56 @@ class CommonService:
 
     def on_message_handler(self, client, userdata, message):  # noqa: ARG002
         """On message for mqtt."""
+        trigger_id = None
         try:
-            # messages on server topic must be json objects
+            # messages on server topic must be json objects (parsed once, directly from bytes)
             m = json.loads(message.payload)
             if m.get('triggerId') not in [None, '']:
-                m['triggerId'] = int(m['triggerId'])
+                # coerce trigger_id to int in case a string was provided (testing framework)
+                trigger_id = m['triggerId'] = int(m['triggerId'])
         except ValueError:
             self.log.warning(
-                f'feature=service, event=parsing-issue, message="""{message.payload}"""'
+                'feature=service, event=parsing-issue, message="""%s"""', message.payload
             )
             return
 
         # use the command to call the appropriate method defined in command_map
         command = m.get('command', 'invalid').lower()
-        trigger_id = m.get('triggerId')
-        if trigger_id is not None:
-            # coerce trigger_id to int in case a string was provided (testing framework)
-            trigger_id = int(trigger_id)
-        self.log.info(f'feature=service, event=command-received, command="{command}"')
+        self.log.info('feature=service, event=command-received, command="%s"', command)
 
         # create unique session id to be used as thread name
         # and stored as property of thread for logging emit
         session_id = self.create_session_id()
 
-        # get the target method from command_map for the current command
+        # run the command as a task on the async runtime when an async App callback is used
+        async_method = self.async_command_map.get(command)
+        if async_method is not None:
+            self.async_runtime.submit(
+                async_method(m), name=session_id, session_id=session_id, trigger_id=trigger_id
+            )
+            return
+
+        # get the target method from command_map for the current command, this is the
+        # broker network thread so the dispatch must never block (e.g., on a full queue)
         thread_method = self.command_map.get(command, self.process_invalid_command)
-        self.service_thread(
+        self.dispatch(
             # use session_id as thread name to provide easy debugging per thread
             name=session_id,
             target=thread_method,
             args=(m,),
             session_id=session_id,
             trigger_id=trigger_id,
+            event=command in self.event_commands,
+            priority=command in self.priority_commands,
+            block=False,
+            on_reject=partial(self.dispatch_rejected, command, m),
         )
 
+    @property
+    def priority_commands(self) -> set[str]:
+        """Return the commands dispatched on the priority worker pool."""
+        return {'heartbeat', 'shutdown'}
+
     def process_broker_check(self, message: dict):
         """Implement parent method to log a broker check message.
 
@@ -290,11 +490,12 @@ class CommonService:
         self.heartbeat_watchdog = 0
 
         # send heartbeat -acknowledge- command
-        response = {'command': 'Heartbeat', 'metric': self.metrics}
+        metrics = self.metrics
+        response = {'command': 'Heartbeat', 'metric': metrics}
         self.message_broker.publish(
             message=json.dumps(response), topic=self.model.tc_svc_client_topic
         )
-        self.log.info(f'feature=service, event=heartbeat-sent, metric={self.metrics}')
+        self.log.info(f'feature=service, event=heartbeat-sent, metric={metrics}')
 
     def process_logging_change_command(self, message: dict):
         """Process the LoggingChange command.
@@ -363,6 +564,18 @@ class CommonService:
         # update shutdown flag
         self.message_broker.shutdown = True
 
+        # stop the worker pools, queued tasks are still processed
+        self.control_executor.shutdown()
+        self.event_executor.shutdown()
+        self.priority_executor.shutdown()
+        self.scheduler.stop()
+        if self._async_runtime is not None:
+            self._async_runtime.stop(timeout=5)
+
+        # write the queued log events and close the handlers
+        self.logger.flush()
+        self.logger.shutdown()
+
     @property
     def ready(self) -> bool:
         """Return ready boolean."""
@@ -371,21 +584,14 @@ class CommonService:
     @ready.setter
     def ready(self, bool_val: bool):
         """Set ready boolean."""
-        if isinstance(bool_val, bool) and bool_val is True:
-            # wait until connected to send ready command
-            while not self.message_broker._connected:  # noqa: SLF001
-                if self.message_broker.shutdown:
-                    break
-                time.sleep(1)
-            else:
-                self.log.info('feature=service, event=service-ready')
-                ready_command: dict[str, list[str] | str] = {'command': 'Ready'}
-                if self.ij.model.is_api_service_app and self.ij.model.service:
-                    ready_command['discoveryTypes'] = self.ij.model.service.discovery_types
-                self.message_broker.publish(
-                    json.dumps(ready_command), self.model.tc_svc_client_topic
-                )
-                self._ready = True
+        # wait until connected (or shutdown) to send ready command
+        if isinstance(bool_val, bool) and bool_val is True and self.message_broker.wait_connected():
+            self.log.info('feature=service, event=service-ready')
+            ready_command: dict[str, list[str] | str] = {'command': 'Ready'}
+            if self.ij.model.is_api_service_app and self.ij.model.service:
+                ready_command['discoveryTypes'] = self.ij.model.service.discovery_types
+            self.message_broker.publish(json.dumps(ready_command), self.model.tc_svc_client_topic)
+            self._ready = True
 
     def service_thread(
         self,
@@ -420,6 +626,9 @@ class CommonService:
     @property
     def session_id(self) -> str:
         """Return the current session_id."""
+        session_id = task_session_id.get()
+        if session_id is not None:
+            return session_id
         if not hasattr(threading.current_thread(), 'session_id'):
             threading.current_thread().session_id = self.create_session_id()  # type: ignore
         return threading.current_thread().session_id  # type: ignore
@@ -427,7 +636,7 @@ class CommonService:
     @property
     def thread_name(self) -> str:
         """Return a uuid4 session id."""
-        return threading.current_thread().name
+        return current_name()
 
     def update_metric(self, label: str, value: int | str):
         """Update a metric if already exists.
@@ -436,5 +645,4 @@ class CommonService:
             label: The metric label (e.g., hits) to update.
             value: The updated value for the metric.
         """
-        if self._metrics.get(label) is not None:
-            self._metrics[label] = value
+        self.metrics_registry.update(label, value)
@@ -3,15 +3,17 @@
 # standard library
 import json
 import os
-import threading
 from collections.abc import Callable
+from functools import partial
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 # first-party
 from tcex.app.key_value_store.key_value_store import KeyValueStore
 from tcex.app.playbook import Playbook
 from tcex.app.service.common_service import CommonService
+from tcex.app.service.trigger_configs import TriggerConfigs
+from tcex.app.service_context import current_trigger_id
 from tcex.app.token import Token
 from tcex.input.field_type.sensitive import Sensitive
 from tcex.input.model.create_config_model import CreateConfigModel
@@ -19,6 +21,18 @@ from tcex.input.model.module_app_model import ModuleAppModel
 from tcex.logger.logger import Logger
 from tcex.registry import registry
 
+if TYPE_CHECKING:
+    # third-party
+    from redis.commands.core import Script
+
+# append the session id to the testing context tracker (a JSON list) and set the trigger id
+CONTEXT_TRACKER_SCRIPT = """
+local tracker = cjson.decode(redis.call('HGET', KEYS[1], '_context_tracker') or '[]')
+table.insert(tracker, ARGV[1])
+redis.call('HSET', KEYS[1], '_context_tracker', cjson.encode(tracker))
+redis.call('HSET', KEYS[2], '_trigger_id', ARGV[2])
+"""
+
 
 class CommonServiceTrigger(CommonService):
     """TcEx Framework Service Trigger Common module.
@@ -39,8 +53,10 @@ class CommonServiceTrigger(CommonService):
         super().__init__(key_value_store, logger, model, token)
 
         # properties
-        self._metrics = {'Active Playbooks': 0, 'Errors': 0, 'Hits': 0, 'Misses': 0}
-        self.configs: dict[int, CreateConfigModel] = {}
+        self._context_tracker_script: Script | None = None
+        self.configs = TriggerConfigs()
+        self.metrics_registry.replace({'Errors': 0, 'Hits': 0, 'Misses': 0})
+        self.metrics_registry.gauge('Active Playbooks', lambda: len(self.configs))
         self.config_thread = None
 
         # config callbacks
@@ -48,24 +64,35 @@ class CommonServiceTrigger(CommonService):
         self.delete_config_callback = None
         self.trigger_input_model = CreateConfigModel
 
+        # optionally route log events of trigger threads to the trigger logfile (see
+        # trigger_logfile), opt-in as Apps may already write the trigger logfile, the trigger
+        # logfiles are rotated with the same limits as the App logfile
+        if self.model.tc_svc_trigger_log_handler is True:
+            self.logger.add_trigger_handler(
+                path=self.model.tc_log_path,
+                max_bytes=self.model.tc_log_max_bytes,
+                backup_count=self.model.tc_log_backup_count,
+            )
+
     def _tcex_testing(self, session_id: str, trigger_id: int):
         """Write data required for testing framework to Redis.
 
+        The context tracker is updated in a script, in a single round trip and without losing
+        updates from concurrent events.
+
         Args:
             session_id: The context/session id value for the current operation.
             trigger_id: The trigger ID for the current playbook.
         """
         if self.model.tcex_testing_context is not None:
-            _context_tracker: list[str] = json.loads(
-                self.redis_client.hget(self.model.tcex_testing_context, '_context_tracker') or '[]'  # type: ignore
-            )
-            _context_tracker.append(session_id)
-            self.redis_client.hset(
-                self.model.tcex_testing_context,
-                '_context_tracker',
-                json.dumps(_context_tracker),
+            if self._context_tracker_script is None:
+                self._context_tracker_script = self.redis_client.register_script(
+                    CONTEXT_TRACKER_SCRIPT
+                )
+            self._context_tracker_script(
+                keys=[self.model.tcex_testing_context, session_id],
+                args=[session_id, trigger_id],
             )
-            self.redis_client.hset(session_id, '_trigger_id', trigger_id)  # type: ignore
 
             # log
             self.log.info(
@@ -143,6 +170,9 @@ class CommonServiceTrigger(CommonService):
             # always delete config from configs dict, even when status is False
             del self.configs[trigger_id]
 
+            # close the trigger logfile
+            self.logger.close_trigger_log(trigger_id)
+
             # send ack response
             self.message_broker.publish(
                 json.dumps(
@@ -164,23 +194,24 @@ class CommonServiceTrigger(CommonService):
     def fire_event(self, callback: Callable[..., bool], **kwargs):
         """Trigger a FireEvent command.
 
+        Only the triggers matching the optional trigger_ids and trigger_key filters are
+        fired, both are resolved with the configs index instead of checking every config.
+
         Args:
             callback: The trigger method in the App to call.
             trigger_ids: A list of trigger ids to trigger.
+            trigger_key: The index key of the triggers to trigger (see configs.index_by).
             **kwargs: Additional keyword arguments.
         """
         if not callable(callback):
             ex_msg = 'Callback method (callback) is not a callable.'
             raise RuntimeError(ex_msg)  # noqa: TRY004
 
-        # get developer passed trigger_ids
+        # get developer passed trigger_ids and trigger_key
         trigger_ids: list | None = kwargs.pop('trigger_ids', None)
+        trigger_key = kwargs.pop('trigger_key', None)
 
-        for trigger_id, config in list(self.configs.items()):
-            if trigger_ids is not None and trigger_id not in trigger_ids:
-                # skip config that don't match developer provided trigger ids
-                continue
-
+        for trigger_id, config in self.configs.match(trigger_ids, trigger_key):
             try:
                 # get a session_id specifically for this thread
                 session_id: str = self.create_session_id()
@@ -189,16 +220,15 @@ class CommonServiceTrigger(CommonService):
                 self._tcex_testing(session_id, trigger_id)
 
                 # get an instance of PB module with current
-                # session_id and outputs to pass to callback
-                outputs: list | str = config.tc_playbook_out_variables or []
-                if isinstance(outputs, str):
-                    outputs = outputs.split(',')
-                playbook = self.get_playbook(context=session_id, output_variables=outputs)
+                # session_id and outputs (parsed once per config) to pass to callback
+                playbook = self.get_batch_playbook(
+                    context=session_id, output_variables=self.configs.outputs(trigger_id)
+                )
 
                 self.log.info(f'feature=trigger-service, event=fire-event, trigger-id={session_id}')
 
                 # current thread has session_id as name
-                self.service_thread(
+                self.dispatch(
                     name=session_id,
                     target=self.fire_event_trigger,
                     args=(
@@ -211,6 +241,8 @@ class CommonServiceTrigger(CommonService):
                     kwargs=kwargs,
                     session_id=session_id,
                     trigger_id=trigger_id,
+                    event=True,
+                    on_reject=partial(self.fire_event_rejected, session_id, trigger_id),
                 )
             except Exception:
                 self.log.exception('feature=trigger-service, event=fire-event')
@@ -254,6 +286,21 @@ class CommonServiceTrigger(CommonService):
         # publish FireEvent command to client topic
         self.message_broker.publish(json.dumps(msg), self.model.tc_svc_client_topic)
 
+    def fire_event_rejected(self, session_id: str, trigger_id: int):
+        """Record a fired event that was rejected or shed by the event worker pool.
+
+        Args:
+            session_id: The generated session for this fired event.
+            trigger_id: The ID of the trigger.
+        """
+        self.increment_metric('Misses')
+        self.log.warning(
+            f'feature=trigger-service, event=fire-event-rejected, trigger-id={trigger_id}'
+        )
+
+        # capture fired status for testing framework (the session is already in the tracker)
+        self._tcex_testing_fired_events(session_id, fired=False)
+
     def fire_event_trigger(
         self,
         callback: Callable[..., bool],
@@ -277,7 +324,12 @@ class CommonServiceTrigger(CommonService):
         self.log.info('feature=trigger-service, event=fire-event-trigger')
 
         try:
-            if callback(playbook, trigger_id, config, **kwargs):
+            fired = callback(playbook, trigger_id, config, **kwargs)
+
+            # write the playbook outputs (single round trip) before the playbook is launched
+            self.flush_playbook(playbook)
+
+            if fired:
                 self.increment_metric('Hits')
                 self.fire_event_publish(trigger_id, session_id)
 
@@ -431,7 +483,4 @@ class CommonServiceTrigger(CommonService):
     @property
     def thread_trigger_id(self) -> str | None:
         """Return the current thread trigger id."""
-        trigger_id = None
-        if hasattr(threading.current_thread(), 'trigger_id'):
-            trigger_id = threading.current_thread().trigger_id  # type: ignore
-        return trigger_id
+        return current_trigger_id()
@@ -0,0 +1,276 @@
+"""TcEx Framework Module"""
+
+# standard library
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+# first-party
+from tcex.app.service.service_metrics import Histogram
+from tcex.logger.trace_logger import TraceLogger
+
+# get tcex logger
+_logger: TraceLogger = logging.getLogger(__name__.split('.', maxsplit=1)[0])  # type: ignore
+
+
+@dataclass
+class _WorkItem:
+    """A unit of work submitted to the dispatch executor."""
+
+    name: str
+    target: Callable[..., bool | None]
+    args: tuple = ()
+    kwargs: dict = field(default_factory=dict)
+    session_id: str | None = None
+    trigger_id: int | None = None
+    on_reject: Callable[[], None] | None = None
+    submitted: float = field(default_factory=time.monotonic)
+
+
+class DispatchExecutor:
+    """Bounded worker pool for service command and event dispatch.
+
+    Work items are held in a bounded queue and run by at most **max_workers** threads,
+    which are started on demand. Before running a work item the worker thread takes on
+    the name, session_id and trigger_id of the work item, the same context a thread
+    started by CommonService.service_thread has, so Token.key and trigger logging work
+    unchanged.
+
+    When the queue is full the **full_policy** is applied:
+
+    * queue - block the submitter until space is available or **queue_timeout** expires,
+      then reject the work item. Submitters that must not block (e.g., the message broker
+      callback thread) pass block=False and the work item is rejected instead.
+    * reject - reject the new work item.
+    * shed - drop the oldest queued work item in favor of the new work item.
+
+    The **on_reject** callback of a rejected or shed work item is called (outside of the
+    executor lock), so the submitter can reply to a request that will never be processed.
+
+    Args:
+        name: The executor name, used as worker thread name prefix and metric label.
+        max_workers: The maximum number of worker threads.
+        queue_size: The maximum number of queued work items.
+        full_policy: The policy for a full queue (queue, reject, or shed).
+        queue_timeout: The maximum seconds to block with the "queue" policy (None to wait
+            forever).
+    """
+
+    full_policies = ('queue', 'reject', 'shed')
+
+    def __init__(
+        self,
+        name: str,
+        max_workers: int = 10,
+        queue_size: int = 1000,
+        full_policy: str = 'queue',
+        queue_timeout: float | None = None,
+    ):
+        """Initialize instance properties."""
+        if full_policy not in self.full_policies:
+            ex_msg = (
+                f'Invalid full_policy "{full_policy}" provided, '
+                f'must be one of {", ".join(self.full_policies)}.'
+            )
+            raise ValueError(ex_msg)
+        if max_workers < 1 or queue_size < 1:
+            ex_msg = 'The max_workers and queue_size values must be greater than 0.'
+            raise ValueError(ex_msg)
+
+        self.full_policy = full_policy
+        self.log = _logger
+        self.max_workers = max_workers
+        self.name = name
+        self.queue_size = queue_size
+        self.queue_timeout = queue_timeout
+        self.queue_wait = Histogram()
+
+        # properties
+        self._active = 0
+        self._condition = threading.Condition()
+        self._queue: deque[_WorkItem] = deque()
+        self._shutdown = False
+        self._workers: list[threading.Thread] = []
+        self._counters = {'completed': 0, 'failed': 0, 'rejected': 0, 'shed': 0, 'submitted': 0}
+
+    def _call_on_reject(self, item: _WorkItem):
+        """Call the on_reject callback of a rejected or shed work item."""
+        if item.on_reject is None:
+            return
+        try:
+            item.on_reject()
+        except Exception:
+            self.log.exception(
+                f'feature=service, event=dispatch-on-reject-error, executor={self.name}, '
+                f'name={item.name}'
+            )
+
+    def _enqueue(self, item: _WorkItem, block: bool) -> _WorkItem | None:
+        """Queue the work item, returning the rejected or shed work item (if any)."""
+        dropped = None
+        with self._condition:
+            if self._shutdown:
+                self._reject(item, 'shutdown')
+                return item
+
+            if len(self._queue) >= self.queue_size:
+                if self.full_policy == 'reject' or (self.full_policy == 'queue' and not block):
+                    self._reject(item, 'queue-full')
+                    return item
+
+                if self.full_policy == 'shed':
+                    dropped = self._queue.popleft()
+                    self._counters['shed'] += 1
+                    self.log.warning(
+                        f'feature=service, event=dispatch-shed, executor={self.name}, '
+                        f'name={dropped.name}'
+                    )
+                else:
+                    deadline = (
+                        None
+                        if self.queue_timeout is None
+                        else time.monotonic() + self.queue_timeout
+                    )
+                    while len(self._queue) >= self.queue_size and not self._shutdown:
+                        remaining = None if deadline is None else deadline - time.monotonic()
+                        if remaining is not None and remaining <= 0:
+                            self._reject(item, 'queue-timeout')
+                            return item
+                        self._condition.wait(remaining)
+                    if self._shutdown:
+                        self._reject(item, 'shutdown')
+                        return item
+
+            self._queue.append(item)
+            self._counters['submitted'] += 1
+
+            # start a worker when all current workers are busy
+            if len(self._workers) < self.max_workers and self._active + len(self._queue) > len(
+                self._workers
+            ):
+                self._start_worker()
+            self._condition.notify()
+        return dropped
+
+    def _reject(self, item: _WorkItem, reason: str):
+        """Record a rejected work item (condition lock must be held)."""
+        self._counters['rejected'] += 1
+        self.log.warning(
+            f'feature=service, event=dispatch-rejected, executor={self.name}, '
+            f'name={item.name}, reason={reason}'
+        )
+
+    def _start_worker(self):
+        """Start a new worker thread (condition lock must be held)."""
+        t = threading.Thread(
+            name=f'{self.name}-worker-{len(self._workers)}', target=self._worker, daemon=True
+        )
+        self._workers.append(t)
+        t.start()
+
+    def _run(self, item: _WorkItem):
+        """Run the work item with the thread context of a service thread."""
+        t = threading.current_thread()
+        worker_name = t.name
+        t.name = item.name
+        t.session_id = item.session_id  # type: ignore
+        # trigger id is used in Token module for the unique key for a token
+        t.trigger_id = str(item.trigger_id)  # type: ignore
+        try:
+            item.target(*item.args, **item.kwargs)
+        except Exception:
+            with self._condition:
+                self._counters['failed'] += 1
+            self.log.exception(
+                f'feature=service, event=dispatch-target-error, executor={self.name}, '
+                f'name={item.name}'
+            )
+        finally:
+            del t.session_id  # type: ignore
+            del t.trigger_id  # type: ignore
+            t.name = worker_name
+
+    def _worker(self):
+        """Run queued work items until shutdown."""
+        while True:
+            with self._condition:
+                while not self._queue and not self._shutdown:
+                    self._condition.wait()
+                if not self._queue:
+                    # shutdown with an empty queue
+                    return
+                item = self._queue.popleft()
+                self._active += 1
+                # wake submitters blocked on a full queue
+                self._condition.notify_all()
+
+            self.queue_wait.observe((time.monotonic() - item.submitted) * 1000)
+
+            try:
+                self._run(item)
+            finally:
+                with self._condition:
+                    self._active -= 1
+                    self._counters['completed'] += 1
+                    self._condition.notify_all()
+
+    @property
+    def metrics(self) -> dict[str, int]:
+        """Return a snapshot of the executor metrics."""
+        with self._condition:
+            return {
+                **self._counters,
+                'active': self._active,
+                'queued': len(self._queue),
+                'workers': len(self._workers),
+            }
+
+    def shutdown(self, wait: bool = False, timeout: float | None = None):
+        """Stop accepting work and stop the worker threads once the queue is drained.
+
+        Args:
+            wait: If True, wait for the worker threads to finish.
+            timeout: The maximum seconds to wait for each worker thread.
+        """
+        with self._condition:
+            self._shutdown = True
+            self._condition.notify_all()
+
+        if wait:
+            current_thread = threading.current_thread()
+            for t in list(self._workers):
+                if t is not current_thread:
+                    t.join(timeout)
+
+    def submit(
+        self,
+        name: str,
+        target: Callable[..., bool | None],
+        args: tuple | None = None,
+        kwargs: dict | None = None,
+        *,
+        session_id: str | None = None,
+        trigger_id: int | None = None,
+        block: bool = True,
+        on_reject: Callable[[], None] | None = None,
+    ) -> bool:
+        """Submit a work item, returning False if it was rejected.
+
+        Args:
+            name: The thread name while running the work item.
+            target: The method to call.
+            args: The args to pass to the target method.
+            kwargs: Additional args.
+            session_id: The current session id.
+            trigger_id: The current trigger id.
+            block: If False, never block on a full queue (reject with the "queue" policy).
+            on_reject: Called if the work item is rejected or shed.
+        """
+        item = _WorkItem(name, target, args or (), kwargs or {}, session_id, trigger_id, on_reject)
+        dropped = self._enqueue(item, block)
+        if dropped is not None:
+            self._call_on_reject(dropped)
+        return dropped is not item
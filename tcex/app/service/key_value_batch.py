@@ -0,0 +1,166 @@
+"""TcEx Framework Module"""
+
+# standard library
+from typing import Any
+
+# third-party
+from redis import Redis
+
+# first-party
+from tcex.app.key_value_store import KeyValueRedis
+from tcex.app.key_value_store.key_value_store import KeyValueStore
+
+
+class KeyValueBatch(KeyValueRedis):
+    """Redis key-value store client that buffers writes and sends them in one pipeline.
+
+    Service handlers write several values per request (e.g., the playbook output variables
+    of a fired event), each one a round trip to Redis. With this client the writes are kept
+    until **execute** is called and then sent as one HSET per context in a single pipeline.
+    Reads of buffered keys return the buffered value, any other operation (e.g., delete)
+    writes the buffer first so the order of operations is kept.
+
+    Args:
+        redis_client: An instance of redis client.
+    """
+
+    def __init__(self, redis_client: Redis):
+        """Initialize instance properties."""
+        super().__init__(redis_client)
+
+        # properties
+        self._pending: dict[str, dict[str, bytes | str]] = {}
+
+    def create(self, context: str, key: str, value: bytes | str) -> int:
+        """Buffer the key/value pair, returning 1 as for a new field.
+
+        Args:
+            context: A specific context for the create.
+            key: The field name (key) for the kv pair in Redis.
+            value: The value for the kv pair in Redis.
+        """
+        self._pending.setdefault(context, {})[key] = value
+        return 1
+
+    def delete(self, context: str, key: str) -> int:
+        """Write the buffered values and delete the key.
+
+        Args:
+            context: A specific context for the delete.
+            key: The field name (key) for the kv pair in Redis.
+        """
+        self.execute()
+        return super().delete(context, key)
+
+    def execute(self) -> int:
+        """Write the buffered values in a single round trip, returning the number written.
+
+        The buffer is only cleared once the pipeline succeeds, on a Redis error the values
+        are kept and written by the next call (HSET is idempotent).
+        """
+        if not self._pending:
+            return 0
+
+        pipeline = self.redis_client.pipeline(transaction=False)
+        for context, mapping in self._pending.items():
+            pipeline.hset(context, mapping=mapping)  # type: ignore
+        pipeline.execute()
+
+        written = self.pending
+        self._pending = {}
+        return written
+
+    def hget(self, context: str, key: str) -> bytes | str | None:
+        """Return the buffered value for the key or read it from Redis.
+
+        Args:
+            context: A specific context for the read.
+            key: The field name (key) for the kv pair in Redis.
+        """
+        value = self._pending.get(context, {}).get(key)
+        if value is not None:
+            return value
+        return super().hget(context, key)
+
+    def hgetall(self, context: str) -> dict[str, bytes | str | None]:
+        """Write the buffered values and read all data for the context.
+
+        Args:
+            context: A specific context for the read.
+        """
+        self.execute()
+        return super().hgetall(context)
+
+    @property
+    def pending(self) -> int:
+        """Return the number of buffered values."""
+        return sum(len(mapping) for mapping in self._pending.values())
+
+
+class _RedisClientBatch:
+    """Redis client view that buffers HSET in the batching client.
+
+    The Playbook writes some values with the Redis client directly (e.g., the null
+    validation values when TC_PLAYBOOK_WRITE_NULL is set). HSET is buffered with the other
+    writes, any other command writes the buffer first so the order of operations is kept.
+
+    Args:
+        client: The batching key-value client.
+    """
+
+    def __init__(self, client: KeyValueBatch):
+        """Initialize instance properties."""
+        self.client = client
+
+    def __getattr__(self, name: str) -> Any:
+        """Write the buffered values and return the attribute of the Redis client."""
+        self.client.execute()
+        return getattr(self.client.redis_client, name)
+
+    def hset(
+        self,
+        name: str,
+        key: str | None = None,
+        value: bytes | str | None = None,
+        mapping: dict | None = None,
+    ) -> int:
+        """Buffer the field(s), returning the number of fields.
+
+        Args:
+            name: The name (context) of the hash.
+            key: The field name.
+            value: The field value.
+            mapping: The field names and values.
+        """
+        fields = dict(mapping or {})
+        if key is not None:
+            fields[key] = value
+        for field, field_value in fields.items():
+            self.client.create(name, field, field_value)
+        return len(fields)
+
+
+class KeyValueStoreBatch:
+    """Key-value store view that gives a Playbook a batching client.
+
+    All attributes other than **client** and **redis_client** are read from the key-value
+    store, the writes of the Playbook are sent when **execute** is called (see
+    CommonService.get_batch_playbook).
+
+    Args:
+        key_value_store: The service key-value store (must use the Redis backend).
+    """
+
+    def __init__(self, key_value_store: KeyValueStore):
+        """Initialize instance properties."""
+        self.client = KeyValueBatch(key_value_store.redis_client)
+        self.key_value_store = key_value_store
+        self.redis_client = _RedisClientBatch(self.client)
+
+    def __getattr__(self, name: str) -> Any:
+        """Return the attribute of the key-value store."""
+        return getattr(self.key_value_store, name)
+
+    def execute(self) -> int:
+        """Write the buffered values in a single round trip, returning the number written."""
+        return self.client.execute()
@@ -3,7 +3,7 @@
 # standard library
 import logging
 import ssl
-import time
+import threading
 from collections.abc import Callable
 
 # third-party
@@ -47,15 +47,20 @@ class MqttMessageBroker:
 
         # properties
         self._connected = False
+        # notified when the connected or shutdown state changes
+        self._state_changed = threading.Condition()
+        self._shutdown = False
         self._on_connect_callbacks: list[Callable] = []
         self._on_disconnect_callbacks: list[Callable] = []
         self._on_log_callbacks: list[Callable] = []
         self._on_message_callbacks: list[dict[str, Callable | list[str]]] = []
+        # on_message callbacks by topic, precomputed when callbacks are added or removed
+        self._on_message_dispatch: dict[str, list[Callable]] = {}
+        self._on_message_dispatch_any: list[Callable] = []
         self._on_publish_callbacks: list[Callable] = []
         self._on_subscribe_callbacks: list[Callable] = []
         self._on_unsubscribe_callbacks: list[Callable] = []
         self.log = _logger
-        self.shutdown = False  # used in service App for shutdown flag
 
     def add_on_connect_callback(self, callback: Callable, index: int | None = None):
         """Add a callback for on_connect events.
@@ -101,6 +106,29 @@ class MqttMessageBroker:
         index = index or len(self._on_message_callbacks)
         topics = topics or []
         self._on_message_callbacks.insert(index, {'callback': callback, 'topics': topics})
+        self._update_on_message_dispatch()
+
+    def _update_on_message_dispatch(self):
+        """Precompute the on_message callbacks for each topic."""
+        # callbacks without topic restrictions are called for every topic
+        dispatch_any: list[Callable] = []
+        dispatch: dict[str, list[Callable]] = {}
+        for cd in self._on_message_callbacks:
+            callback = cd['callback']
+            if not callable(callback):
+                continue
+            topics: list[str] = cd.get('topics') or []  # type: ignore
+            if not topics:
+                dispatch_any.append(callback)
+                for callbacks in dispatch.values():
+                    callbacks.append(callback)
+                continue
+            for topic in topics:
+                # a topic seen for the first time also gets the earlier unrestricted callbacks
+                dispatch.setdefault(topic, list(dispatch_any)).append(callback)
+
+        self._on_message_dispatch = dispatch
+        self._on_message_dispatch_any = dispatch_any
 
     def add_on_publish_callback(self, callback: Callable, index: int | None = None):
         """Add a callback for on_publish events.
@@ -172,17 +200,14 @@ class MqttMessageBroker:
             # handle connection issues by not using loop_forever. give the service X seconds to
             # connect to message broker, else timeout and log generic connection error.
             self.client.loop_start()
-            deadline = time.time() + self.broker_timeout
-            while True:
-                if not self._connected and deadline < time.time():
-                    self.client.loop_stop()
-                    ex_msg = (
-                        f'failed to connect to message broker host '
-                        f'{self.broker_host} on port '
-                        f'{self.broker_port}.'
-                    )
-                    raise ConnectionError(ex_msg)  # noqa: TRY301
-                time.sleep(1)
+            if not self.wait_connected(timeout=self.broker_timeout) and not self.shutdown:
+                self.client.loop_stop()
+                ex_msg = (
+                    f'failed to connect to message broker host '
+                    f'{self.broker_host} on port '
+                    f'{self.broker_port}.'
+                )
+                raise ConnectionError(ex_msg)  # noqa: TRY301
 
         except Exception:
             self.log.exception('feature=message-broker, event=connection-error')
@@ -190,7 +215,9 @@ class MqttMessageBroker:
     def on_connect(self, client, userdata, flags, rc, properties):
         """Handle MQTT on_connect events."""
         self.log.info(f'feature=message-broker, event=broker-connect, status={rc!s}')
-        self._connected = True
+        with self._state_changed:
+            self._connected = True
+            self._state_changed.notify_all()
         for callback in self._on_connect_callbacks:
             callback(client, userdata, flags, rc, properties)
 
@@ -211,16 +238,19 @@ class MqttMessageBroker:
 
     def on_message(self, client, userdata, message):
         """Handle MQTT on_message events."""
-        mp = message.payload.decode().replace('\n', '')
-        self.log.trace(
-            f'feature=message-broker, message-topic={message.topic}, message-payload={mp}'
-        )
-        for cd in self._on_message_callbacks:
-            # if there are no topic restrictions, or the current message
-            # topic is in the list of restrictions, call the callback
-            topics = cd.get('topics')
-            if (topics in ([], None) or message.topic in topics) and callable(cd['callback']):
-                cd['callback'](client, userdata, message)
+        # only decode the payload for logging when a handler handles TRACE events, the logger
+        # level is always TRACE in an App (see Logger._update_trace_enabled)
+        if self.log.trace_enabled and self.log.isEnabledFor(logging.TRACE):  # type: ignore
+            self.log.trace(
+                'feature=message-broker, message-topic=%s, message-payload=%s',
+                message.topic,
+                message.payload.decode(errors='replace').replace('\n', ''),
+            )
+
+        # callbacks without topic restrictions, or with the current message topic in the
+        # list of restrictions, in the order they were added
+        for callback in self._on_message_dispatch.get(message.topic, self._on_message_dispatch_any):
+            callback(client, userdata, message)
 
     def on_publish(self, client, userdata, mid, rc, properties):
         """Handle MQTT on_publish events."""
@@ -271,3 +301,35 @@ class MqttMessageBroker:
         self._on_message_callbacks = [
             cb for cb in self._on_message_callbacks if cb['callback'] != callback
         ]
+        self._update_on_message_dispatch()
+
+    @property
+    def shutdown(self) -> bool:
+        """Return True if the service is shutting down (used in service App for shutdown flag)."""
+        return self._shutdown
+
+    @shutdown.setter
+    def shutdown(self, shutdown: bool):
+        """Set the shutdown flag, waking any thread waiting on the broker state."""
+        with self._state_changed:
+            self._shutdown = shutdown
+            self._state_changed.notify_all()
+
+    def wait_connected(self, timeout: float | None = None) -> bool:
+        """Block until connected to the broker or shutdown, returning True if connected.
+
+        Args:
+            timeout: The maximum seconds to wait (None to wait indefinitely).
+        """
+        with self._state_changed:
+            self._state_changed.wait_for(lambda: self._connected or self._shutdown, timeout)
+            return self._connected
+
+    def wait_shutdown(self, timeout: float | None = None) -> bool:
+        """Block until shutdown, returning True if shutdown.
+
+        Args:
+            timeout: The maximum seconds to wait (None to wait indefinitely).
+        """
+        with self._state_changed:
+            return self._state_changed.wait_for(lambda: self._shutdown, timeout)
@@ -0,0 +1,168 @@
+"""TcEx Framework Module"""
+
+# standard library
+import heapq
+import itertools
+import logging
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+# first-party
+from tcex.logger.trace_logger import TraceLogger
+
+# get tcex logger
+_logger: TraceLogger = logging.getLogger(__name__.split('.', maxsplit=1)[0])  # type: ignore
+
+
+@dataclass
+class _Task:
+    """A periodic task."""
+
+    name: str
+    interval: float
+    callback: Callable[[], bool | None]
+    cancelled: bool = False
+
+
+class Scheduler:
+    """Run periodic service tasks on a single timer thread.
+
+    Tasks are kept in a heap ordered by their next run time and the thread sleeps until the
+    earliest one is due (or a task is added or cancelled), so idle services do not wake up
+    once per second per monitor thread. Callbacks run on the scheduler thread and must be
+    short, blocking work should be dispatched to a worker pool.
+
+    .. code-block:: python
+        :linenos:
+        :lineno-start: 1
+
+        def _report() -> bool:
+            self.log.info(f'metrics={self.service.metrics}')
+            return True  # return False to stop the task
+
+
+        self.service.scheduler.schedule_periodic(
+            60, _report, name='report-metrics'
+        )
+
+    Args:
+        name: The name of the scheduler thread.
+    """
+
+    def __init__(self, name: str = 'tcex-scheduler'):
+        """Initialize instance properties."""
+        self.name = name
+
+        # properties
+        self._condition = threading.Condition()
+        self._counter = itertools.count()
+        self._heap: list[tuple[float, int, _Task]] = []
+        self._running = False
+        self._tasks: dict[str, _Task] = {}
+        self._thread: threading.Thread | None = None
+        self.log = _logger
+
+    def _run(self):
+        """Run due tasks until the scheduler is stopped."""
+        while True:
+            with self._condition:
+                while self._running:
+                    if self._heap:
+                        timeout = self._heap[0][0] - time.monotonic()
+                        if timeout <= 0:
+                            break
+                        self._condition.wait(timeout)
+                    else:
+                        self._condition.wait()
+                if not self._running:
+                    return
+                due, _, task = heapq.heappop(self._heap)
+                if task.cancelled:
+                    continue
+
+            try:
+                repeat = task.callback() is not False
+            except Exception:
+                self.log.exception(f'feature=scheduler, event=task-error, name={task.name}')
+                repeat = True
+
+            with self._condition:
+                if repeat and not task.cancelled and self._running:
+                    # schedule from the previous due time to avoid drift, skipping missed runs
+                    next_due = max(due + task.interval, time.monotonic())
+                    heapq.heappush(self._heap, (next_due, next(self._counter), task))
+                elif self._tasks.get(task.name) is task:
+                    del self._tasks[task.name]
+
+    def cancel(self, name: str):
+        """Cancel the task with the provided name.
+
+        Args:
+            name: The name of the task.
+        """
+        with self._condition:
+            task = self._tasks.pop(name, None)
+            if task is not None:
+                task.cancelled = True
+
+    @property
+    def running(self) -> bool:
+        """Return True if the scheduler thread is running."""
+        return self._running
+
+    def schedule_periodic(
+        self,
+        interval: float,
+        callback: Callable[[], bool | None],
+        name: str,
+        *,
+        delay: float | None = None,
+    ):
+        """Call the callback every interval seconds until it returns False.
+
+        A task already scheduled with the same name is replaced.
+
+        Args:
+            interval: The number of seconds between calls.
+            callback: The function to call.
+            name: The name of the task.
+            delay: The number of seconds before the first call (defaults to interval).
+        """
+        task = _Task(name=name, interval=interval, callback=callback)
+        due = time.monotonic() + (interval if delay is None else delay)
+        with self._condition:
+            previous = self._tasks.get(name)
+            if previous is not None:
+                previous.cancelled = True
+            self._tasks[name] = task
+            heapq.heappush(self._heap, (due, next(self._counter), task))
+            self._condition.notify()
+        self.start()
+
+    def start(self):
+        """Start the scheduler thread."""
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+            self._thread = threading.Thread(name=self.name, target=self._run, daemon=True)
+            self._thread.start()
+        self.log.debug(f'feature=scheduler, event=scheduler-started, name={self.name}')
+
+    def stop(self, timeout: float | None = None):
+        """Stop the scheduler thread, pending tasks are discarded.
+
+        Args:
+            timeout: The number of seconds to wait for a running task to complete.
+        """
+        with self._condition:
+            self._running = False
+            for task in self._tasks.values():
+                task.cancelled = True
+            self._heap.clear()
+            self._tasks.clear()
+            self._condition.notify()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
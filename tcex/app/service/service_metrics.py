@@ -0,0 +1,227 @@
+"""TcEx Framework Module"""
+
+# standard library
+import bisect
+import logging
+import threading
+from collections.abc import Callable
+
+# first-party
+from tcex.logger.trace_logger import TraceLogger
+
+# get tcex logger
+_logger: TraceLogger = logging.getLogger(__name__.split('.', maxsplit=1)[0])  # type: ignore
+
+
+class Histogram:
+    """Thread-safe latency histogram with fixed bucket bounds.
+
+    Observations are counted in the first bucket with an upper bound greater than or equal
+    to the value, percentiles are reported as the upper bound of the bucket that contains
+    the percentile (the maximum observed value for the last bucket).
+
+    Args:
+        bounds: The ascending bucket upper bounds, in milliseconds.
+    """
+
+    default_bounds = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000)
+
+    def __init__(self, bounds: tuple[float, ...] | None = None):
+        """Initialize instance properties."""
+        self.bounds = tuple(bounds or self.default_bounds)
+
+        # properties
+        self._buckets = [0] * (len(self.bounds) + 1)
+        self._count = 0
+        self._lock = threading.Lock()
+        self._max = 0.0
+        self._sum = 0.0
+
+    def _percentile(self, q: float) -> float:
+        """Return the percentile from the buckets (lock must be held)."""
+        rank = q * self._count
+        cumulative = 0
+        for index, count in enumerate(self._buckets):
+            cumulative += count
+            if cumulative >= rank:
+                if index < len(self.bounds):
+                    return min(self.bounds[index], self._max)
+                break
+        return self._max
+
+    def as_metrics(self, label: str) -> dict[str, float | int]:
+        """Return the snapshot as heartbeat metrics (e.g., "Callback Time P95").
+
+        Args:
+            label: The metric label prefix.
+        """
+        return {f'{label} {key.title()}': value for key, value in self.snapshot().items()}
+
+    def observe(self, value: float):
+        """Record an observation.
+
+        Args:
+            value: The observed value, in milliseconds.
+        """
+        index = bisect.bisect_left(self.bounds, value)
+        with self._lock:
+            self._buckets[index] += 1
+            self._count += 1
+            self._sum += value
+            self._max = max(self._max, value)
+
+    def snapshot(self) -> dict[str, float | int]:
+        """Return the count, average, p50, p95, p99 and max values."""
+        with self._lock:
+            if self._count == 0:
+                return {'count': 0, 'avg': 0, 'p50': 0, 'p95': 0, 'p99': 0, 'max': 0}
+            return {
+                'count': self._count,
+                'avg': round(self._sum / self._count, 3),
+                'p50': self._percentile(0.50),
+                'p95': self._percentile(0.95),
+                'p99': self._percentile(0.99),
+                'max': round(self._max, 3),
+            }
+
+
+class MetricsSnapshot(dict):
+    """Snapshot of the service metrics that writes assigned values through to the registry.
+
+    Reads return the value at the time of the snapshot, assigning a value (e.g.,
+    ``self.service.metrics['Alerts'] = 1``) adds or sets the metric in the registry.
+
+    Args:
+        registry: The metrics registry.
+    """
+
+    def __init__(self, registry: 'MetricsRegistry'):
+        """Initialize instance properties."""
+        super().__init__(registry.snapshot())
+        self.registry = registry
+
+    def __setitem__(self, label: str, value: float | str):
+        """Set the metric in the snapshot and the registry."""
+        super().__setitem__(label, value)
+        self.registry.add(label, value)
+
+    def update(self, *args, **kwargs):
+        """Set the metrics in the snapshot and the registry."""
+        for label, value in dict(*args, **kwargs).items():
+            self[label] = value
+
+
+class MetricsRegistry:
+    """Thread-safe registry of the service metrics reported in the heartbeat message.
+
+    * values - counters and static values, updated under a lock (e.g., "Hits").
+    * gauges - functions called when a snapshot is taken (e.g., "Active Playbooks").
+    * histograms - reported with the Histogram.as_metrics labels (e.g., "Callback Time P95").
+
+    .. code-block:: python
+        :linenos:
+        :lineno-start: 1
+
+        # in the App, add metrics to the heartbeat message
+        registry = self.service.metrics_registry
+        registry.add('Alerts', 0)
+        registry.gauge('Cache Size', lambda: len(self.cache))
+        lookup_time = registry.histogram('Lookup Time')
+
+        # in the event callback
+        registry.increment('Alerts')
+        lookup_time.observe(elapsed_ms)
+    """
+
+    def __init__(self, values: dict[str, float | str] | None = None):
+        """Initialize instance properties."""
+        # properties
+        self._gauges: dict[str, Callable[[], float | str]] = {}
+        self._histograms: dict[str, Histogram] = {}
+        self._lock = threading.Lock()
+        self._values: dict[str, float | str] = dict(values or {})
+
+    def add(self, label: str, value: float | str):
+        """Add a metric or set the value of an existing metric.
+
+        Args:
+            label: The metric label (e.g., hits) to add.
+            value: The value for the metric.
+        """
+        with self._lock:
+            self._values[label] = value
+
+    def gauge(self, label: str, func: Callable[[], float | str]):
+        """Add a metric whose value is returned by func when a snapshot is taken.
+
+        Args:
+            label: The metric label (e.g., Active Playbooks) to add.
+            func: The function that returns the current value.
+        """
+        with self._lock:
+            self._gauges[label] = func
+
+    def histogram(self, label: str, histogram: Histogram | None = None) -> Histogram:
+        """Return the histogram for the label, adding histogram (or a new one) if not found.
+
+        Args:
+            label: The metric label prefix (e.g., Callback Time).
+            histogram: The histogram to add.
+        """
+        with self._lock:
+            return self._histograms.setdefault(label, histogram or Histogram())
+
+    def increment(self, label: str, value: float = 1) -> bool:
+        """Increment a metric if already exists, returning False if not found.
+
+        Args:
+            label: The metric label (e.g., hits) to increment.
+            value: The increment value. Defaults to 1.
+        """
+        with self._lock:
+            current = self._values.get(label)
+            if current is None:
+                return False
+            self._values[label] = current + value  # type: ignore
+            return True
+
+    def replace(self, values: dict[str, float | str]):
+        """Replace the metric values (gauges and histograms are kept).
+
+        Args:
+            values: The metric labels and values.
+        """
+        with self._lock:
+            self._values = dict(values)
+
+    def snapshot(self) -> dict[str, float | str | None]:
+        """Return a consistent copy of the current metrics."""
+        with self._lock:
+            metrics = dict(self._values)
+            gauges = list(self._gauges.items())
+            histograms = list(self._histograms.items())
+
+        # gauges and histograms are read outside the registry lock, a failing gauge is
+        # reported as None so the heartbeat is still sent
+        for label, func in gauges:
+            try:
+                metrics[label] = func()
+            except Exception:
+                _logger.exception(f'feature=service-metrics, event=gauge-error, label={label}')
+                metrics[label] = None  # type: ignore
+        for label, histogram in histograms:
+            metrics.update(histogram.as_metrics(label))
+        return metrics
+
+    def update(self, label: str, value: float | str) -> bool:
+        """Update a metric if already exists, returning False if not found.
+
+        Args:
+            label: The metric label (e.g., hits) to update.
+            value: The updated value for the metric.
+        """
+        with self._lock:
+            if self._values.get(label) is None:
+                return False
+            self._values[label] = value
+            return True
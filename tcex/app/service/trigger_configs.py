@@ -0,0 +1,132 @@
+"""TcEx Framework Module"""
+
+# standard library
+from collections import UserDict
+from collections.abc import Callable, Hashable, Iterable
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    # first-party
+    from tcex.input.model.create_config_model import CreateConfigModel
+
+
+class TriggerConfigs(UserDict):
+    """Trigger configs by trigger id, indexed for CommonServiceTrigger.fire_event.
+
+    Besides the configs, the playbook output variables of each config are kept parsed and,
+    when an index key function is set with **index_by**, the trigger ids are indexed by the
+    key of their config. This lets fire_event fan out only to the matching triggers instead
+    of checking every config for every event.
+
+    .. code-block:: python
+        :linenos:
+        :lineno-start: 1
+
+        # in the App, index the trigger configs by the (precompiled) event type input
+        self.service.configs.index_by(
+            lambda config: config.event_type
+        )
+
+        # fire the event only for triggers configured for "alert" events
+        self.service.fire_event(
+            self.trigger_callback, trigger_key='alert'
+        )
+    """
+
+    def __init__(self):
+        """Initialize instance properties."""
+        # properties
+        self._index: dict[Hashable, set[int]] = {}
+        self._index_keys: dict[int, Hashable] = {}
+        self._key_func: Callable[[CreateConfigModel], Hashable] | None = None
+        self._outputs: dict[int, list[str]] = {}
+        super().__init__()
+
+    def __delitem__(self, trigger_id: int):
+        """Remove a config and its index entries."""
+        super().__delitem__(trigger_id)
+        self._outputs.pop(trigger_id, None)
+        self._unindex(trigger_id)
+
+    def __setitem__(self, trigger_id: int, config: 'CreateConfigModel'):
+        """Add or replace a config and update its index entries."""
+        if trigger_id in self.data:
+            self._unindex(trigger_id)
+        super().__setitem__(trigger_id, config)
+        self._outputs[trigger_id] = self._parse_outputs(config)
+        self._index_config(trigger_id, config)
+
+    def _index_config(self, trigger_id: int, config: 'CreateConfigModel'):
+        """Add the index entry for the config."""
+        if self._key_func is None:
+            return
+        key = self._key_func(config)
+        self._index_keys[trigger_id] = key
+        self._index.setdefault(key, set()).add(trigger_id)
+
+    @staticmethod
+    def _parse_outputs(config: Any) -> list[str]:
+        """Return the playbook output variables of the config."""
+        outputs: list | str = getattr(config, 'tc_playbook_out_variables', None) or []
+        if isinstance(outputs, str):
+            outputs = outputs.split(',')
+        return outputs
+
+    def _unindex(self, trigger_id: int):
+        """Remove the index entry for the trigger id."""
+        if trigger_id not in self._index_keys:
+            return
+        key = self._index_keys.pop(trigger_id)
+        trigger_ids = self._index.get(key)
+        if trigger_ids is not None:
+            trigger_ids.discard(trigger_id)
+            if not trigger_ids:
+                del self._index[key]
+
+    def index_by(self, key_func: Callable[['CreateConfigModel'], Hashable] | None):
+        """Index the trigger ids by the key of their config (None to remove the index).
+
+        Args:
+            key_func: A function that returns the (hashable) index key for a config.
+        """
+        self._index.clear()
+        self._index_keys.clear()
+        self._key_func = key_func
+        for trigger_id, config in self.data.items():
+            self._index_config(trigger_id, config)
+
+    def match(
+        self, trigger_ids: Iterable[int] | None = None, trigger_key: Hashable | None = None
+    ) -> list[tuple[int, 'CreateConfigModel']]:
+        """Return the trigger id and config of the triggers that match the filters.
+
+        Args:
+            trigger_ids: Only match these trigger ids.
+            trigger_key: Only match triggers with this index key (see index_by).
+        """
+        if trigger_key is not None:
+            if self._key_func is None:
+                ex_msg = 'The trigger_key filter requires an index (see configs.index_by).'
+                raise RuntimeError(ex_msg)
+            candidates: Iterable[int] = self._index.get(trigger_key, ())
+            if trigger_ids is not None:
+                candidates = set(candidates).intersection(trigger_ids)
+        elif trigger_ids is not None:
+            candidates = trigger_ids
+        else:
+            return list(self.data.items())
+
+        # sorted by trigger id, the order is stable between calls
+        return [
+            (trigger_id, self.data[trigger_id])
+            for trigger_id in sorted(set(candidates))
+            if trigger_id in self.data
+        ]
+
+    def outputs(self, trigger_id: int) -> list[str]:
+        """Return the playbook output variables for the trigger.
+
+        Args:
+            trigger_id: The trigger id.
+        """
+        return self._outputs.get(trigger_id, [])
@@ -7,6 +7,8 @@ from typing import TYPE_CHECKING, Any
 
 # first-party
 from tcex.app.key_value_store.key_value_store import KeyValueStore
+from tcex.app.service.async_runtime import is_async_callable
+from tcex.app.service.base64_stream import Base64Stream
 from tcex.app.service.common_service_trigger import CommonServiceTrigger
 from tcex.app.token import Token
 from tcex.input.model.create_config_model import CreateConfigModel
@@ -35,6 +37,10 @@ class WebhookTriggerService(CommonServiceTrigger):
         self.webhook_event_callback: Callable  # set in run.py of the App
         self.webhook_marshall_event_callback = None
 
+        # if True, the webhook_event_callback body is a Base64Stream (binary, decoded as read)
+        # instead of a str, so large payloads are not held in memory decoded up front
+        self.webhook_event_body_stream = False
+
     def callback_response_handler(self, callback_response: Any, message: dict):
         """Handle the different types of callback responses.
 
@@ -149,6 +155,13 @@ class WebhookTriggerService(CommonServiceTrigger):
 
         self.publish_webhook_event_response(message, callback_response)
 
+    @property
+    def async_command_map(self) -> dict:
+        """Return the commands run as tasks on the async runtime."""
+        if is_async_callable(getattr(self, 'webhook_event_callback', None)):
+            return {'webhookevent': self.process_webhook_event_command_async}
+        return {}
+
     @property
     def command_map(self) -> dict:
         """Return the command map for the current Service type."""
@@ -157,6 +170,25 @@ class WebhookTriggerService(CommonServiceTrigger):
         command_map.update({'webhookmarshallevent': self.process_webhook_marshall_event_command})
         return command_map
 
+    def dispatch_rejected(self, command: str, message: dict):
+        """Reply with a 503 response to a rejected WebhookEvent command.
+
+        Args:
+            command: The lowercase command name.
+            message: The message payload from the server topic.
+        """
+        super().dispatch_rejected(command, message)
+        if command == 'webhookevent':
+            self.increment_metric('Errors')
+            self.publish_webhook_event_response(
+                message, {'body': None, 'headers': [], 'status_code': 503}
+            )
+
+    @property
+    def event_commands(self) -> set[str]:
+        """Return the commands dispatched on the event worker pool."""
+        return {'webhookevent', 'webhookmarshallevent'}
+
     def process_webhook_event_command(self, message: dict):
         """Process the WebhookEvent command.
 
@@ -192,53 +224,64 @@ class WebhookTriggerService(CommonServiceTrigger):
         self.publish_webhook_event_acknowledge(message)
 
         # get config using triggerId passed in WebhookEvent data
-        config: CreateConfigModel | None = None
-        outputs: list = []
-        if not self.ij.has_feature('webhookserviceendpoint'):
-            config = self.configs.get(message['triggerId'])
-            if config is None:
-                self.log.error(
-                    """feature=webhook-trigger-service, event=missing-config, """
-                    f"""trigger-id={message.get('triggerId')}"""
-                )
-                return
-            outputs = config.tc_playbook_out_variables
+        config = self.webhook_event_config(message)
+        if config is None and not self.ij.has_feature('webhookserviceendpoint'):
+            return
 
-        # get a context aware pb instance for the App callback method
-        playbook = self.get_playbook(context=self.session_id, output_variables=outputs)
         try:
             body: Any = self.key_value_store.client.read(message['requestKey'], 'request.body')
-            if body is not None:
-                body = base64.b64decode(body).decode()
-            callback_data = {
-                'body': body,
-                'headers': message.get('headers'),
-                'method': message.get('method'),
-                'params': message.get('queryParams'),
-            }
-            if self.ij.has_feature('webhookresponsemarshall') or self.ij.has_feature(
-                'webhookserviceendpoint'
-            ):
-                # add request_key arg when marshall or services endpoints feature is set (kwarg)
-                callback_data.update({'request_key': message.get('requestKey')})
-            elif not self.ij.has_feature('webhookserviceendpoint'):
-                # add optional inputs for "standard" and "marshall" webhook trigger
-                callback_data.update(
-                    {
-                        'config': config,
-                        'playbook': playbook,
-                        'trigger_id': message.get('triggerId'),
-                    }
-                )
-
+            callback_data = self.webhook_event_callback_data(message, body, config)
             callback_response: bool | Callable[..., Any] | dict = self.webhook_event_callback(
                 **callback_data
             )
+
+            # write the playbook outputs (single round trip) before the playbook is launched
+            self.flush_playbook(callback_data.get('playbook'))
             self.callback_response_handler(callback_response, message)
         except Exception:
             self.increment_metric('Errors')
             self.log.exception('feature=webhook-trigger-service, event=webhook-callback-exception')
 
+    async def process_webhook_event_command_async(self, message: dict):
+        """Process the WebhookEvent command with an async webhook_event_callback.
+
+        The command runs as a task on the async runtime, the key-value store read does not
+        block the event loop.
+
+        Args:
+            message: The message payload from the server topic.
+        """
+        self.log.trace(
+            f'feature=webhook-trigger-service, event=process-webhook-event, message={message}'
+        )
+
+        # acknowledge webhook event (nothing is currently done with this message on the core side)
+        self.publish_webhook_event_acknowledge(message)
+
+        # get config using triggerId passed in WebhookEvent data
+        config = self.webhook_event_config(message)
+        if config is None and not self.ij.has_feature('webhookserviceendpoint'):
+            return
+
+        try:
+            body: Any = await self.async_key_value_client.read(
+                message['requestKey'], 'request.body'
+            )
+            callback_data = self.webhook_event_callback_data(message, body, config)
+            callback_response: bool | Callable[..., Any] | dict = await self.webhook_event_callback(
+                **callback_data
+            )
+
+            # write the playbook outputs (single round trip) before the playbook is launched, the
+            # response handler writes to the key-value store so it runs off the event loop too
+            await self.async_runtime.run_sync(self.flush_playbook, callback_data.get('playbook'))
+            await self.async_runtime.run_sync(
+                self.callback_response_handler, callback_response, message
+            )
+        except Exception:
+            self.increment_metric('Errors')
+            self.log.exception('feature=webhook-trigger-service, event=webhook-callback-exception')
+
     def process_webhook_marshall_event_command(self, message: dict):
         """Process the WebhookMarshallEvent command.
 
@@ -399,3 +442,65 @@ class WebhookTriggerService(CommonServiceTrigger):
             ),
             self.model.tc_svc_client_topic,
         )
+
+    def webhook_event_callback_data(
+        self, message: dict, body: Any, config: CreateConfigModel | None
+    ) -> dict:
+        """Return the webhook_event_callback kwargs for a WebhookEvent command.
+
+        Args:
+            message: The message payload from the server topic.
+            body: The base64 encoded request body from the key-value store.
+            config: The trigger config (None for service endpoint Apps).
+        """
+        if body is not None:
+            if self.webhook_event_body_stream:
+                body = Base64Stream(body)
+            else:
+                body = base64.b64decode(body).decode()
+        callback_data = {
+            'body': body,
+            'headers': message.get('headers'),
+            'method': message.get('method'),
+            'params': message.get('queryParams'),
+        }
+        if self.ij.has_feature('webhookresponsemarshall') or self.ij.has_feature(
+            'webhookserviceendpoint'
+        ):
+            # add request_key arg when marshall or services endpoints feature is set (kwarg)
+            callback_data.update({'request_key': message.get('requestKey')})
+        elif not self.ij.has_feature('webhookserviceendpoint'):
+            # add optional inputs for "standard" and "marshall" webhook trigger
+            outputs = config.tc_playbook_out_variables if config is not None else []
+
+            # get a context aware pb instance for the App callback method
+            callback_data.update(
+                {
+                    'config': config,
+                    'playbook': self.get_batch_playbook(
+                        context=self.session_id, output_variables=outputs
+                    ),
+                    'trigger_id': message.get('triggerId'),
+                }
+            )
+        return callback_data
+
+    def webhook_event_config(self, message: dict) -> CreateConfigModel | None:
+        """Return the trigger config for a WebhookEvent command.
+
+        Service endpoint Apps have no trigger config, for other Apps a missing config is
+        logged.
+
+        Args:
+            message: The message payload from the server topic.
+        """
+        if self.ij.has_feature('webhookserviceendpoint'):
+            return None
+
+        config = self.configs.get(message['triggerId'])
+        if config is None:
+            self.log.error(
+                """feature=webhook-trigger-service, event=missing-config, """
+                f"""trigger-id={message.get('triggerId')}"""
+            )
+        return config
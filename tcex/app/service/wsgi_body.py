@@ -0,0 +1,75 @@
+"""TcEx Framework Module"""
+
+# standard library
+from collections.abc import Iterable, Iterator
+from typing import IO
+
+
+class FileWrapper:
+    """WSGI file wrapper (wsgi.file_wrapper) for file responses.
+
+    Frameworks (e.g., Falcon) return this wrapper for file-like response bodies. The
+    wrapper allows join_body to read the file in a single call instead of collecting
+    blocks, so large file responses are held in memory only once.
+
+    Args:
+        filelike: The file-like object with the response body.
+        block_size: The block size when iterated.
+    """
+
+    def __init__(self, filelike: IO, block_size: int = 8192):
+        """Initialize instance properties."""
+        self.block_size = block_size
+        self.filelike = filelike
+
+    def __iter__(self) -> Iterator[bytes]:
+        """Yield the file in blocks."""
+        while True:
+            block = self.filelike.read(self.block_size)
+            if not block:
+                break
+            yield block
+
+    def close(self):
+        """Close the file-like object."""
+        if hasattr(self.filelike, 'close'):
+            self.filelike.close()
+
+    def read(self) -> bytes:
+        """Return the remaining content of the file."""
+        return self.filelike.read()
+
+
+def join_body(body_data: Iterable[bytes | str] | None) -> bytes | str | None:
+    """Return the WSGI response iterable joined into a single value.
+
+    Chunks are joined once in linear time (a single chunk is returned without a copy) and
+    file responses are read directly from the file. The close method of the iterable is
+    called as required by the WSGI specification.
+
+    Args:
+        body_data: The iterable returned by the WSGI application.
+
+    Returns:
+        bytes | str | None: The response body, None for an empty body.
+    """
+    if not body_data:
+        return None
+
+    try:
+        if isinstance(body_data, FileWrapper):
+            return body_data.read() or None
+
+        chunks = body_data if isinstance(body_data, list) else list(body_data)
+    finally:
+        if hasattr(body_data, 'close'):
+            body_data.close()  # type: ignore
+
+    if not chunks:
+        return None
+    if len(chunks) == 1:
+        # common case (e.g., Falcon resp.data) with no copy required
+        return chunks[0] or None
+    if isinstance(chunks[0], str):
+        return ''.join(chunks) or None  # type: ignore
+    return b''.join(chunks) or None  # type: ignore
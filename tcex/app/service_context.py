@@ -0,0 +1,32 @@
+"""TcEx Framework Module"""
+
+# standard library
+import threading
+from contextvars import ContextVar
+
+# The name, session id and trigger id of the current asyncio service task. Threaded service
+# work stores the same values as attributes of the current thread (see service_thread).
+task_name: ContextVar[str | None] = ContextVar('task_name', default=None)
+task_session_id: ContextVar[str | None] = ContextVar('task_session_id', default=None)
+task_trigger_id: ContextVar[str | None] = ContextVar('task_trigger_id', default=None)
+
+
+def current_name() -> str:
+    """Return the name of the current asyncio service task or thread."""
+    return task_name.get() or threading.current_thread().name
+
+
+def current_session_id() -> str | None:
+    """Return the session id of the current asyncio service task or thread."""
+    session_id = task_session_id.get()
+    if session_id is None:
+        session_id = getattr(threading.current_thread(), 'session_id', None)
+    return session_id
+
+
+def current_trigger_id() -> str | None:
+    """Return the trigger id of the current asyncio service task or thread."""
+    trigger_id = task_trigger_id.get()
+    if trigger_id is None:
+        trigger_id = getattr(threading.current_thread(), 'trigger_id', None)
+    return trigger_id
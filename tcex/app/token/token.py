@@ -2,10 +2,13 @@
 
 # standard library
 import contextlib
+import heapq
+import itertools
 import logging
 import os
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 # third-party
 from requests import Session, exceptions
@@ -13,6 +16,7 @@ from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
 # first-party
+from tcex.app.service_context import current_name, current_trigger_id
 from tcex.input.field_type.sensitive import Sensitive
 from tcex.logger.trace_logger import TraceLogger
 from tcex.pleb.cached_property import cached_property
@@ -41,7 +45,13 @@ def retry_session(retries=3, backoff_factor=0.8, status_forcelist=(500, 502, 504
 
 
 class Token:
-    """TcEx Module"""
+    """TcEx Module
+
+    Tokens are renewed by a scheduler thread that keeps a min-heap of token expirations and
+    only wakes when the next token enters the **token_window**. Each key is renewed under its
+    own lock, threads retrieving a token only wait while their own key is renewing, and
+    independent keys are renewed concurrently.
+    """
 
     def __init__(
         self,
@@ -68,62 +78,138 @@ class Token:
         # properties
         self._shutdown = False
 
-        # Threading event that is used as a barrier that determines whether a token can be retrieved
-        # from this module or not (via the token property). The barrier only blocks access to the
-        # token property whenever token renewal is taking place in order to keep from returning
-        # stale tokens.
-        self._barrier = threading.Event()
-        # Setting barrier event to True disables barrier, which makes the token property
-        # accessible (default behavior)
-        self._barrier.set()
-        # threading event that denotes whether renewal monitor should sleep after a renewal cycle
-        self._monitor_sleep_interval = threading.Event()
+        # min-heap of (expires, sequence, key), entries are invalidated lazily by comparing the
+        # expiration to the scheduled expiration of the key
+        self._heap: list[tuple[int, int, str]] = []
+        self._heap_sequence = itertools.count()
+        # the expiration in the heap for each key and the number of invalidated heap entries
+        self._heap_scheduled: dict[str, int] = {}
+        self._heap_stale = 0
+        # the number of renewals in progress, API logging is paused while any is running
+        self._renewals = 0
+        self._renewals_lock = threading.Lock()
+        # condition used to wake the scheduler when a token is registered or on shutdown
+        self._scheduler_condition = threading.Condition()
+        # per key lock and renewal event, the event is cleared while the key is renewing
+        self._key_locks: dict[str, threading.Lock] = {}
+        self._key_locks_lock = threading.Lock()
+        self._renewed: dict[str, threading.Event] = {}
         self.log = _logger
         self.monitor_thread: ExceptionThread
-        # session with retry for token renewal
+        # executor for concurrent renewal of independent keys
+        self.renewal_executor = ThreadPoolExecutor(
+            max_workers=int(os.getenv('TC_TOKEN_RENEWAL_WORKERS', '4')),
+            thread_name_prefix='token-renewal-worker',
+        )
+        # the number of invalidated heap entries before the heap is compacted
+        self.heap_compact_threshold = 100
+        # the maximum number of seconds the scheduler sleeps between checks
         self.sleep_interval = int(os.getenv('TC_TOKEN_SLEEP_INTERVAL', '150'))
         # token map for storing keys -> tokens -> threads
         self.token_map = {}
-        # amount of time to wait before starting renewal process (after enabling barrier)
-        # buffer allows any other threads using a token to possibly finish their work
-        self.token_renewal_buffer_time = 5
+        # the maximum number of seconds to wait for a renewal of the current key
+        self.token_renewal_timeout = 60
         self.token_window = 600  # seconds to pad before token renewal
 
         # start token renewal process
         self.token_renewal()
 
+    def _key_lock(self, key: str) -> threading.Lock:
+        """Return the renewal lock for the key."""
+        with self._key_locks_lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def _renew_key(self, key: str):
+        """Renew the token for a key (renewal worker thread)."""
+        with self._key_lock(key):
+            token_data = self.token_map.get(key)
+            if token_data is None or not self._renewal_due(token_data.get('token_expires')):
+                # token was unregistered or already renewed
+                return
+
+            renewed = self._renewed.setdefault(key, threading.Event())
+            renewed.clear()
+            try:
+                api_token_data = self.renew_token(token_data.get('token'))
+                token_data['token'] = Sensitive(api_token_data['apiToken'])
+                token_data['token_expires'] = int(api_token_data['apiTokenExpires'])
+                self._schedule(key, token_data['token_expires'])
+                self.log.info(
+                    f'feature=token, action=token-renewed, key={key}, '
+                    f'token={api_token_data["apiToken"]}, '
+                    f'expires={api_token_data["apiTokenExpires"]}'
+                )
+            except Exception:
+                self.log.exception('Token renewal failed.')
+                with contextlib.suppress(KeyError):
+                    del self.token_map[key]
+                    self.log.exception(f'feature=token, event=token-removal-failure, key={key}')
+            finally:
+                renewed.set()
+
+    def _renewal_due(self, expires: int | None) -> bool:
+        """Return True if the token expiration is within the token window."""
+        return expires is not None and expires - self.token_window <= int(time.time())
+
+    def _compact_heap(self):
+        """Remove invalidated entries once they are the majority (condition lock must be held)."""
+        if (
+            self._heap_stale > self.heap_compact_threshold
+            and self._heap_stale > len(self._heap) // 2
+        ):
+            self._heap = [
+                entry for entry in self._heap if self._heap_scheduled.get(entry[2]) == entry[0]
+            ]
+            heapq.heapify(self._heap)
+            self._heap_stale = 0
+
+    def _schedule(self, key: str, expires: int):
+        """Add a token expiration to the scheduler heap.
+
+        The scheduler is only woken if the expiration is the earliest in the heap.
+        """
+        expires = int(expires)
+        with self._scheduler_condition:
+            scheduled = self._heap_scheduled.get(key)
+            if scheduled == expires:
+                # the expiration is already scheduled for the key
+                return
+            if scheduled is not None:
+                self._heap_stale += 1
+
+            sequence = next(self._heap_sequence)
+            heapq.heappush(self._heap, (expires, sequence, key))
+            self._heap_scheduled[key] = expires
+            if self._heap[0][1] == sequence:
+                self._scheduler_condition.notify()
+            self._compact_heap()
+
+    def _unschedule(self, key: str):
+        """Invalidate the heap entry of the key."""
+        with self._scheduler_condition:
+            if self._heap_scheduled.pop(key, None) is not None:
+                self._heap_stale += 1
+                self._compact_heap()
+
     def get_token(self) -> Sensitive | None:
         """Return token for current thread."""
-        # wait until renewal barrier is set to True (meaning no renewal
-        # is in progress). If already true, then simply proceed.
-
-        # perform three attempts - safety net in case of heavily overloaded monitor. If
-        # we cannot retrieve a token after three attempts, there must be an issue
-        for i in range(3):
-            if self._barrier.wait(timeout=self.token_renewal_buffer_time + 10):
-                return self.token_map.get(self.key, {}).get('token')
-
-            self.log.debug(
-                'Timeout expired while waiting for token renewal barrier to be disabled. '
-                f'Attempts: {i + 1}'
-            )
-
-            if not self.monitor_thread.is_alive():
-                break
-
-        self.log.error(
-            'Could not retrieve TC token. Token renewal monitor did not disable token barrier. '
-            f'Token renewal monitor thread alive: {self.monitor_thread.is_alive()}'
-        )
-
-        # timeout expired, monitor likely offline
-        exc = RuntimeError(
-            'Timeout expired while waiting for renewal thread to disable token barrier.'
-        )
         if self.monitor_thread.exception is not None:
-            raise exc from self.monitor_thread.exception
+            ex_msg = 'Token renewal monitor exited unexpectedly, tokens are no longer renewed.'
+            raise RuntimeError(ex_msg) from self.monitor_thread.exception
+
+        # wait only if the token of the current key is being renewed, so that a stale token
+        # is not returned. tokens of other keys can be retrieved while a key is renewing.
+        key = self.key
+        renewed = self._renewed.get(key)
+        if renewed is not None and not renewed.wait(timeout=self.token_renewal_timeout):
+            self.log.error(
+                f'feature=token, event=token-renewal-timeout, key={key}, '
+                f'timeout={self.token_renewal_timeout}'
+            )
+            ex_msg = f'Timeout expired while waiting for renewal of token for key {key}.'
+            raise RuntimeError(ex_msg)
 
-        raise exc  # pragma: no cover
+        return self.token_map.get(key, {}).get('token')
 
     @property
     def key(self) -> str:
@@ -151,6 +237,7 @@ class Token:
             return
 
         self.token_map[key] = {'token': Sensitive(token), 'token_expires': int(expires)}
+        self._schedule(key, int(expires))
         self.log.debug(
             f'feature=token, action=token-register, key={key}, token={token}, expiration={expires}'
         )
@@ -164,35 +251,41 @@ class Token:
             token: The ThreatConnect API token.
         """
         api_token_data = {}
-        # pause API logging
-        self.log.in_token_renewal = True  # type: ignore
-
-        # log token information
-        try:
-            params = {'expiredToken': token.value}
-            url = f'{self.token_url}/appAuth'
-            r = self.session.get(url, params=params, verify=self.verify)
-
-            if not r.ok:
-                err_reason = r.text or r.reason
-                err_msg = (
-                    f'feature=token, event=token-retry-error, status_code={r.status_code}, '
-                    f'api-message={err_reason}, token={token}.'
-                )
-                self.log.error(err_msg)
-                raise RuntimeError(1042, err_msg)
-        except exceptions.SSLError as ex:  # pragma: no cover
-            ex_msg = 'Token renewal failed with an SSL Error.'
-            raise RuntimeError(ex_msg) from ex
+        # pause API logging, renewals run concurrently so the flag is only cleared once the
+        # last renewal in progress completes
+        with self._renewals_lock:
+            self._renewals += 1
+            self.log.in_token_renewal = True  # type: ignore
 
-        # process response for token
         try:
-            api_token_data = r.json()
-        except (AttributeError, ValueError) as ex:  # pragma: no cover
-            ex_msg = f'Token renewal failed ({ex}).'
-            raise RuntimeError(ex_msg) from ex
+            # log token information
+            try:
+                params = {'expiredToken': token.value}
+                url = f'{self.token_url}/appAuth'
+                r = self.session.get(url, params=params, verify=self.verify)
+
+                if not r.ok:
+                    err_reason = r.text or r.reason
+                    err_msg = (
+                        f'feature=token, event=token-retry-error, status_code={r.status_code}, '
+                        f'api-message={err_reason}, token={token}.'
+                    )
+                    self.log.error(err_msg)
+                    raise RuntimeError(1042, err_msg)
+            except exceptions.SSLError as ex:  # pragma: no cover
+                ex_msg = 'Token renewal failed with an SSL Error.'
+                raise RuntimeError(ex_msg) from ex
+
+            # process response for token
+            try:
+                api_token_data = r.json()
+            except (AttributeError, ValueError) as ex:  # pragma: no cover
+                ex_msg = f'Token renewal failed ({ex}).'
+                raise RuntimeError(ex_msg) from ex
         finally:
-            self.log.in_token_renewal = False  # type: ignore
+            with self._renewals_lock:
+                self._renewals -= 1
+                self.log.in_token_renewal = self._renewals > 0  # type: ignore
 
         return api_token_data
 
@@ -213,18 +306,19 @@ class Token:
     def shutdown(self, value: bool):
         """Set shutdown property.
 
-        If new value is True, set the monitor_sleep Event so that renewal monitor knows to shut
-        down immediately (or after its current renewal cycle).
+        If new value is True, wake the renewal monitor so that it shuts down immediately.
         """
-        if value is True:
-            self._monitor_sleep_interval.set()
-
         self._shutdown = value
 
+        if value is True:
+            with self._scheduler_condition:
+                self._scheduler_condition.notify_all()
+            self.renewal_executor.shutdown(wait=False)
+
     @property
     def thread_name(self) -> str:
-        """Return the current thread name."""
-        return threading.current_thread().name
+        """Return the current thread (or asyncio service task) name."""
+        return current_name()
 
     @property
     def token(self) -> Sensitive | None:
@@ -244,7 +338,9 @@ class Token:
     @token_expires.setter
     def token_expires(self, expires):
         """Set token expires for current thread."""
-        self.token_map.setdefault(self.key, {})['token_expires'] = int(expires)
+        key = self.key
+        self.token_map.setdefault(key, {})['token_expires'] = int(expires)
+        self._schedule(key, int(expires))
 
     def token_renewal(self):
         """Start token renewal monitor thread."""
@@ -256,65 +352,43 @@ class Token:
     def token_renewal_monitor(self):
         """Monitor token expiration and renew when required."""
         self.log.debug('feature=token, event=renewal-monitor-started')
-        self._barrier.set()
-        self._monitor_sleep_interval.wait(self.sleep_interval)
         while True:
-            # Clear renewal barrier (setting it to False), which
-            # blocks access to token via # the token property.
-            self._barrier.clear()
-            self.log.debug('Token renewal barrier enabled.')
-            self._monitor_sleep_interval.wait(self.token_renewal_buffer_time)
-            for key, token_data in dict(self.token_map).items():
-                # calculate the time left to sleep
-                sleep_seconds = (
-                    token_data.get('token_expires') - int(time.time()) - self.token_window
-                )
-                self.log.trace(
-                    """feature=token, """
-                    f'event=token-status, key={key}, '
-                    f'token={token_data.get("token")}, '
-                    f'expires={token_data.get("token_expires")}, '
-                    f'sleep-seconds={sleep_seconds}'
-                )
+            due = []
+            with self._scheduler_condition:
+                while not self.shutdown:
+                    now = int(time.time())
+                    # pop all tokens that entered the token window
+                    while self._heap and self._heap[0][0] - self.token_window <= now:
+                        expires, _, key = heapq.heappop(self._heap)
+                        # skip entries for unregistered keys or superseded expirations
+                        if self._heap_scheduled.get(key) != expires:
+                            self._heap_stale = max(0, self._heap_stale - 1)
+                            continue
+                        del self._heap_scheduled[key]
+                        token_data = self.token_map.get(key)
+                        if token_data is not None and token_data.get('token_expires') == expires:
+                            due.append(key)
+                    if due:
+                        break
+
+                    # sleep until the next token enters the token window
+                    timeout = self.sleep_interval
+                    if self._heap:
+                        timeout = min(timeout, self._heap[0][0] - self.token_window - now)
+                    self._scheduler_condition.wait(timeout=max(timeout, 1))
 
-                if sleep_seconds > 0:
-                    continue
-
-                # renew token data
-                try:
-                    api_token_data = self.renew_token(token_data.get('token'))
-                    self.token_map[key]['token'] = Sensitive(api_token_data['apiToken'])
-                    self.token_map[key]['token_expires'] = int(api_token_data['apiTokenExpires'])
-                    self.log.info(
-                        f'feature=token, action=token-renewed, key={key}, '
-                        f'token={api_token_data["apiToken"]}, '
-                        f'expires={api_token_data["apiTokenExpires"]}'
-                    )
-                except RuntimeError:
-                    self.log.exception('Token renewal failed.')
-                    with contextlib.suppress(KeyError):
-                        del self.token_map[key]
-                        self.log.exception(f'feature=token, event=token-removal-failure, key={key}')
-
-            # renewal loop is finished, grant access to token via token property once again
-            self._barrier.set()
-            self.log.debug('Token renewal barrier disabled.')
-
-            # if monitor has not been shutdown, renewal monitor will sleep for sleep_interval
-            # seconds. If monitor has been shutdown, monitor does not sleep and proceeds to
-            # the shutdown logic within the if statement below. If the monitor is already
-            # sleeping, the monitor wakes up and proceeds to the shutdown logic.
-            self._monitor_sleep_interval.wait(self.sleep_interval)
             if self.shutdown is True:  # pragma: no cover
                 self.log.debug('Token renewal monitor shutdown signal received')
                 break
 
+            for key in due:
+                self.log.trace(f'feature=token, event=token-renewal-scheduled, key={key}')
+                self.renewal_executor.submit(self._renew_key, key)
+
     @property
     def trigger_id(self) -> int | None:
         """Return the current trigger_id."""
-        trigger_id = None
-        if hasattr(threading.current_thread(), 'trigger_id'):
-            trigger_id = threading.current_thread().trigger_id  # type: ignore
+        trigger_id = current_trigger_id()
         if trigger_id is not None:
             trigger_id = int(trigger_id)
         return trigger_id
@@ -330,3 +404,9 @@ class Token:
             self.log.debug(f'feature=token, action=token-unregister, key={key}')
         except KeyError:
             pass
+
+        # the heap entry for the key is skipped by the scheduler (and removed on compaction)
+        self._unschedule(key)
+        with self._key_locks_lock:
+            self._key_locks.pop(key, None)
+        self._renewed.pop(key, None)
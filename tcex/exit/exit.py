@@ -64,6 +64,12 @@ class Exit:
         self._exit_msg_handler(code, msg)
 
         self.log.info(f'exit-code={code}')
+
+        # ensure queued log events are written and the handlers are closed before exiting
+        if 'Logger' in registry:
+            registry.logger.flush()
+            registry.logger.shutdown()
+
         sys.exit(code.value)
 
     def _message_tc(self, message: str, max_length: int = 255):
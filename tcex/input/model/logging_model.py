@@ -1,7 +1,10 @@
 """TcEx Framework Module"""
 
+# standard library
+import os
+
 # third-party
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, validator
 
 
 class LoggingModel(BaseModel):
@@ -28,6 +31,11 @@ class LoggingModel(BaseModel):
         inclusion_reason='runtimeLevel',
         requires_definition=True,
     )
+    tc_log_format: str = Field(
+        'text',
+        description='The format of the App log file (text or json), defaults to TC_LOG_FORMAT.',
+        inclusion_reason='runtimeLevel',
+    )
     # job Apps have to collect tc_log_level manually
     tc_log_level: str = Field(
         'info',
@@ -41,8 +49,67 @@ class LoggingModel(BaseModel):
         inclusion_reason='runtimeLevel',
         requires_definition=True,
     )
+    tc_log_queue: bool = Field(
+        default=False,
+        description=('Flag to handle log events in a background thread, defaults to TC_LOG_QUEUE.'),
+        inclusion_reason='runtimeLevel',
+    )
+    tc_log_queue_full_policy: str = Field(
+        'block',
+        description=(
+            'The policy when the log queue is full (block or drop), '
+            'defaults to TC_LOG_QUEUE_FULL_POLICY.'
+        ),
+        inclusion_reason='runtimeLevel',
+    )
+    tc_log_queue_size: int = Field(
+        10_000,
+        description='The maximum number of queued log events, defaults to TC_LOG_QUEUE_SIZE.',
+        gt=0,
+        inclusion_reason='runtimeLevel',
+    )
+    tc_log_rate_limit: float | None = Field(
+        None,
+        description=(
+            'The maximum number of repeated log events per second per message, '
+            'defaults to TC_LOG_RATE_LIMIT.'
+        ),
+        gt=0,
+        inclusion_reason='runtimeLevel',
+    )
     tc_log_to_api: bool = Field(
         default=False,
         description='Flag to enable API logging for the App.',
         inclusion_reason='runtimeLevel',
     )
+
+    @validator(
+        'tc_log_format',
+        'tc_log_queue',
+        'tc_log_queue_full_policy',
+        'tc_log_queue_size',
+        'tc_log_rate_limit',
+        always=True,
+        pre=True,
+    )
+    @classmethod
+    def environment_default(cls, v, field):
+        """Return the environment variable (e.g., TC_LOG_QUEUE) if the input is not provided."""
+        env_value = os.getenv(field.name.upper())
+        if env_value and v == field.default:
+            return env_value
+        return v
+
+    @validator('tc_log_format', 'tc_log_queue_full_policy')
+    @classmethod
+    def valid_choice(cls, v, field):
+        """Validate the value is one of the supported choices."""
+        choices = {
+            'tc_log_format': ('json', 'text'),
+            'tc_log_queue_full_policy': ('block', 'drop'),
+        }[field.name]
+        v = v.lower()
+        if v not in choices:
+            ex_msg = f'Invalid {field.name} ({v}), must be one of {", ".join(choices)}.'
+            raise ValueError(ex_msg)
+        return v
@@ -6,6 +6,7 @@ from pydantic import Extra
 # first-party
 from tcex.input.model.api_model import ApiModel
 from tcex.input.model.cert_model import CertModel
+from tcex.input.model.logging_model import LoggingModel
 from tcex.input.model.path_model import PathModel
 from tcex.input.model.playbook_common_model import PlaybookCommonModel
 from tcex.input.model.playbook_model import PlaybookModel
@@ -14,7 +15,14 @@ from tcex.input.model.service_model import ServiceModel
 
 
 class ModuleAppModel(
-    ApiModel, CertModel, PathModel, PlaybookCommonModel, PlaybookModel, ProxyModel, ServiceModel
+    ApiModel,
+    CertModel,
+    LoggingModel,
+    PathModel,
+    PlaybookCommonModel,
+    PlaybookModel,
+    ProxyModel,
+    ServiceModel,
 ):
     """Model Definition
 
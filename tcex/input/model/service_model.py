@@ -16,6 +16,11 @@ class ServiceModel(BaseModel):
     * WebhookTriggerService
     """
 
+    tc_svc_async_runtime: bool = Field(
+        default=False,
+        description='If true, the heartbeat is driven by the asyncio service runtime.',
+        inclusion_reason='runtimeLevel',
+    )
     tc_svc_broker_conn_timeout: int = Field(
         60,
         description='The broker connection startup timeout in seconds.',
@@ -48,6 +53,39 @@ class ServiceModel(BaseModel):
         description='The Broker client topic (App -> Core).',
         inclusion_reason='runtimeLevel',
     )
+    tc_svc_control_queue_size: int = Field(
+        1000,
+        description='The maximum number of queued control commands.',
+        inclusion_reason='runtimeLevel',
+    )
+    tc_svc_control_workers: int = Field(
+        4,
+        description='The maximum number of threads processing control commands.',
+        inclusion_reason='runtimeLevel',
+    )
+    tc_svc_event_full_policy: str = Field(
+        'queue',
+        description='The policy when the event queue is full (queue, reject, or shed).',
+        inclusion_reason='runtimeLevel',
+    )
+    tc_svc_event_queue_size: int = Field(
+        1000,
+        description='The maximum number of queued event commands.',
+        inclusion_reason='runtimeLevel',
+    )
+    tc_svc_event_queue_timeout: float = Field(
+        30.0,
+        description=(
+            'The maximum seconds to wait for event queue space with the queue policy '
+            '(broker commands never wait, they are rejected when the queue is full).'
+        ),
+        inclusion_reason='runtimeLevel',
+    )
+    tc_svc_event_workers: int = Field(
+        50,
+        description='The maximum number of threads processing event commands.',
+        inclusion_reason='runtimeLevel',
+    )
     tc_svc_hb_timeout_seconds: int = Field(
         20,
         description='The heartbeat timeout interval in seconds.',
@@ -64,6 +102,15 @@ class ServiceModel(BaseModel):
         description='The Broker server topic (Core -> App).',
         inclusion_reason='runtimeLevel',
     )
+    tc_svc_trigger_log_handler: bool = Field(
+        default=False,
+        description=(
+            'If true, log events of trigger threads are written to the trigger logfile '
+            '(trigger-id-<id>.log) by the framework, leave disabled if the App writes the '
+            'trigger logfile.'
+        ),
+        inclusion_reason='runtimeLevel',
+    )
     tcex_testing_context: str | None = Field(
         None,
         description='[Testing] The testing framework context.',
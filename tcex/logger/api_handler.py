@@ -1,34 +1,135 @@
 """TcEx Framework Module"""
 
 # standard library
+import contextlib
+import gzip
+import json
 import logging
 import threading
 import time
+from collections import deque
 
 # third-party
 from requests import Session
 
 
 class ApiHandler(logging.Handler):
-    """Logger handler for ThreatConnect Exchange API logging."""
-
-    def __init__(self, session: Session, flush_limit=100):
+    """Logger handler for ThreatConnect Exchange API logging.
+
+    Records from all threads are formatted and queued by emit. A background shipper thread
+    sends the queued entries to the API in batches when **flush_limit** entries are queued,
+    an ERROR is logged, or **flush_interval** seconds have passed. The logging thread never
+    sends to the API, only flush() and close() send synchronously.
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        flush_limit: int = 100,
+        *,
+        backoff_factor: float = 1.0,
+        compress: bool = False,
+        flush_interval: float = 5.0,
+        max_batch_bytes: int = 1_000_000,
+        max_retries: int = 3,
+    ):
         """Initialize instance properties.
 
         Args:
             session (Request.Session): The pre-configured instance of Session for ThreatConnect API.
             flush_limit (int): The limit to flush batch logs to the API.
+            backoff_factor: The factor for the exponential backoff between retries.
+            compress: If True, the payload is gzip compressed.
+            flush_interval: The maximum number of seconds entries are queued.
+            max_batch_bytes: The maximum (uncompressed) payload size of a batch.
+            max_retries: The number of retries for a failed batch.
         """
         super().__init__()
         self.session = session
         self.flush_limit = flush_limit
-        self._entries = []
+        self.backoff_factor = backoff_factor
+        self.compress = compress
+        self.flush_interval = flush_interval
+        self.max_batch_bytes = max_batch_bytes
+        self.max_retries = max_retries
+        self._entries = deque()
         self._entries_lock = threading.Lock()
+        self._flush_event = threading.Event()
+        self._send_lock = threading.Lock()
+        self._shipper_lock = threading.Lock()
+        self._shipper_thread: threading.Thread | None = None
+        self._shutdown = threading.Event()
         self.in_token_renewal = False
 
+    def _batches(self, entries: list[dict]) -> list[list[dict]]:
+        """Split the entries in batches by count and payload size."""
+        batches = []
+        batch = []
+        batch_bytes = 2  # the list brackets
+        for entry in entries:
+            entry_bytes = len(json.dumps(entry)) + 2  # the separator
+            if batch and (
+                len(batch) >= self.flush_limit or batch_bytes + entry_bytes > self.max_batch_bytes
+            ):
+                batches.append(batch)
+                batch = []
+                batch_bytes = 2
+            batch.append(entry)
+            batch_bytes += entry_bytes
+
+        if batch:
+            batches.append(batch)
+        return batches
+
+    def _send(self, entries: list[dict]):
+        """Send a batch to the API, retrying with exponential backoff."""
+        headers = {'Content-Type': 'application/json'}
+        data = json.dumps(entries).encode()
+        if self.compress:
+            headers['Content-Encoding'] = 'gzip'
+            data = gzip.compress(data)
+
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                time.sleep(self.backoff_factor * 2 ** (attempt - 1))
+
+            with contextlib.suppress(Exception):  # nosec
+                r = self.session.post('/v2/logs/app', headers=headers, data=data)
+                if r.ok or (r.status_code < 500 and r.status_code != 429):  # noqa: PLR2004
+                    # don't retry client errors, the payload would be rejected again
+                    return
+
+    def _ship(self):
+        """Send queued entries until the handler is closed (background thread)."""
+        while not self._shutdown.is_set():
+            self._flush_event.wait(timeout=self.flush_interval)
+            self._flush_event.clear()
+
+            # the token module is currently renewing token
+            if not self.in_token_renewal:
+                self.log_to_api(self.entries)
+
+    def _start_shipper(self):
+        """Start the background shipper thread if not already running."""
+        with self._shipper_lock:
+            if self._shipper_thread is None and not self._shutdown.is_set():
+                self._shipper_thread = threading.Thread(
+                    name='tcex-api-log-shipper', target=self._ship, daemon=True
+                )
+                self._shipper_thread.start()
+
+    def close(self):
+        """Stop the shipper thread and send all queued entries."""
+        self._shutdown.set()
+        self._flush_event.set()
+        if self._shipper_thread is not None:
+            self._shipper_thread.join(timeout=self.flush_interval)
+        self.flush()
+        super().close()
+
     def flush(self):
-        """Close the logger and flush entries."""
-        self.log_to_api(self.entries)  # pragma: no cover
+        """Send all queued entries to the API."""
+        self.log_to_api(self.entries)
 
     def emit(self, record: logging.LogRecord):
         """Emit a record.
@@ -36,51 +137,43 @@ class ApiHandler(logging.Handler):
         Args:
             record (obj): The record to be logged.
         """
-        # TODO: [low] switch this after testing
-        # if not threading.current_thread() is threading.main_thread():  # pragma: no cover
-        if threading.current_thread().name != 'MainThread':  # pragma: no cover
-            return
+        if self._shipper_thread is None:
+            self._start_shipper()
 
         # queue log events
-        self._entries.append(self.format(record))
+        entry = self.format(record)
+        with self._entries_lock:
+            self._entries.append(entry)
+            count = len(self._entries)
 
-        # flush queue once limit is hit token module is currently renewing token
-        if (
-            len(self._entries) > self.flush_limit or record.levelname == 'ERROR'
-        ) and not self.in_token_renewal:
-            self.log_to_api(self.entries)
+        # wake the shipper once limit is hit
+        if count >= self.flush_limit or record.levelno >= logging.ERROR:
+            self._flush_event.set()
 
     def handle(self, record: logging.LogRecord):
         """Override base handle method to add logic that prevents threading deadlocks"""
-        # append log entries from child threads to _entries to avoid deadlocks within handle method.
-        # Otherwise, token monitor thread would try to acquire I/O lock within super().handle
-        # when attempting to log messages (meaning token barrier is enabled in tokens.py).
-        # if the main thread currently has the I/O lock from within super().handle and is trying
-        # to retrieve a token from tokens.py to log to API, then a deadlock occurs because the
-        # main thread is waiting for the barrier to be disabled, and the token thread is waiting
-        # for the I/O lock from super().handle.
-        if threading.current_thread().name != 'MainThread':
-            with self._entries_lock:
-                self._entries.append(self.format(record))
-        else:
-            super().handle(record)
+        # emit only appends to the queued entries (guarded by its own short lived lock), so the
+        # handler I/O lock is not acquired. Otherwise, the token monitor thread could be waiting
+        # for the I/O lock while a thread holding it waits for the token barrier to be disabled.
+        rv = self.filter(record)
+        if rv:
+            self.emit(record)
+        return rv
 
     @property
     def entries(self):
         """Return a copy and clear self._entries."""
         with self._entries_lock:
             entries = list(self._entries)
-            self._entries = []
+            self._entries.clear()
             return entries
 
-    def log_to_api(self, entries: list[logging.LogRecord]):
+    def log_to_api(self, entries: list[dict]):
         """Send log events to the ThreatConnect API"""
         if entries:
-            try:
-                headers = {'Content-Type': 'application/json'}
-                self.session.post('/v2/logs/app', headers=headers, json=entries)
-            except Exception:  # nosec; pragma: no cover
-                pass
+            with self._send_lock:
+                for batch in self._batches(entries):
+                    self._send(batch)
 
 
 class ApiHandlerFormatter(logging.Formatter):
@@ -108,6 +201,6 @@ class ApiHandlerFormatter(logging.Formatter):
         """
         return {
             'timestamp': int(float(record.created or time.time()) * 1000),
-            'message': record.msg or '',
+            'message': record.getMessage() or '',
             'level': record.levelname or 'DEBUG',
         }
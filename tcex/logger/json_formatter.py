@@ -0,0 +1,60 @@
+"""TcEx Framework Module"""
+
+# standard library
+import json
+import logging
+from datetime import UTC, datetime
+
+
+class JsonFormatter(logging.Formatter):
+    """Logger formatter that renders records as a single line JSON object.
+
+    Structured fields (see TraceLogger.log_fields) are added as top level keys. The static
+    fields (e.g., App name and version) are serialized once and appended to every record.
+
+    Args:
+        static_fields: The fields added to every record.
+    """
+
+    def __init__(self, static_fields: dict | None = None):
+        """Initialize instance properties."""
+        super().__init__()
+        self._static_json = ''
+        if static_fields:
+            self._static_json = (
+                ',' + json.dumps(static_fields, default=str, separators=(',', ':'))[1:-1]
+            )
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format the record as JSON."""
+        data = {
+            'timestamp': datetime.fromtimestamp(record.created, tz=UTC).isoformat(
+                timespec='milliseconds'
+            ),
+            'level': record.levelname,
+            'logger': record.name,
+        }
+
+        fields = getattr(record, 'fields', None)
+        if fields is not None:
+            data.update(fields)
+        else:
+            data['message'] = record.getMessage()
+
+        data.update(
+            {
+                'file': record.filename,
+                'function': record.funcName,
+                'line': record.lineno,
+                'thread': record.threadName,
+            }
+        )
+
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            data['exception'] = record.exc_text
+        if record.stack_info:
+            data['stack'] = self.formatStack(record.stack_info)
+
+        return json.dumps(data, default=str, separators=(',', ':'))[:-1] + self._static_json + '}'
@@ -1,9 +1,11 @@
 """TcEx Framework Module"""
 
 # standard library
+import contextlib
 import logging
 import os
 import platform
+import queue
 import sys
 from importlib.metadata import version
 from pathlib import Path
@@ -18,8 +20,13 @@ from tcex.app.config.install_json import InstallJson
 from tcex.input.model.common_model import CommonModel  # TYPE-CHECKING
 from tcex.logger.api_handler import ApiHandler, ApiHandlerFormatter
 from tcex.logger.cache_handler import CacheHandler
+from tcex.logger.json_formatter import JsonFormatter
+from tcex.logger.queue_handler_custom import QueueHandlerCustom, QueueListenerCustom
+from tcex.logger.rate_limit_filter import RateLimitFilter
 from tcex.logger.rotating_file_handler_custom import RotatingFileHandlerCustom
+from tcex.logger.sensitive_filter import SensitiveFilter
 from tcex.logger.trace_logger import TraceLogger
+from tcex.logger.trigger_file_handler import TriggerFileHandler
 
 
 class Logger:
@@ -31,6 +38,24 @@ class Logger:
 
         # properties
         self.ij = InstallJson()
+        self._app_metadata: dict | None = None
+        self._queue_listener: QueueListenerCustom | None = None
+
+    def _add_handler(self, handler: logging.Handler):
+        """Add a handler to the logger or to the queue listener when enabled."""
+        if self._queue_listener is not None:
+            self._queue_listener.add_handler(handler)
+        else:
+            self._logger.addHandler(handler)
+        self._update_trace_enabled()
+
+    @property
+    def _handlers(self) -> list[logging.Handler]:
+        """Return all handlers, including handlers of the queue listener."""
+        handlers = list(self._logger.handlers)
+        if self._queue_listener is not None:
+            handlers.extend(self._queue_listener.handlers)
+        return handlers
 
     @property
     def _logger(self) -> TraceLogger:
@@ -40,6 +65,18 @@ class Logger:
         logger.setLevel(logging.TRACE)  # type: ignore
         return logger  # type: ignore
 
+    def _update_trace_enabled(self):
+        """Update the trace_enabled flag of the logger from the handler levels.
+
+        The logger level is always TRACE, so isEnabledFor(TRACE) can't be used to skip
+        building expensive TRACE messages (e.g., decoding the message broker payload).
+        """
+        self._logger.trace_enabled = any(
+            h.level <= logging.TRACE  # type: ignore
+            for h in self._handlers
+            if not isinstance(h, QueueHandlerCustom)
+        )
+
     @property
     def _formatter(self) -> logging.Formatter:
         """Return log formatter."""
@@ -58,6 +95,35 @@ class Logger:
         )
         return logging.Formatter(tx_format)
 
+    @property
+    def app_metadata(self) -> dict:
+        """Return the static App metadata added to every structured (JSON) log event."""
+        if self._app_metadata is None:
+            metadata = {
+                'pid': os.getpid(),
+                'python-version': platform.python_version(),
+            }
+            # best effort, the install.json may not be available
+            with contextlib.suppress(Exception):
+                metadata.update(
+                    {
+                        'app-name': self.ij.model.display_name,
+                        'app-id': str(self.ij.model.app_id),
+                        'app-version': str(self.ij.model.program_version),
+                        'app-runtime-level': str(self.ij.model.runtime_level),
+                    }
+                )
+
+            with contextlib.suppress(ImportError):
+                metadata['tcex-version'] = version('tcex')
+            self._app_metadata = metadata
+        return self._app_metadata
+
+    @property
+    def json_formatter(self) -> JsonFormatter:
+        """Return a structured (JSON) log formatter including the static App metadata."""
+        return JsonFormatter(static_fields=self.app_metadata)
+
     def handler_exist(self, handler_name: str) -> bool:
         """Remove a file handler by name.
 
@@ -67,7 +133,7 @@ class Logger:
         Returns:
             bool: True if handler current exists
         """
-        return any(h.get_name() == handler_name for h in self._logger.handlers)
+        return any(h.get_name() == handler_name for h in self._handlers)
 
     @property
     def log(self) -> TraceLogger:
@@ -87,16 +153,26 @@ class Logger:
         level = level or 'debug'
         return logging.getLevelName(level.upper())
 
+    def remove_rate_limit_filter(self):
+        """Remove the rate limit filter, logging a summary of suppressed events."""
+        for f in list(self._logger.filters):
+            if isinstance(f, RateLimitFilter):
+                self._logger.removeFilter(f)
+                f.emit_summaries()
+
     def remove_handler_by_name(self, handler_name: str):
         """Remove a file handler by name.
 
         Args:
             handler_name: The handler name to remove.
         """
-        for h in self._logger.handlers:
+        for h in self._handlers:
             if h.get_name() == handler_name:
                 self._logger.removeHandler(h)
+                if self._queue_listener is not None:
+                    self._queue_listener.remove_handler(h)
                 break
+        self._update_trace_enabled()
 
     def replay_cached_events(self, handler_name: str = 'cache'):
         """Replay cached log events and remove handler."""
@@ -111,14 +187,37 @@ class Logger:
         # remove the cache handler
         self.remove_handler_by_name(handler_name=handler_name)
 
-    def shutdown(self):
-        """Close all handlers.
+    def flush(self):
+        """Flush all handlers, waiting for any queued log events to be handled."""
+        # log a summary of rate limited events
+        for f in self._logger.filters:
+            if isinstance(f, RateLimitFilter):
+                f.emit_summaries()
+
+        if self._queue_listener is not None:
+            self._queue_listener.flush()
 
-        Args:
-            handler_name (str): The handler name to remove.
-        """
         for h in self._logger.handlers:
+            h.flush()
+
+        # wait for rolled over log files to be compressed
+        for h in self._handlers:
+            if isinstance(h, RotatingFileHandlerCustom):
+                h.wait_for_compression()
+
+    def shutdown(self):
+        """Close all handlers, handling any queued log events first."""
+        if self._queue_listener is not None:
+            # stop handles the queued records before the listener thread exits (bounded wait)
+            self._queue_listener.stop()
+            for h in self._queue_listener.handlers:
+                h.close()
+            self._queue_listener = None
+
+        for h in list(self._logger.handlers):
             self._logger.removeHandler(h)
+            h.close()
+        self._update_trace_enabled()
 
     def update_handler_level(self, level: str):
         """Update all handlers log level.
@@ -129,27 +228,35 @@ class Logger:
         level_ = self.log_level(level)
 
         # update all handler logging levels
-        for h in self._logger.handlers:
+        for h in self._handlers:
             h.setLevel(level_)
+        self._update_trace_enabled()
 
     #
     # handlers
     #
 
-    def add_api_handler(self, session_tc: Session, name: str = 'api', level: str | None = None):
+    def add_api_handler(
+        self,
+        session_tc: Session,
+        name: str = 'api',
+        level: str | None = None,
+        compress: bool = False,
+    ):
         """Add API logging handler.
 
         Args:
             session_tc: An configured instance of request.Session with TC API Auth.
             name: The name of the handler.
             level: The level value as a string.
+            compress: If True, the log events are sent gzip compressed.
         """
         self.remove_handler_by_name(name)
-        api = ApiHandler(session_tc)
+        api = ApiHandler(session_tc, compress=compress)
         api.set_name(name)
         api.setLevel(self.log_level(level))
         api.setFormatter(ApiHandlerFormatter())
-        self._logger.addHandler(api)
+        self._add_handler(api)
 
     def add_cache_handler(self, name: str):
         """Add cache logging handler.
@@ -164,7 +271,81 @@ class Logger:
         # be only those that happen before args are processed
         cache.setLevel(self.log_level('trace'))
         cache.setFormatter(self._formatter)
-        self._logger.addHandler(cache)
+        self._add_handler(cache)
+
+    def add_queue_handler(
+        self,
+        name: str = 'queue',
+        queue_size: int = 10_000,
+        full_policy: str = 'block',
+        block_timeout: float = 1.0,
+    ):
+        """Move log handling to a background thread.
+
+        All current handlers (except the cache handler) and handlers added later are
+        handled by a queue listener thread. The logging thread only enqueues the record,
+        formatting, sensitive value scrubbing, file rotation, and API logging are done
+        by the listener. Queued events are handled on flush() and shutdown().
+
+        Args:
+            name: The name of the handler.
+            queue_size: The maximum number of queued log events.
+            full_policy: The behavior when the queue is full, "block" waits up to
+                block_timeout seconds for space (backpressure), "drop" discards the event.
+            block_timeout: The maximum seconds to wait for space with the "block" policy.
+        """
+        if self._queue_listener is not None:
+            return
+
+        log_queue = queue.Queue(maxsize=queue_size)
+        listener = QueueListenerCustom(log_queue)
+
+        # move the current handlers to the listener, the cache handler is replayed later
+        for h in list(self._logger.handlers):
+            if isinstance(h, CacheHandler):
+                continue
+            self._logger.removeHandler(h)
+            listener.add_handler(h)
+
+        # move sensitive value scrubbing to the listener thread
+        for f in list(self._logger.filters):
+            if isinstance(f, SensitiveFilter):
+                self._logger.removeFilter(f)
+                listener.filters.append(f)
+
+        qh = QueueHandlerCustom(log_queue, full_policy=full_policy, block_timeout=block_timeout)
+        qh.set_name(name)
+        qh.setLevel(self.log_level('trace'))
+        self._logger.addHandler(qh)
+
+        listener.start()
+        self._queue_listener = listener
+        self._update_trace_enabled()
+
+    def add_rate_limit_filter(
+        self,
+        rate: float = 10.0,
+        burst: int = 100,
+        summary_interval: float = 60.0,
+        max_level: str = 'warning',
+    ):
+        """Rate limit repeated log events for all handlers.
+
+        Args:
+            rate: The number of events per second allowed per message template.
+            burst: The number of events allowed before rate limiting starts.
+            summary_interval: The number of seconds between summaries of suppressed events.
+            max_level: The highest level that is rate limited.
+        """
+        self.remove_rate_limit_filter()
+        self._logger.addFilter(
+            RateLimitFilter(
+                rate=rate,
+                burst=burst,
+                summary_interval=summary_interval,
+                max_level=self.log_level(max_level),
+            )
+        )
 
     def add_rotating_file_handler(
         self,
@@ -176,6 +357,8 @@ class Logger:
         level: str,
         formatter: logging.Formatter | None = None,
         mode: str = 'a',
+        *,
+        compress_level: int = 9,
     ):
         """Add custom file logging handler.
 
@@ -188,18 +371,65 @@ class Logger:
             level: The logging level.
             formatter: The logging formatter to use.
             mode: The write mode for the file.
+            compress_level: The gzip compression level of rotated files (1 is fastest).
         """
         self.remove_handler_by_name(name)
         formatter = formatter or self._formatter_thread_name
 
         # create customized handler
         fh = RotatingFileHandlerCustom(
-            str(Path(path) / filename), backupCount=backup_count, maxBytes=max_bytes, mode=mode
+            str(Path(path) / filename),
+            backupCount=backup_count,
+            maxBytes=max_bytes,
+            mode=mode,
+            compress_level=compress_level,
         )
         fh.set_name(name)
         fh.setFormatter(formatter)
         fh.setLevel(self.log_level(level))
-        self._logger.addHandler(fh)
+        self._add_handler(fh)
+
+    def add_trigger_handler(
+        self,
+        path: Path | str,
+        name: str = 'trigger',
+        level: str | None = None,
+        formatter: logging.Formatter | None = None,
+        max_open: int = 128,
+        *,
+        max_bytes: int = 0,
+        backup_count: int = 0,
+    ):
+        """Add a handler that routes log events of trigger threads to a logfile per trigger.
+
+        Args:
+            path: The path for the trigger logfiles.
+            name: The name of the handler.
+            level: The logging level.
+            formatter: The logging formatter to use.
+            max_open: The maximum number of open logfiles.
+            max_bytes: The max logfile size before rotating (0 disables rotation).
+            backup_count: The maximum # of backup files per trigger.
+        """
+        self.remove_handler_by_name(name)
+        th = TriggerFileHandler(
+            path, max_open=max_open, max_bytes=max_bytes, backup_count=backup_count
+        )
+        th.set_name(name)
+        th.setFormatter(formatter or self._formatter_thread_name)
+        th.setLevel(self.log_level(level))
+        self._add_handler(th)
+
+    def close_trigger_log(self, trigger_id: int | str, name: str = 'trigger'):
+        """Close the logfile of a trigger.
+
+        Args:
+            trigger_id: The trigger id.
+            name: The name of the trigger handler.
+        """
+        for h in self._handlers:
+            if h.get_name() == name and isinstance(h, TriggerFileHandler):
+                h.close_trigger(trigger_id)
 
     def add_stream_handler(
         self,
@@ -221,7 +451,7 @@ class Logger:
         sh.set_name(name)
         sh.setFormatter(formatter)
         sh.setLevel(self.log_level(level))
-        self._logger.addHandler(sh)
+        self._add_handler(sh)
 
     #
     # App info logging
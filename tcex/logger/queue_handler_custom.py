@@ -0,0 +1,185 @@
+"""TcEx Framework Module"""
+
+# standard library
+import contextlib
+import copy
+import logging
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener
+
+# first-party
+from tcex.app.service_context import current_trigger_id
+
+# formatter used to render exception tracebacks before queuing a record
+_exc_formatter = logging.Formatter()
+
+
+class QueueHandlerCustom(QueueHandler):
+    """Logger handler that enqueues records for a background QueueListenerCustom.
+
+    Only the message is merged with the args on the calling thread. Formatting,
+    sensitive value scrubbing, file rotation, and API shipping are done by the
+    listener thread.
+
+    Args:
+        log_queue: The bounded queue shared with the listener.
+        full_policy: The behavior when the queue is full, "block" waits up to
+            block_timeout seconds for space (backpressure), "drop" discards the record.
+        block_timeout: The maximum seconds to wait for space in the queue with the "block"
+            policy before the record is dropped.
+    """
+
+    def __init__(
+        self, log_queue: queue.Queue, full_policy: str = 'block', block_timeout: float = 1.0
+    ):
+        """Initialize instance properties."""
+        super().__init__(log_queue)
+        if full_policy not in ('block', 'drop'):
+            ex_msg = f'Invalid full_policy ({full_policy}), must be "block" or "drop".'
+            raise ValueError(ex_msg)
+
+        self.block_timeout = block_timeout
+        self.full_policy = full_policy
+
+        # properties
+        self._dropped = 0
+        self._dropped_unreported = 0
+        self._dropped_lock = threading.Lock()
+
+    @property
+    def dropped(self) -> int:
+        """Return the number of records dropped because the queue was full."""
+        return self._dropped
+
+    def enqueue(self, record: logging.LogRecord):
+        """Enqueue a record, applying the full policy when the queue is full."""
+        try:
+            if self.full_policy == 'block':
+                self.queue.put(record, timeout=self.block_timeout)  # type: ignore
+            else:
+                self.queue.put_nowait(record)
+        except queue.Full:
+            with self._dropped_lock:
+                self._dropped += 1
+                self._dropped_unreported += 1
+            return
+
+        # report dropped records once there is space in the queue again
+        if self._dropped_unreported:
+            with self._dropped_lock:
+                count, self._dropped_unreported = self._dropped_unreported, 0
+            if count:
+                with contextlib.suppress(queue.Full):
+                    self.queue.put_nowait(  # type: ignore
+                        logging.makeLogRecord(
+                            {
+                                'levelname': 'WARNING',
+                                'levelno': logging.WARNING,
+                                'msg': f'feature=logger, event=records-dropped, count={count}',
+                                'name': record.name,
+                            }
+                        )
+                    )
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Prepare a lightweight copy of the record for the queue."""
+        record = copy.copy(record)
+
+        # capture the thread context, the record is handled in the listener thread
+        if not hasattr(record, 'trigger_id'):
+            record.trigger_id = current_trigger_id()
+
+        # merge the args so mutable args can't change before the record is handled
+        record.msg = record.getMessage()
+        record.args = None
+
+        # traceback objects hold references to frames, render them on the calling thread
+        if record.exc_info:
+            record.exc_text = record.exc_text or _exc_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+class _FlushMarker:
+    """Queue item that is set once the records enqueued before it are handled."""
+
+    __slots__ = ('handled',)
+
+    def __init__(self):
+        """Initialize instance properties."""
+        self.handled = threading.Event()
+
+
+class QueueListenerCustom(QueueListener):
+    """Logger listener that handles records from a QueueHandlerCustom in a background thread.
+
+    Filters added to the listener (e.g., SensitiveFilter) are applied in the listener
+    thread before the record is passed to the handlers.
+    """
+
+    def __init__(self, log_queue: queue.Queue, *handlers: logging.Handler):
+        """Initialize instance properties."""
+        super().__init__(log_queue, *handlers, respect_handler_level=True)
+        self.filters: list[logging.Filter] = []
+        self.thread_name = 'tcex-log-listener'
+
+    def add_handler(self, handler: logging.Handler):
+        """Add a handler to the listener."""
+        self.handlers = (*self.handlers, handler)
+
+    def remove_handler(self, handler: logging.Handler):
+        """Remove a handler from the listener."""
+        self.handlers = tuple(h for h in self.handlers if h is not handler)
+
+    def handle(self, record: logging.LogRecord):
+        """Apply the listener filters and pass the record to the handlers."""
+        if isinstance(record, _FlushMarker):
+            record.handled.set()
+            return
+
+        for filter_ in self.filters:
+            filter_.filter(record)
+        super().handle(record)
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Wait for the queued records to be handled and flush the handlers.
+
+        A marker is enqueued and the wait ends once the listener reaches it, so records
+        logged by other threads during the flush don't extend the wait. The wait is bounded
+        by timeout in case the listener thread has died.
+
+        Args:
+            timeout: The maximum seconds to wait for space in the queue and for the marker.
+
+        Returns:
+            bool: False if the queued records were not handled within the timeout.
+        """
+        handled = True
+        if self._thread is not None and self._thread.is_alive():  # type: ignore
+            marker = _FlushMarker()
+            try:
+                self.queue.put(marker, timeout=timeout)  # type: ignore
+                handled = marker.handled.wait(timeout)
+            except queue.Full:
+                handled = False
+        for handler in self.handlers:
+            handler.flush()
+        return handled
+
+    def start(self):
+        """Start the listener thread with a descriptive name."""
+        super().start()
+        self._thread.name = self.thread_name  # type: ignore
+
+    def stop(self, timeout: float = 5.0):
+        """Stop the listener thread once the queued records are handled.
+
+        Args:
+            timeout: The maximum seconds to wait for space in the queue and for the thread.
+        """
+        if self._thread is not None:  # type: ignore
+            with contextlib.suppress(queue.Full):
+                self.queue.put(self._sentinel, timeout=timeout)  # type: ignore
+            self._thread.join(timeout)  # type: ignore
+            self._thread = None
@@ -0,0 +1,131 @@
+"""TcEx Framework Module"""
+
+# standard library
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+
+@dataclass
+class _Bucket:
+    """Token bucket state for a single message template."""
+
+    tokens: float
+    updated: float
+    logger_name: str
+    message: str
+    suppressed: int = 0
+
+
+class RateLimitFilter(logging.Filter):
+    """Log event rate limiting and deduplication filter.
+
+    Records are grouped by message template, the caller location (file and line) and the
+    unformatted message, so f-string messages logged in a loop share a single bucket. Each
+    template has a token bucket allowing **burst** records followed by **rate** records per
+    second. Suppressed records are counted and reported with a "suppressed-messages" summary
+    every **summary_interval** seconds. Records above **max_level** are never suppressed.
+
+    .. code-block:: python
+        :linenos:
+        :lineno-start: 1
+
+        tcex.logger.add_rate_limit_filter(rate=1.0, burst=20)
+
+    Args:
+        rate: The number of records per second allowed per message template.
+        burst: The number of records allowed before rate limiting starts.
+        summary_interval: The number of seconds between summaries of suppressed records.
+        max_level: The highest level that is rate limited.
+    """
+
+    def __init__(
+        self,
+        rate: float = 10.0,
+        burst: int = 100,
+        summary_interval: float = 60.0,
+        max_level: int = logging.WARNING,
+    ):
+        """Initialize instance properties."""
+        super().__init__()
+        self.burst = burst
+        self.max_level = max_level
+        self.rate = rate
+        self.summary_interval = summary_interval
+
+        # properties
+        self._buckets: dict[tuple, _Bucket] = {}
+        self._lock = threading.Lock()
+        self._next_summary = time.monotonic() + summary_interval
+
+    @staticmethod
+    def _key(record: logging.LogRecord) -> tuple:
+        """Return the message template key for the record."""
+        # for f-string messages the msg differs for every record, the caller location
+        # identifies the template. for messages with args the msg is the template.
+        template = record.msg if record.args else None
+        return (record.pathname, record.lineno, record.levelno, template)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Return False if the record should be suppressed."""
+        if record.levelno > self.max_level or getattr(record, 'rate_limit_summary', False):
+            return True
+
+        now = time.monotonic()
+        key = self._key(record)
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = _Bucket(
+                    tokens=self.burst,
+                    updated=now,
+                    logger_name=record.name,
+                    message=str(record.msg)[:200],
+                )
+            else:
+                bucket.tokens = min(self.burst, bucket.tokens + (now - bucket.updated) * self.rate)
+                bucket.updated = now
+
+            allowed = bucket.tokens >= 1
+            if allowed:
+                bucket.tokens -= 1
+            else:
+                bucket.suppressed += 1
+
+        if now >= self._next_summary:
+            self.emit_summaries()
+        return allowed
+
+    def emit_summaries(self):
+        """Log a summary for each message template with suppressed records."""
+        now = time.monotonic()
+        summaries = []
+        with self._lock:
+            self._next_summary = now + self.summary_interval
+            for key, bucket in list(self._buckets.items()):
+                if bucket.suppressed:
+                    summaries.append((key, bucket.logger_name, bucket.message, bucket.suppressed))
+                    bucket.suppressed = 0
+                elif now - bucket.updated > self.summary_interval:
+                    # forget idle templates so the buckets don't grow unbounded
+                    del self._buckets[key]
+
+        for (pathname, lineno, _, _), logger_name, message, suppressed in summaries:
+            summary = logging.makeLogRecord(
+                {
+                    'filename': Path(pathname).name,
+                    'levelname': 'WARNING',
+                    'levelno': logging.WARNING,
+                    'lineno': lineno,
+                    'msg': (
+                        f'feature=logger, event=suppressed-messages, count={suppressed}, '
+                        f'message="{message}"'
+                    ),
+                    'name': logger_name,
+                    'pathname': pathname,
+                    'rate_limit_summary': True,
+                }
+            )
+            logging.getLogger(logger_name).handle(summary)
@@ -2,14 +2,25 @@
 
 # standard library
 import gzip
+import itertools
 import os
 import shutil
+import sys
+import threading
+import traceback
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
 
 
 class RotatingFileHandlerCustom(RotatingFileHandler):
-    """Logger handler for ThreatConnect Exchange File logging."""
+    """Logger handler for ThreatConnect Exchange File logging.
+
+    On rollover the log file is renamed and handed off to a background compressor thread,
+    the thread that triggered the rollover continues logging to a new file immediately.
+    The compressor gzips the file and then rotates the backups, so the backup count is
+    enforced after compression completes.
+    """
 
     def __init__(
         self,
@@ -19,6 +30,8 @@ class RotatingFileHandlerCustom(RotatingFileHandler):
         backupCount: int = 0,  # noqa: N803
         encoding: str | None = None,
         delay: bool = False,
+        *,
+        compress_level: int = 9,
     ):
         """Customize RotatingFileHandler to create full log path.
 
@@ -29,6 +42,7 @@ class RotatingFileHandlerCustom(RotatingFileHandler):
             backupCount: The maximum # of backup files.
             encoding: The log file encoding.
             delay: If True, then file opening is deferred until the first call to emit().
+            compress_level: The gzip compression level (1 is fastest, 9 is smallest).
         """
         if encoding is None and os.getenv('LANG') is None:
             encoding = 'UTF-8'
@@ -36,9 +50,71 @@ class RotatingFileHandlerCustom(RotatingFileHandler):
         Path(filename).parent.mkdir(parents=True, exist_ok=True)
         RotatingFileHandler.__init__(self, filename, mode, maxBytes, backupCount, encoding, delay)
 
-        # set namer
+        # set namer, doRollover hands the file to the compressor so no rotator is set
         self.namer = self.custom_gzip_namer
-        self.rotator = self.custom_gzip_rotator
+
+        # properties
+        self.compress_level = compress_level
+        self._compressor: ThreadPoolExecutor | None = None
+        self._compressor_lock = threading.Lock()
+        self._pending: Future | None = None
+        self._pending_count = itertools.count(1)
+
+    def _compress_and_rotate(self, pending: str):
+        """Compress a rolled over log file and rotate the backups (compressor thread)."""
+        try:
+            pending_gz = f'{pending}.gz'
+            self.custom_gzip_rotator(pending, pending_gz, compress_level=self.compress_level)
+
+            # shift the backups, the oldest backup is replaced
+            for i in range(self.backupCount - 1, 0, -1):
+                sfn = Path(self.rotation_filename(f'{self.baseFilename}.{i}'))
+                if sfn.exists():
+                    sfn.replace(self.rotation_filename(f'{self.baseFilename}.{i + 1}'))
+            Path(pending_gz).replace(self.rotation_filename(f'{self.baseFilename}.1'))
+        except Exception:  # pragma: no cover
+            # the uncompressed file is left in place so no log events are lost
+            traceback.print_exc(file=sys.stderr)
+
+    def close(self):
+        """Close the handler after all pending compressions complete."""
+        super().close()
+        self.wait_for_compression()
+        with self._compressor_lock:
+            if self._compressor is not None:
+                self._compressor.shutdown(wait=True)
+                self._compressor = None
+
+    def doRollover(self):  # noqa: N802
+        """Rename the log file and hand it off to the background compressor."""
+        if self.stream:
+            self.stream.close()
+            self.stream = None  # type: ignore
+
+        if self.backupCount > 0 and Path(self.baseFilename).exists():
+            # the pending name is unique so a new rollover can't collide with a pending one
+            pending = f'{self.baseFilename}.{os.getpid()}-{next(self._pending_count)}.rotating'
+            Path(self.baseFilename).replace(pending)
+            with self._compressor_lock:
+                if self._compressor is None:
+                    # a single worker keeps the rotation of the backups in order
+                    self._compressor = ThreadPoolExecutor(
+                        max_workers=1, thread_name_prefix='tcex-log-compressor'
+                    )
+                self._pending = self._compressor.submit(self._compress_and_rotate, pending)
+
+        if not self.delay:
+            self.stream = self._open()
+
+    def wait_for_compression(self, timeout: float | None = None):
+        """Wait for pending compressions of rolled over log files to complete.
+
+        Args:
+            timeout: The maximum number of seconds to wait.
+        """
+        pending = self._pending
+        if pending is not None:
+            wait([pending], timeout=timeout)
 
     @staticmethod
     def custom_gzip_namer(name):
@@ -50,14 +126,18 @@ class RotatingFileHandlerCustom(RotatingFileHandler):
         return name + '.gz'
 
     @staticmethod
-    def custom_gzip_rotator(source: str, dest: str):
+    def custom_gzip_rotator(source: str, dest: str, compress_level: int = 9):
         """Rotate and compress log file.
 
         Args:
             source: The source filename.
             dest: The destination filename.
+            compress_level: The gzip compression level (1 is fastest, 9 is smallest).
         """
         source_filename = Path(source)
-        with source_filename.open(mode='rb') as f_in, gzip.open(dest, 'wb') as f_out:
+        with (
+            source_filename.open(mode='rb') as f_in,
+            gzip.open(dest, 'wb', compresslevel=compress_level) as f_out,
+        ):
             shutil.copyfileobj(f_in, f_out)
         source_filename.unlink()
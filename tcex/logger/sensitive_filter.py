@@ -2,35 +2,67 @@
 
 # standard library
 import logging
+import re
 from threading import Lock
 
 
 class SensitiveFilter(logging.Filter):
-    """Sensitive Log Filter"""
+    """Sensitive Log Filter
+
+    All registered values are matched with a single compiled alternation pattern. The
+    pattern is rebuilt on the first replace after a new value is added, reads of an
+    already built pattern don't take the lock.
+    """
 
     def __init__(self, name=''):
         """Plug in a new filter to an existing formatter"""
         super().__init__(name)
         self._sensitive_registry = set()
         self._lock = Lock()
+        self._pattern: re.Pattern | None = None
+
+    def _compile(self) -> re.Pattern:
+        """Return the pattern for all registered values, building it when required."""
+        with self._lock:
+            if self._pattern is None:
+                # longest values first so a value containing another value is fully replaced
+                values = sorted(self._sensitive_registry, key=len, reverse=True)
+                self._pattern = re.compile('|'.join(re.escape(v) for v in values))
+            return self._pattern
 
     def add(self, value: str):
         """Add sensitive value to registry."""
         if value:
+            value = str(value)
             with self._lock:
                 # don't add empty string
-                self._sensitive_registry.add(str(value))
+                if value not in self._sensitive_registry:
+                    self._sensitive_registry.add(value)
+                    self._pattern = None
 
     def filter(self, record: logging.LogRecord) -> bool:
         """Filter the record"""
+        if not self._sensitive_registry:
+            # nothing to replace, leave the message to be merged by the formatter
+            return True
+
         # have to sniff the msg and args values of the LogRecord
         record.msg = self.replace(record.getMessage())
         record.args = {}
+
+        # structured fields are rendered separately by structured formatters
+        fields = getattr(record, 'fields', None)
+        if fields:
+            record.fields = {  # type: ignore
+                k: v if isinstance(v, bool | int | float | None) else self.replace(str(v))
+                for k, v in fields.items()
+            }
         return True
 
     def replace(self, obj: str):
         """Replace any sensitive data in the object if its a string"""
-        with self._lock:
-            for replacement in self._sensitive_registry:
-                obj = obj.replace(replacement, '***')
-        return obj
+        if not self._sensitive_registry:
+            return obj
+
+        pattern = self._pattern or self._compile()
+        return pattern.sub('***', obj)
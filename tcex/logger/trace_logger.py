@@ -1,31 +1,121 @@
 """TcEx Framework Module"""
 
 # standard library
+import io
 import logging
-from inspect import getframeinfo, stack
+import os
+import sys
+import traceback
+from types import CodeType
 
 # Create trace logging level
 logging.TRACE = logging.DEBUG - 5  # type: ignore
 logging.addLevelName(logging.TRACE, 'TRACE')  # type: ignore
 
+# frames from these files are logging wrappers (e.g., Logger.info, TraceLogger.trace) and are
+# skipped when resolving the caller of a log event.
+_skip_files: set[str] = {
+    os.path.normcase(logging.addLevelName.__code__.co_filename),
+    os.path.normcase(__file__),
+}
+
+# cache of code object -> (filename, function name, skip) for caller resolution
+_code_cache: dict[CodeType, tuple[str, str, bool]] = {}
+
+
+def _code_info(code: CodeType) -> tuple[str, str, bool]:
+    """Return the filename, function name, and skip flag for a code object."""
+    info = _code_cache.get(code)
+    if info is None:
+        skip = os.path.normcase(code.co_filename) in _skip_files
+        info = _code_cache[code] = (code.co_filename, code.co_name, skip)
+    return info
+
+
+class LogFields:
+    """Lazy key/value rendering of structured log fields (e.g., feature=token, event=renew).
+
+    The fields are only rendered when the log message is formatted.
+    """
+
+    __slots__ = ('fields',)
+
+    def __init__(self, fields: dict):
+        """Initialize instance properties."""
+        self.fields = fields
+
+    def __str__(self) -> str:
+        """Return the fields as comma separated key=value pairs."""
+        return ', '.join(f'{k}={v}' for k, v in self.fields.items())
+
 
 class TraceLogger(logging.Logger):
     """Add trace level to logging"""
 
+    # the tcex Logger keeps the logger level at TRACE and filters with the handler levels,
+    # trace_enabled is True if any handler handles TRACE events (set by Logger)
+    trace_enabled: bool = True
+
+    @staticmethod
+    def add_skip_file(filename: str):
+        """Add a file containing logging wrapper methods to skip during caller resolution.
+
+        Args:
+            filename: The filename of the module (e.g., __file__).
+        """
+        _skip_files.add(os.path.normcase(filename))
+        _code_cache.clear()
+
     # supports updated call for Python 3.8
-    def findCaller(self, stack_info=False, stacklevel=1) -> tuple:  # noqa: ARG002, N802
-        """Find the caller for the current log event."""
+    def findCaller(self, stack_info=False, stacklevel=1) -> tuple:  # noqa: N802
+        """Find the caller for the current log event.
+
+        Walks the frames with sys._getframe instead of inspect.stack(), which would
+        materialize every frame and read the source lines for each log event.
+        """
+        frame = sys._getframe(1)  # noqa: SLF001
         caller = None
-        depth = 3
-        max_depth = 6
-        while True:
-            # search for the correct calling method
-            caller = getframeinfo(stack()[depth][0])
-            if caller.function != 'trace' or depth >= max_depth:
-                break
-            depth += 1
-
-        return (caller.filename, caller.lineno, caller.function, None)
+        while frame is not None:
+            caller = _code_info(frame.f_code)
+            if not caller[2]:
+                stacklevel -= 1
+                if stacklevel <= 0:
+                    break
+            frame = frame.f_back
+
+        if frame is None or caller is None:  # pragma: no cover
+            return '(unknown file)', 0, '(unknown function)', None
+
+        sinfo = None
+        if stack_info:
+            with io.StringIO() as sio:
+                sio.write('Stack (most recent call last):\n')
+                traceback.print_stack(frame, file=sio)
+                sinfo = sio.getvalue().rstrip('\n')
+
+        return (caller[0], frame.f_lineno, caller[1], sinfo)
+
+    def log_fields(self, level: int, /, **fields):
+        """Log a structured event.
+
+        The fields are added to the record (record.fields) for structured formatters
+        (e.g., JsonFormatter) and are rendered as key=value pairs for text formatters,
+        values are only formatted when a handler emits the record.
+
+        .. code-block:: python
+            :linenos:
+            :lineno-start: 1
+
+            self.log.log_fields(
+                logging.DEBUG, feature='token', event='renewed', key=key
+            )
+
+        Args:
+            level: The logging level.
+            **fields: The key/value fields of the event.
+        """
+        if self.isEnabledFor(level):
+            self._log(level, '%s', (LogFields(fields),), extra={'fields': fields})
 
     def trace(self, msg, *args, **kwargs):
         """Set trace logging level."""
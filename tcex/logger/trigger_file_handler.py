@@ -0,0 +1,124 @@
+"""TcEx Framework Module"""
+
+# standard library
+import logging
+from collections import OrderedDict
+from pathlib import Path
+
+# first-party
+from tcex.app.service_context import current_trigger_id
+from tcex.logger.rotating_file_handler_custom import RotatingFileHandlerCustom
+
+
+class TriggerFileHandler(logging.Handler):
+    """Logger handler that routes records to a log file per trigger.
+
+    The trigger id is taken from the record (set by QueueHandlerCustom) or from the
+    current thread (set by CommonService.service_thread) or asyncio service task. Records
+    without a trigger id are ignored. Each trigger logfile is written by a rotating file
+    handler, the open handlers are kept in a bounded LRU, the least recently used handler is
+    closed when **max_open** is exceeded and reopened in append mode when required again.
+
+    Args:
+        path: The path for the trigger logfiles.
+        filename_template: The logfile name template, formatted with the trigger_id.
+        max_open: The maximum number of open logfiles.
+        encoding: The logfile encoding.
+        max_bytes: The max logfile size before rotating (0 disables rotation).
+        backup_count: The maximum # of backup files per trigger.
+    """
+
+    def __init__(
+        self,
+        path: Path | str,
+        filename_template: str = 'trigger-id-{trigger_id}.log',
+        max_open: int = 128,
+        encoding: str = 'utf-8',
+        *,
+        max_bytes: int = 0,
+        backup_count: int = 0,
+    ):
+        """Initialize instance properties."""
+        super().__init__()
+        self.backup_count = backup_count
+        self.encoding = encoding
+        self.filename_template = filename_template
+        self.max_bytes = max_bytes
+        self.max_open = max_open
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+
+        # properties
+        self._handlers: OrderedDict[str, RotatingFileHandlerCustom] = OrderedDict()
+
+    @staticmethod
+    def _trigger_id(record: logging.LogRecord) -> str | None:
+        """Return the trigger id for the record."""
+        trigger_id = getattr(record, 'trigger_id', None)
+        if trigger_id is None:
+            trigger_id = current_trigger_id()
+
+        # service threads without a trigger have the trigger id "None"
+        if trigger_id in (None, 'None'):
+            return None
+        return str(trigger_id)
+
+    def _handler(self, trigger_id: str) -> RotatingFileHandlerCustom:
+        """Return the open handler for the trigger (handler lock must be held)."""
+        handler = self._handlers.get(trigger_id)
+        if handler is not None:
+            self._handlers.move_to_end(trigger_id)
+            return handler
+
+        filename = self.path / self.filename_template.format(trigger_id=trigger_id)
+        handler = RotatingFileHandlerCustom(
+            str(filename),
+            maxBytes=self.max_bytes,
+            backupCount=self.backup_count,
+            encoding=self.encoding,
+        )
+        self._handlers[trigger_id] = handler
+
+        while len(self._handlers) > self.max_open:
+            _, oldest_handler = self._handlers.popitem(last=False)
+            oldest_handler.close()
+        return handler
+
+    def close(self):
+        """Close all open handlers."""
+        with self.lock:  # type: ignore
+            for handler in self._handlers.values():
+                handler.close()
+            self._handlers.clear()
+        super().close()
+
+    def close_trigger(self, trigger_id: int | str):
+        """Close the open handler for a trigger (e.g., when the trigger config is deleted).
+
+        Args:
+            trigger_id: The trigger id.
+        """
+        with self.lock:  # type: ignore
+            handler = self._handlers.pop(str(trigger_id), None)
+            if handler is not None:
+                handler.close()
+
+    def emit(self, record: logging.LogRecord):
+        """Write the record to the logfile of the trigger."""
+        trigger_id = self._trigger_id(record)
+        if trigger_id is None:
+            return
+
+        try:
+            handler = self._handler(trigger_id)
+            handler.setFormatter(self.formatter)
+            # the rotating handler checks for rollover before the record is written
+            handler.emit(record)
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        """Flush all open handlers."""
+        with self.lock:  # type: ignore
+            for handler in self._handlers.values():
+                handler.flush()
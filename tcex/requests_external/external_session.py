@@ -2,6 +2,7 @@
 
 # standard library
 import contextlib
+import itertools
 import logging
 import time
 from collections.abc import Callable
@@ -9,7 +10,7 @@ from typing import ClassVar
 
 # third-party
 import urllib3
-from requests import Response, Session, adapters, exceptions
+from requests import PreparedRequest, Response, Session, adapters, exceptions
 from requests.adapters import DEFAULT_POOLBLOCK, DEFAULT_POOLSIZE, DEFAULT_RETRIES
 from urllib3.util.retry import Retry
 
@@ -116,6 +117,33 @@ class CustomAdapter(adapters.HTTPAdapter):
         self._rate_limit_handler = rate_limit_handler
 
 
+class CurlLog:
+    """Lazy curl command rendering for logging.
+
+    The request is only converted to a curl command when the log message is formatted.
+    """
+
+    __slots__ = ('request', 'session')
+
+    def __init__(self, session: 'ExternalSession', request: PreparedRequest):
+        """Initialize instance properties."""
+        self.request = request
+        self.session = session
+
+    def __str__(self) -> str:
+        """Return the request as a curl command."""
+        with contextlib.suppress(Exception):
+            return self.session.requests_to_curl.convert(
+                self.request,
+                mask_body=self.session.mask_body,
+                mask_headers=self.session.mask_headers,
+                mask_patterns=self.session.mask_patterns,
+                proxies=self.session.proxies,
+                verify=self.session.verify,
+            )
+        return 'feature=external-session, event=curl-conversion-failed'
+
+
 class ExternalSession(Session):
     """ThreatConnect REST API Requests Session for external requests
 
@@ -153,7 +181,10 @@ class ExternalSession(Session):
         self.util = Util()
 
         # properties
+        self._curl_counter = itertools.count(1)
         self._log_curl: bool = False
+        self._log_curl_latency_threshold: float | None = None
+        self._log_curl_sample_rate = 1
         self._mask_body = False
         self._mask_headers = True
         self._mask_patterns = None
@@ -185,6 +216,42 @@ class ExternalSession(Session):
         """Enable or disable logging curl commands."""
         self._log_curl = log_curl
 
+    @property
+    def log_curl_latency_threshold(self) -> float | None:
+        """Return the minimum elapsed seconds for failed requests to be logged as a curl command."""
+        return self._log_curl_latency_threshold
+
+    @log_curl_latency_threshold.setter
+    def log_curl_latency_threshold(self, threshold: float | None):
+        """Set the minimum elapsed seconds for failed requests to be logged (None logs all)."""
+        self._log_curl_latency_threshold = threshold
+
+    @property
+    def log_curl_sample_rate(self) -> int:
+        """Return the sample rate for logging requests as a curl command (every Nth request)."""
+        return self._log_curl_sample_rate
+
+    @log_curl_sample_rate.setter
+    def log_curl_sample_rate(self, sample_rate: int):
+        """Set the sample rate for logging requests as a curl command (every Nth request)."""
+        if sample_rate < 1:
+            ex_msg = f'Invalid sample rate ({sample_rate}), must be 1 or greater.'
+            raise ValueError(ex_msg)
+        self._log_curl_sample_rate = sample_rate
+
+    def _should_log_curl(self, response: Response) -> bool:
+        """Return True if the request should be logged as a curl command."""
+        if not response.ok:
+            # failed requests are always logged unless faster than the latency threshold
+            threshold = self.log_curl_latency_threshold
+            return threshold is None or response.elapsed.total_seconds() >= threshold
+
+        if self.log_curl:
+            # log every Nth request (next on itertools.count is thread-safe)
+            return next(self._curl_counter) % self.log_curl_sample_rate == 0
+
+        return False
+
     @property
     def mask_body(self) -> bool:
         """Return property"""
@@ -289,24 +356,17 @@ class ExternalSession(Session):
             kwargs['tc_is_retry'] = True
             return self.request(method, url, **kwargs)
 
-        # APP-79 - adding logging of request as curl commands
-        if not response.ok or self.log_curl:
-            with contextlib.suppress(Exception):
-                self.log.debug(
-                    self.requests_to_curl.convert(
-                        response.request,
-                        mask_body=self.mask_body,
-                        mask_headers=self.mask_headers,
-                        mask_patterns=self.mask_patterns,
-                        proxies=self.proxies,
-                        verify=self.verify,
-                    )
-                )
-
-        self.log.debug(
-            f'feature=external-session, request-url={response.request.url}, '
-            f'status_code={response.status_code}, elapsed={response.elapsed}'
-        )
+        if self.log.isEnabledFor(logging.DEBUG):
+            # APP-79 - adding logging of request as curl commands (converted only when formatted)
+            if self._should_log_curl(response):
+                self.log.debug('%s', CurlLog(self, response.request))
+
+            self.log.debug(
+                'feature=external-session, request-url=%s, status_code=%s, elapsed=%s',
+                response.request.url,
+                response.status_code,
+                response.elapsed,
+            )
 
         return response
 
@@ -126,7 +126,7 @@ class TcEx:
                 level=self.inputs.model_tc.tc_log_level,
             )
 
-        # add rotating log handler
+        # add rotating log handler (optionally with structured JSON log events)
         _logger.add_rotating_file_handler(
             name='rfh',
             filename=self.inputs.model_tc.tc_log_file,
@@ -134,8 +134,22 @@ class TcEx:
             backup_count=self.inputs.model_tc.tc_log_backup_count,
             max_bytes=self.inputs.model_tc.tc_log_max_bytes,
             level=self.inputs.model_tc.tc_log_level,
+            formatter=(
+                _logger.json_formatter if self.inputs.model_tc.tc_log_format == 'json' else None
+            ),
         )
 
+        # optionally rate limit repeated log events (events per second per message)
+        if self.inputs.model_tc.tc_log_rate_limit is not None:
+            _logger.add_rate_limit_filter(rate=self.inputs.model_tc.tc_log_rate_limit)
+
+        # optionally move log handling to a background thread
+        if self.inputs.model_tc.tc_log_queue is True:
+            _logger.add_queue_handler(
+                queue_size=self.inputs.model_tc.tc_log_queue_size,
+                full_policy=self.inputs.model_tc.tc_log_queue_full_policy,
+            )
+
         # set logging level
         _logger.update_handler_level(level=self.inputs.model_tc.tc_log_level)
         _logger.log.setLevel(_logger.log_level(self.inputs.model_tc.tc_log_level))
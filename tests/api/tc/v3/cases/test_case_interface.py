@@ -112,6 +112,22 @@ class TestCases(TestV3):
 
         self.v3_helper._associations(case, case_2, case_3, association_data)
 
+    def test_case_preloaded_sublists_same_type(self):
+        """Test preloaded sublists that share a model type are kept per field."""
+        case = self.v3.case(id=1)
+        case._preload_sublists(  # noqa: SLF001
+            {
+                'associatedCases': {'data': [{'id': 2, 'name': 'MyCase-Associated'}]},
+                'related': {'data': [{'id': 3, 'name': 'MyCase-Related'}]},
+            },
+            ['associatedCases', 'related'],
+        )
+
+        # the preloaded data is used, the session is never called
+        case._session = None  # type: ignore
+        cases = [c.model.name for c in case.associated_cases]
+        assert cases == ['MyCase-Associated'], f'Invalid cases ({cases}) retrieved'
+
     def test_case_create_and_retrieve_nested_types(self, request: FixtureRequest):
         """Test Object Creation
 
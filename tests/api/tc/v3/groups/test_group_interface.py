@@ -216,6 +216,96 @@ class TestGroups(TestV3):
         ), f'Invalid amount of Victim Assets ({found_victim_assets}) retrieved'
         assert staged_victim_asset_found, 'Newly staged victim asset not retrieved'
 
+    def test_group_bulk_load_sublists(self, request: pytest.FixtureRequest):
+        """Test loading nested sublists for multiple groups in a single request."""
+        group_1 = self.v3_helper.create_group(name='BulkGroup-01', tags={'name': request.node.name})
+        group_2 = self.v3_helper.create_group(name='BulkGroup-02', tags={'name': request.node.name})
+
+        groups = [self.v3.group(id=group_1.model.id), self.v3.group(id=group_2.model.id)]
+        self.v3.groups().bulk_load_sublists(groups, ['tags'], chunk_size=1)
+
+        for group in groups:
+            # the preloaded data is used, the session is never called
+            group._session = None  # type: ignore
+            tags = [tag.model.name for tag in group.tags]
+            assert tags == [request.node.name], f'Invalid tags ({tags}) retrieved'
+
+    def test_group_bulk_operation(self, request: pytest.FixtureRequest):
+        """Test bulk create and delete of groups."""
+        tags = {'name': request.node.name}
+        groups = [
+            self.v3.group(name=f'BulkGroup-{i:02}', type='Adversary', tags=tags) for i in range(5)
+        ]
+        # a group without an id can not be deleted
+        invalid_group = self.v3.group(name='BulkGroup-Invalid', type='Adversary')
+
+        results = self.v3.bulk(max_workers=3).create(groups)
+        assert [r.obj for r in results] == groups, 'Results not returned in order'
+        assert all(r.success for r in results), 'Bulk create failed'
+        assert all(g.model.id is not None for g in groups), 'Group ids not updated'
+
+        results = self.v3.bulk(max_workers=3).delete([*groups, invalid_group])
+        assert all(r.success for r in results[:-1]), 'Bulk delete failed'
+        assert results[-1].success is False
+        assert isinstance(results[-1].error, RuntimeError)
+
+    def test_group_count_exists_first(self, request: pytest.FixtureRequest):
+        """Test count, exists, and first on a filtered collection."""
+        group = self.v3_helper.create_group(name='CountGroup-01', tags={'name': request.node.name})
+
+        groups = self.v3.groups()
+        groups.filter.tag(TqlOperator.EQ, request.node.name)
+        assert groups.count() == 1
+        assert len(groups) == 1
+        assert groups.exists() is True
+        first = groups.first()
+        assert first is not None
+        assert first.model.id == group.model.id
+        assert 'resultLimit' not in groups.params
+
+        # count is cached, len is not (and refreshes the cached count)
+        self.v3_helper.create_group(name='CountGroup-02', tags={'name': request.node.name})
+        assert groups.count() == 1
+        assert len(groups) == 2
+        assert groups.count() == 2
+
+        # changing the filters invalidates the cached results
+        groups.filter.name(TqlOperator.EQ, 'CountGroup-Missing')
+        assert groups.count() == 0
+        assert groups.exists() is False
+        assert groups.first() is None
+
+    def test_group_object_cache(self, request: pytest.FixtureRequest):
+        """Test the read-through cache for single group GET requests."""
+        group = self.v3_helper.create_group(name='CacheGroup-01', tags={'name': request.node.name})
+
+        self.v3.object_cache.enable(max_size=10, ttl=60)
+        try:
+            self.v3.group(id=group.model.id).get()
+            cached_group = self.v3.group(id=group.model.id)
+            cached_group.get()
+            assert cached_group.model.name == 'CacheGroup-01'
+            assert self.v3.object_cache.stats['hits'] == 1
+            assert self.v3.object_cache.stats['misses'] == 1
+
+            # update invalidates the cached response
+            cached_group.model.name = 'CacheGroup-02'
+            cached_group.update()
+            updated_group = self.v3.group(id=group.model.id)
+            updated_group.get()
+            assert updated_group.model.name == 'CacheGroup-02'
+            assert self.v3.object_cache.stats['misses'] == 2
+        finally:
+            self.v3.object_cache.disable()
+
+    def test_group_fields_cache(self):
+        """Test OPTIONS field data is shared between object instances."""
+        fields = self.v3.group().fields
+        assert fields, 'No fields retrieved'
+
+        # the second instance uses the process-wide cache instead of a new OPTIONS request
+        assert self.v3.group().fields is fields
+
     def test_group_create_and_retrieve_nested_types(self):
         """Test Object Creation
 
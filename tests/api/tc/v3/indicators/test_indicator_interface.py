@@ -175,6 +175,22 @@ class TestIndicators(TestV3):
 
         indicator.delete()
 
+    def test_indicator_preloaded_sublists_same_type(self):
+        """Test preloaded sublists that share a model type are kept per field."""
+        indicator = self.v3.indicator(id=1)
+        indicator._preload_sublists(  # noqa: SLF001
+            {
+                'associatedIndicators': {'data': [{'id': 2, 'summary': '43.24.65.50'}]},
+                'customAssociations': {'data': [{'id': 3, 'summary': '43.24.65.51'}]},
+            },
+            ['associatedIndicators', 'customAssociations'],
+        )
+
+        # the preloaded data is used, the session is never called
+        indicator._session = None  # type: ignore
+        summaries = [i.model.summary for i in indicator.associated_indicators]
+        assert summaries == ['43.24.65.50'], f'Invalid indicators ({summaries}) retrieved'
+
     @pytest.mark.xfail(reason='Verify TC Version running against.')
     def test_artifact_associations(self):
         """Test snippet"""
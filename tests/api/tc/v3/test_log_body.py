@@ -0,0 +1,46 @@
+"""TcEx Framework Module"""
+
+# third-party
+from requests import Response
+
+# first-party
+from tcex.api.tc.v3.log_body import LogBody
+
+
+class TestLogBody:
+    """Test Module"""
+
+    @staticmethod
+    def _response(content: bytes, content_type: str, consumed: bool = True) -> Response:
+        """Return a response with the provided content."""
+        response = Response()
+        response.headers['Content-Type'] = content_type
+        response.encoding = 'utf-8'
+        response._content = content if consumed else False  # noqa: SLF001
+        response._content_consumed = consumed  # noqa: SLF001
+        return response
+
+    def test_request_body(self):
+        """Test Case"""
+        assert str(LogBody.from_request_body(None, 5)) == 'None'
+        assert str(LogBody.from_request_body('{"name": "a"}', 100)) == '{"name": "a"}'
+        assert str(LogBody.from_request_body('0123456789abc', 5)) == '01234... [truncated] ...89abc'
+        assert str(LogBody.from_request_body(b'\x00\x01', 5)) == '[binary data]'
+
+    def test_response_body(self):
+        """Test Case"""
+        response = self._response(b'{"data": "' + b'x' * 100 + b'"}', 'application/json')
+        assert str(LogBody.from_response(response, 5)) == '{"dat... [truncated] ...xxx"}'
+
+        response = self._response(b'{"data": []}', 'application/json')
+        assert str(LogBody.from_response(response, 100)) == '{"data": []}'
+
+    def test_response_body_binary(self):
+        """Test Case"""
+        response = self._response(b'%PDF-1.4', 'application/octet-stream')
+        assert str(LogBody.from_response(response, 100)) == '[binary data]'
+
+        # streamed responses are never read for logging
+        response = self._response(b'', 'application/json', consumed=False)
+        assert str(LogBody.from_response(response, 100)) == '[binary data]'
+        assert response._content is False  # noqa: SLF001
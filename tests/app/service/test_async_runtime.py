@@ -0,0 +1,129 @@
+"""TcEx Framework Module"""
+
+# standard library
+import asyncio
+import threading
+
+# first-party
+from tcex.app.service.async_runtime import AsyncKeyValueClient, AsyncRuntime, is_async_callable
+from tcex.app.service_context import current_name, current_session_id, current_trigger_id
+
+
+class MockKeyValueClient:
+    """Key-value store client that stores values in a dict."""
+
+    def __init__(self):
+        """Initialize instance properties."""
+        self.data = {}
+        self.threads = []
+
+    def create(self, context: str, key: str, value: bytes | str) -> int:
+        """Create key/value pair."""
+        self.threads.append(threading.current_thread().name)
+        self.data[(context, key)] = value
+        return 1
+
+    def read(self, context: str, key: str) -> bytes | str | None:
+        """Read the value for the key."""
+        self.threads.append(threading.current_thread().name)
+        return self.data.get((context, key))
+
+
+class TestAsyncRuntime:
+    """Test Module"""
+
+    def setup_method(self):
+        """Configure setup before each test."""
+        self.runtime = AsyncRuntime(name='pytest-async-runtime')
+
+    def teardown_method(self):
+        """Configure teardown after each test."""
+        self.runtime.stop(timeout=5)
+
+    def test_task_context(self):
+        """Test Case"""
+
+        async def _task(delay: float) -> tuple:
+            # yield to the other tasks to ensure the context is per task
+            await asyncio.sleep(delay)
+            return current_name(), current_session_id(), current_trigger_id()
+
+        futures = [
+            self.runtime.submit(
+                _task(0.01 * (3 - i)), name=f'session-{i}', session_id=f'session-{i}', trigger_id=i
+            )
+            for i in range(3)
+        ]
+
+        assert [f.result(timeout=5) for f in futures] == [
+            (f'session-{i}', f'session-{i}', str(i)) for i in range(3)
+        ]
+
+        # the context is not set outside of the tasks
+        assert current_name() == threading.current_thread().name
+        assert current_trigger_id() is None
+
+    def test_key_value_client(self):
+        """Test Case"""
+        client = MockKeyValueClient()
+        kv = AsyncKeyValueClient(client, self.runtime)
+
+        async def _task():
+            await kv.create('context', 'key', b'value')
+            # the blocking call runs with the context of the task
+            name = await self.runtime.run_sync(current_name)
+            return await kv.read('context', 'key'), name
+
+        future = self.runtime.submit(_task(), name='session-1')
+        assert future.result(timeout=5) == (b'value', 'session-1')
+        assert all(t.startswith('pytest-async-runtime-sync') for t in client.threads)
+
+    def test_schedule_periodic(self):
+        """Test Case"""
+        calls = []
+        done = threading.Event()
+
+        def _callback() -> bool:
+            calls.append(threading.current_thread().name)
+            if len(calls) == 3:  # noqa: PLR2004
+                done.set()
+                return False
+            return True
+
+        self.runtime.schedule_periodic(0.01, _callback, name='heartbeat')
+        assert done.wait(5)
+        assert calls == ['pytest-async-runtime'] * 3
+
+    def test_stop(self):
+        """Test Case"""
+
+        started = threading.Event()
+
+        async def _task():
+            started.set()
+            await asyncio.sleep(60)
+
+        self.runtime.submit(_task(), name='long-running')
+        assert started.wait(5)
+        assert self.runtime.active_tasks == 1
+
+        self.runtime.stop(timeout=5)
+        assert self.runtime.running is False
+
+    def test_is_async_callable(self):
+        """Test Case"""
+
+        class AsyncApp:
+            async def __call__(self, environ, start_response):
+                """Handle request."""
+
+        async def _async_callback():
+            """Handle request."""
+
+        def _callback():
+            """Handle request."""
+
+        assert is_async_callable(_async_callback) is True
+        assert is_async_callable(AsyncApp()) is True
+        assert is_async_callable(_callback) is False
+        assert is_async_callable(None) is False
@@ -0,0 +1,67 @@
+"""TcEx Framework Module"""
+
+# standard library
+import base64
+import io
+import json
+import os
+
+# third-party
+import pytest
+
+# first-party
+from tcex.app.service.base64_stream import Base64Stream
+
+
+class TestBase64Stream:
+    """Test Module"""
+
+    @pytest.mark.parametrize('length', [0, 1, 2, 3, 4, 100, 1001])
+    def test_read(self, length: int):
+        """Test Case"""
+        data = os.urandom(length)
+        stream = Base64Stream(base64.b64encode(data), chunk_size=8)
+
+        assert stream.size == len(data)
+        assert b''.join(iter(lambda: stream.read(5), b'')) == data
+        assert stream.read() == b''
+
+    def test_read_all(self):
+        """Test Case"""
+        data = os.urandom(1000)
+        stream = Base64Stream(base64.b64encode(data).decode(), chunk_size=16)
+
+        assert stream.read(10) + stream.read1(10) + stream.read() == data
+
+    def test_read1(self):
+        """Test Case"""
+        data = os.urandom(100)
+        stream = Base64Stream(base64.b64encode(data), chunk_size=16)
+
+        # a negative or None size returns at most one decoded chunk
+        assert b''.join(iter(lambda: stream.read1(None), b'')) == data
+        stream = Base64Stream(base64.b64encode(data), chunk_size=16)
+        assert len(stream.read1(-1)) == len(base64.b64decode(base64.b64encode(data)[:16]))
+
+    def test_line_breaks(self):
+        """Test Case"""
+        data = os.urandom(200)
+        stream = Base64Stream(base64.encodebytes(data), chunk_size=10)
+
+        assert stream.size == len(data)
+        assert stream.read() == data
+
+    def test_text_wrapper(self):
+        """Test Case"""
+        body = {'alerts': [{'id': i, 'name': f'alert-{i}'} for i in range(100)]}
+        stream = Base64Stream(base64.b64encode(json.dumps(body).encode()), chunk_size=64)
+
+        assert json.load(io.TextIOWrapper(stream, encoding='utf-8')) == body
+
+    def test_closed(self):
+        """Test Case"""
+        stream = Base64Stream(base64.b64encode(b'data'))
+        stream.close()
+
+        with pytest.raises(ValueError, match='closed'):
+            stream.read()
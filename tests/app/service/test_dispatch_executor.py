@@ -0,0 +1,162 @@
+"""TcEx Framework Module"""
+
+# standard library
+import threading
+import time
+from collections.abc import Callable
+
+# third-party
+import pytest
+
+# first-party
+from tcex.app.service.dispatch_executor import DispatchExecutor
+
+
+class TestDispatchExecutor:
+    """Test Module"""
+
+    @staticmethod
+    def _blocked_executor(
+        full_policy: str, on_reject: Callable[[], None] | None = None, **kwargs
+    ) -> tuple[DispatchExecutor, threading.Event]:
+        """Return an executor with its single worker blocked and a full queue."""
+        release = threading.Event()
+        started = threading.Event()
+
+        def _block():
+            started.set()
+            release.wait(5)
+
+        executor = DispatchExecutor(
+            name='pytest', max_workers=1, queue_size=1, full_policy=full_policy, **kwargs
+        )
+        executor.submit('blocking', _block)
+        assert started.wait(5)
+        executor.submit('queued', lambda: None, on_reject=on_reject)
+        return executor, release
+
+    def test_thread_context(self):
+        """Test Case"""
+        context = {}
+
+        def _target(value: str):
+            t = threading.current_thread()
+            context.update(
+                name=t.name,
+                session_id=t.session_id,  # type: ignore
+                trigger_id=t.trigger_id,  # type: ignore
+                value=value,
+            )
+
+        executor = DispatchExecutor(name='pytest', max_workers=2)
+        assert executor.submit(
+            'session-1', _target, args=('a',), session_id='session-1', trigger_id=5
+        )
+        executor.shutdown(wait=True, timeout=5)
+
+        assert context == {
+            'name': 'session-1',
+            'session_id': 'session-1',
+            'trigger_id': '5',
+            'value': 'a',
+        }
+        assert executor.metrics['completed'] == 1
+
+        # the worker thread context is reset after the work item
+        worker = executor._workers[0]  # noqa: SLF001
+        assert worker.name == 'pytest-worker-0'
+        assert not hasattr(worker, 'trigger_id')
+
+    def test_max_workers(self):
+        """Test Case"""
+        lock = threading.Lock()
+        counts = {'active': 0, 'max': 0}
+
+        def _target():
+            with lock:
+                counts['active'] += 1
+                counts['max'] = max(counts['max'], counts['active'])
+            threading.Event().wait(0.01)
+            with lock:
+                counts['active'] -= 1
+
+        max_workers = 3
+        work_items = 50
+        executor = DispatchExecutor(name='pytest', max_workers=max_workers, queue_size=100)
+        for i in range(work_items):
+            executor.submit(f'work-{i}', _target)
+        executor.shutdown(wait=True, timeout=5)
+
+        assert counts['max'] <= max_workers
+        assert executor.metrics['completed'] == work_items
+        assert executor.metrics['workers'] == max_workers
+
+    def test_full_policy_reject(self):
+        """Test Case"""
+        executor, release = self._blocked_executor('reject')
+
+        assert executor.submit('rejected', lambda: None) is False
+        assert executor.metrics['rejected'] == 1
+        release.set()
+        executor.shutdown(wait=True, timeout=5)
+
+    def test_full_policy_shed(self):
+        """Test Case"""
+        rejected = []
+        executor, release = self._blocked_executor('shed', on_reject=lambda: rejected.append(1))
+        ran = []
+
+        assert executor.submit('newest', ran.append, args=('newest',)) is True
+        release.set()
+        executor.shutdown(wait=True, timeout=5)
+
+        assert ran == ['newest']
+        assert executor.metrics['shed'] == 1
+
+        # the shed work item is notified so the request can be answered
+        assert rejected == [1]
+
+    def test_full_policy_queue_non_blocking(self):
+        """Test Case"""
+        rejected = []
+        executor, release = self._blocked_executor('queue', queue_timeout=30)
+
+        # the broker callback thread submits without blocking on the full queue
+        start = time.monotonic()
+        assert (
+            executor.submit(
+                'rejected', lambda: None, block=False, on_reject=lambda: rejected.append(1)
+            )
+            is False
+        )
+        assert time.monotonic() - start < 1
+        assert rejected == [1]
+        assert executor.metrics['rejected'] == 1
+        release.set()
+        executor.shutdown(wait=True, timeout=5)
+
+    def test_full_policy_queue_timeout(self):
+        """Test Case"""
+        executor, release = self._blocked_executor('queue', queue_timeout=0.05)
+
+        assert executor.submit('timeout', lambda: None) is False
+        assert executor.metrics['rejected'] == 1
+        release.set()
+        executor.shutdown(wait=True, timeout=5)
+
+    def test_target_exception(self):
+        """Test Case"""
+
+        def _target():
+            ex_msg = 'error'
+            raise RuntimeError(ex_msg)
+
+        executor = DispatchExecutor(name='pytest')
+        executor.submit('failing', _target)
+        executor.shutdown(wait=True, timeout=5)
+        assert executor.metrics['failed'] == 1
+
+    def test_invalid_policy(self):
+        """Test Case"""
+        with pytest.raises(ValueError, match='Invalid full_policy'):
+            DispatchExecutor(name='pytest', full_policy='invalid')
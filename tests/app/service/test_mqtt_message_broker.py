@@ -0,0 +1,127 @@
+"""TcEx Framework Module"""
+
+# standard library
+import logging
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+# first-party
+from tcex.app.service.mqtt_message_broker import MqttMessageBroker
+from tcex.logger.logger import Logger
+
+
+class TestMqttMessageBroker:
+    """Test Module"""
+
+    def setup_method(self):
+        """Configure setup before each test."""
+        # the MQTT client is only created (and connected) on first access
+        self.broker = MqttMessageBroker(broker_host='localhost', broker_port=1883, broker_timeout=1)
+        self.calls: list[tuple[str, str]] = []
+
+    def _callback(self, name: str):
+        """Return a callback that records the call."""
+
+        def _on_message(_client, _userdata, message):
+            self.calls.append((name, message.topic))
+
+        return _on_message
+
+    @staticmethod
+    def _message(topic: str, payload: bytes = b'{}') -> SimpleNamespace:
+        """Return a MQTT message."""
+        return SimpleNamespace(topic=topic, payload=payload)
+
+    def test_on_message_dispatch(self):
+        """Test Case"""
+        self.broker.add_on_message_callback(self._callback('any-1'))
+        self.broker.add_on_message_callback(self._callback('server'), topics=['server'])
+        self.broker.add_on_message_callback(self._callback('any-2'))
+        self.broker.add_on_message_callback(self._callback('client'), topics=['client'])
+
+        self.broker.on_message(None, None, self._message('server'))
+        self.broker.on_message(None, None, self._message('client'))
+        self.broker.on_message(None, None, self._message('other'))
+
+        assert self.calls == [
+            ('any-1', 'server'),
+            ('server', 'server'),
+            ('any-2', 'server'),
+            ('any-1', 'client'),
+            ('any-2', 'client'),
+            ('client', 'client'),
+            ('any-1', 'other'),
+            ('any-2', 'other'),
+        ]
+
+    def test_remove_on_message_callback(self):
+        """Test Case"""
+        callback = self._callback('server')
+        self.broker.add_on_message_callback(callback, topics=['server'])
+        self.broker.remove_on_message_callback(callback)
+
+        self.broker.on_message(None, None, self._message('server'))
+        assert self.calls == []
+
+    def test_on_message_payload_not_decoded(self):
+        """Test Case"""
+        self.broker.log.setLevel(logging.DEBUG)
+        self.broker.add_on_message_callback(self._callback('server'), topics=['server'])
+
+        # the payload is only decoded when TRACE logging is enabled
+        self.broker.on_message(None, None, self._message('server', payload=b'\xff'))
+        assert self.calls == [('server', 'server')]
+
+    def test_on_message_payload_not_decoded_app_logger(self, tmp_path: Path):
+        """Test Case"""
+        # configure the logger as TcEx does for an App with the INFO log level
+        logger = Logger(self.broker.log.name)
+        logger.add_cache_handler('cache')
+        logger.add_rotating_file_handler(
+            name='rfh',
+            filename='app.log',
+            path=tmp_path,
+            backup_count=0,
+            max_bytes=0,
+            level='info',
+        )
+        logger.update_handler_level('info')
+        logger.log.setLevel(logging.INFO)
+        logger.replay_cached_events(handler_name='cache')
+        try:
+            # the logger level is reset to TRACE, the handler levels filter the events
+            assert self.broker.log.isEnabledFor(logging.TRACE)  # type: ignore
+            assert self.broker.log.trace_enabled is False
+
+            payload = MagicMock()
+            self.broker.on_message(None, None, self._message('server', payload=payload))
+            assert payload.decode.called is False
+
+            logger.update_handler_level('trace')
+            assert self.broker.log.trace_enabled is True
+            self.broker.on_message(None, None, self._message('server', payload=payload))
+            assert payload.decode.called is True
+        finally:
+            logger.shutdown()
+
+    def test_wait_connected(self):
+        """Test Case"""
+        assert self.broker.wait_connected(timeout=0.01) is False
+
+        threading.Timer(0.01, self.broker.on_connect, args=(None, None, None, 0, None)).start()
+        assert self.broker.wait_connected(timeout=5) is True
+
+    def test_wait_shutdown(self):
+        """Test Case"""
+        assert self.broker.wait_shutdown(timeout=0.01) is False
+
+        def _shutdown():
+            self.broker.shutdown = True
+
+        threading.Timer(0.01, _shutdown).start()
+        assert self.broker.wait_shutdown(timeout=5) is True
+
+        # shutdown also ends the wait for the connection
+        assert self.broker.wait_connected(timeout=5) is False
@@ -0,0 +1,90 @@
+"""TcEx Framework Module"""
+
+# standard library
+import threading
+
+# first-party
+from tcex.app.service.scheduler import Scheduler
+
+
+class TestScheduler:
+    """Test Module"""
+
+    def setup_method(self):
+        """Configure setup before each test."""
+        self.scheduler = Scheduler(name='pytest-scheduler')
+
+    def teardown_method(self):
+        """Configure teardown after each test."""
+        self.scheduler.stop(timeout=5)
+
+    def test_schedule_periodic(self):
+        """Test Case"""
+        calls = []
+        done = threading.Event()
+
+        def _callback() -> bool:
+            calls.append(threading.current_thread().name)
+            if len(calls) == 3:  # noqa: PLR2004
+                done.set()
+                return False
+            return True
+
+        self.scheduler.schedule_periodic(0.01, _callback, name='heartbeat')
+        assert done.wait(5)
+        assert calls == ['pytest-scheduler'] * 3
+
+    def test_single_thread(self):
+        """Test Case"""
+        threads = set()
+        done = [threading.Event() for _ in range(3)]
+
+        def _callback(index: int):
+            threads.add(threading.current_thread().name)
+            done[index].set()
+            return False
+
+        for index in range(3):
+            self.scheduler.schedule_periodic(
+                0.01 * (index + 1), lambda index=index: _callback(index), name=f'task-{index}'
+            )
+        assert all(event.wait(5) for event in done)
+        assert threads == {'pytest-scheduler'}
+
+    def test_cancel(self):
+        """Test Case"""
+        calls = []
+        marker = threading.Event()
+
+        self.scheduler.schedule_periodic(0.05, lambda: calls.append('cancelled'), name='task')
+        self.scheduler.cancel('task')
+        self.scheduler.schedule_periodic(0.1, marker.set, name='marker')
+
+        # the cancelled task is due before the marker task
+        assert marker.wait(5)
+        assert calls == []
+
+    def test_callback_error(self):
+        """Test Case"""
+        calls = []
+        done = threading.Event()
+
+        def _callback():
+            calls.append(1)
+            if len(calls) == 1:
+                ex_msg = 'task error'
+                raise RuntimeError(ex_msg)
+            done.set()
+            return False
+
+        # errors are logged and the task keeps running
+        self.scheduler.schedule_periodic(0.01, _callback, name='task')
+        assert done.wait(5)
+
+    def test_stop(self):
+        """Test Case"""
+        self.scheduler.schedule_periodic(60, lambda: True, name='task')
+        assert self.scheduler.running is True
+
+        self.scheduler.stop(timeout=5)
+        assert self.scheduler.running is False
@@ -0,0 +1,157 @@
+"""TcEx Framework Module"""
+
+# standard library
+import threading
+
+# first-party
+from tcex.app.service.service_metrics import Histogram, MetricsRegistry, MetricsSnapshot
+
+
+class TestHistogram:
+    """Test Module"""
+
+    def test_empty(self):
+        """Test Case"""
+        assert Histogram().snapshot() == {
+            'count': 0,
+            'avg': 0,
+            'p50': 0,
+            'p95': 0,
+            'p99': 0,
+            'max': 0,
+        }
+
+    def test_percentiles(self):
+        """Test Case"""
+        histogram = Histogram(bounds=(10, 100, 1000))
+        for _ in range(90):
+            histogram.observe(5)
+        for _ in range(9):
+            histogram.observe(50)
+        histogram.observe(2000)
+
+        # percentiles report the upper bound of the bucket containing the percentile
+        assert histogram.snapshot() == {
+            'count': 100,
+            'avg': 29.0,
+            'p50': 10,
+            'p95': 100,
+            'p99': 100,
+            'max': 2000,
+        }
+
+    def test_as_metrics(self):
+        """Test Case"""
+        histogram = Histogram()
+        histogram.observe(3)
+
+        assert histogram.as_metrics('Callback Time') == {
+            'Callback Time Count': 1,
+            'Callback Time Avg': 3.0,
+            'Callback Time P50': 3,
+            'Callback Time P95': 3,
+            'Callback Time P99': 3,
+            'Callback Time Max': 3,
+        }
+
+    def test_concurrent_observe(self):
+        """Test Case"""
+        histogram = Histogram()
+
+        def _observe():
+            for _ in range(1000):
+                histogram.observe(1)
+
+        threads = [threading.Thread(target=_observe) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert histogram.snapshot()['count'] == len(threads) * 1000
+
+
+class TestMetricsRegistry:
+    """Test Module"""
+
+    def test_snapshot(self):
+        """Test Case"""
+        registry = MetricsRegistry({'Errors': 0, 'Hits': 0})
+        configs = {1: 'config'}
+        registry.gauge('Active Playbooks', lambda: len(configs))
+        registry.histogram('Callback Time').observe(3)
+
+        assert registry.increment('Hits') is True
+        assert registry.increment('Unknown') is False
+        assert registry.update('Errors', 2) is True
+        assert registry.update('Unknown', 2) is False
+        registry.add('Custom', 'value')
+        configs[2] = 'config'
+
+        snapshot = registry.snapshot()
+        assert {label: snapshot[label] for label in ('Errors', 'Hits', 'Custom')} == {
+            'Errors': 2,
+            'Hits': 1,
+            'Custom': 'value',
+        }
+        assert snapshot['Active Playbooks'] == len(configs)
+        assert snapshot['Callback Time Count'] == 1
+        assert 'Unknown' not in snapshot
+
+        # the snapshot is a copy
+        snapshot['Hits'] = 10
+        assert registry.snapshot()['Hits'] == 1
+
+    def test_histogram(self):
+        """Test Case"""
+        registry = MetricsRegistry()
+        histogram = Histogram()
+
+        assert registry.histogram('Queue Wait', histogram) is histogram
+        assert registry.histogram('Queue Wait') is histogram
+
+    def test_replace(self):
+        """Test Case"""
+        registry = MetricsRegistry({'Hits': 1})
+        registry.gauge('In Flight', lambda: 0)
+        registry.replace({'Requests': 0})
+
+        assert registry.snapshot() == {'Requests': 0, 'In Flight': 0}
+
+    def test_concurrent_increment(self):
+        """Test Case"""
+        registry = MetricsRegistry({'Hits': 0})
+
+        def _increment():
+            for _ in range(1000):
+                registry.increment('Hits')
+
+        threads = [threading.Thread(target=_increment) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert registry.snapshot()['Hits'] == len(threads) * 1000
+
+    def test_gauge_error(self):
+        """Test Case"""
+        registry = MetricsRegistry({'Hits': 0})
+        registry.gauge('Broken', lambda: 1 / 0)
+        registry.gauge('In Flight', lambda: 0)
+
+        # a failing gauge is reported as None and the other metrics are still reported
+        assert registry.snapshot() == {'Hits': 0, 'Broken': None, 'In Flight': 0}
+
+    def test_metrics_snapshot(self):
+        """Test Case"""
+        registry = MetricsRegistry({'Hits': 1})
+        metrics = MetricsSnapshot(registry)
+
+        # assigned values are written through to the registry
+        metrics['Hits'] += 1
+        metrics['Alerts'] = 5
+        metrics.update({'Custom': 'value'})
+
+        assert metrics == {'Hits': 2, 'Alerts': 5, 'Custom': 'value'}
+        assert registry.snapshot() == metrics
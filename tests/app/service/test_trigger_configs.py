@@ -0,0 +1,64 @@
+"""TcEx Framework Module"""
+
+# standard library
+from types import SimpleNamespace
+
+# third-party
+import pytest
+
+# first-party
+from tcex.app.service.trigger_configs import TriggerConfigs
+
+
+class TestTriggerConfigs:
+    """Test Module"""
+
+    def setup_method(self):
+        """Configure setup before each test."""
+        self.configs = TriggerConfigs()
+        for trigger_id, event_type in [(3, 'alert'), (1, 'alert'), (2, 'case')]:
+            self.configs[trigger_id] = SimpleNamespace(
+                event_type=event_type, tc_playbook_out_variables='#App:1:a!String,#App:1:b!String'
+            )
+
+    def test_match(self):
+        """Test Case"""
+        # without filters all configs match, in insertion order
+        assert [trigger_id for trigger_id, _ in self.configs.match()] == [3, 1, 2]
+        assert [trigger_id for trigger_id, _ in self.configs.match(trigger_ids=[2, 3, 9])] == [
+            2,
+            3,
+        ]
+
+    def test_match_trigger_key(self):
+        """Test Case"""
+        with pytest.raises(RuntimeError, match='requires an index'):
+            self.configs.match(trigger_key='alert')
+
+        self.configs.index_by(lambda config: config.event_type)
+        assert [trigger_id for trigger_id, _ in self.configs.match(trigger_key='alert')] == [1, 3]
+        assert [
+            trigger_id for trigger_id, _ in self.configs.match(trigger_ids=[3], trigger_key='alert')
+        ] == [3]
+        assert self.configs.match(trigger_key='unknown') == []
+
+    def test_index_updates(self):
+        """Test Case"""
+        self.configs.index_by(lambda config: config.event_type)
+
+        # replacing a config moves it to the index key of the new config
+        self.configs[1] = SimpleNamespace(event_type='case', tc_playbook_out_variables=None)
+        assert [trigger_id for trigger_id, _ in self.configs.match(trigger_key='case')] == [1, 2]
+        assert self.configs.outputs(1) == []
+
+        del self.configs[2]
+        assert [trigger_id for trigger_id, _ in self.configs.match(trigger_key='case')] == [1]
+
+        self.configs.pop(1)
+        assert self.configs.match(trigger_key='case') == []
+        assert self.configs.outputs(1) == []
+
+    def test_outputs(self):
+        """Test Case"""
+        assert self.configs.outputs(3) == ['#App:1:a!String', '#App:1:b!String']
+        assert self.configs.outputs(9) == []
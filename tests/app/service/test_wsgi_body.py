@@ -0,0 +1,71 @@
+"""TcEx Framework Module"""
+
+# standard library
+from io import BytesIO
+
+# third-party
+import pytest
+
+# first-party
+from tcex.app.service.wsgi_body import FileWrapper, join_body
+
+
+class ClosingIterable:
+    """WSGI response iterable that records close calls."""
+
+    def __init__(self, chunks: list):
+        """Initialize instance properties."""
+        self.chunks = chunks
+        self.closed = False
+
+    def __iter__(self):
+        """Yield the chunks."""
+        yield from self.chunks
+
+    def close(self):
+        """Record the close call."""
+        self.closed = True
+
+
+class TestWsgiBody:
+    """Test Module"""
+
+    @pytest.mark.parametrize(
+        'body_data,expected',
+        [
+            (None, None),
+            ([], None),
+            ([b''], None),
+            ([b'single'], b'single'),
+            ([b'a', b'b', b'c'], b'abc'),
+            (['a', 'b', 'c'], 'abc'),
+            ((chunk for chunk in [b'gen', b'erator']), b'generator'),
+        ],
+    )
+    def test_join_body(self, body_data, expected):
+        """Test Case"""
+        assert join_body(body_data) == expected
+
+    def test_join_body_single_chunk_no_copy(self):
+        """Test Case"""
+        chunk = b'x' * 1024
+        assert join_body([chunk]) is chunk
+
+    def test_join_body_close(self):
+        """Test Case"""
+        body_data = ClosingIterable([b'a', b'b'])
+        assert join_body(body_data) == b'ab'
+        assert body_data.closed is True
+
+    def test_join_body_file_wrapper(self):
+        """Test Case"""
+        filelike = BytesIO(b'file content')
+        wrapper = FileWrapper(filelike, block_size=4)
+
+        assert list(FileWrapper(BytesIO(b'file content'), block_size=4)) == [
+            b'file',
+            b' con',
+            b'tent',
+        ]
+        assert join_body(wrapper) == b'file content'
+        assert filelike.closed is True
@@ -17,32 +17,17 @@ from tcex.pleb.scoped_property import scoped_property
 from tests.mock_app import MockApp
 
 
-def await_token_barrier_enabled(token_service: Token, timeout: int = 120):
-    """Await for token barrier to be enabled"""
-    while token_service._barrier.is_set():
-        time.sleep(1)
-        timeout -= 1
+def await_token_renewal(token_service: Token, key: str, timeout: int = 60):
+    """Await the renewal (or removal after a failed renewal) of the token for a key."""
+    expires = token_service.token_map.get(key, {}).get('token_expires')
+    while (
+        key in token_service.token_map
+        and token_service.token_map[key].get('token_expires') == expires
+    ):
+        time.sleep(0.1)
+        timeout -= 0.1  # type: ignore
         if timeout <= 0:
-            raise RuntimeError('Timeout expired while waiting for token barrier to be enabled')
-
-
-def await_token_barrier_disabled(token_service: Token, timeout: int = 60):
-    """Await token service to be disabled"""
-    result = token_service._barrier.wait(timeout=timeout)
-
-    if not result:
-        raise RuntimeError('Timeout Expired while waiting for token barrier to be disabled')
-
-
-def await_token_renewal_cycle(token_service: Token, timeout: int = 60):
-    """Await for a token renewal cycle to take place and finish"""
-    # wait until renewal monitor has enabled the barrier (is_set == False), which
-    # means that renewal monitor has started renewal process
-    await_token_barrier_enabled(token_service, timeout)
-
-    # wait until renewal monitor has disabled the barrier, meaning that renewal is done
-    await_token_barrier_disabled(token_service, timeout)
-
+            raise RuntimeError('Timeout expired while waiting for token renewal')
 
 
 @pytest.mark.run(order=3)
@@ -143,10 +128,6 @@ class TestToken:
 
         # get clean instance of tcex
         tcex = service_app().tcex
-        # Initialize Token module, which starts token renewal monitor and immediately kicks off
-        # first renewal cycle. Wait until initial cycle is finished before staging test token
-
-        await_token_renewal_cycle(tcex.app.token)
 
         token = 'JOB:3:ksKNpI:1567352558827:220:null:YPSaVFIGVbIkt1cfi4DzoG2bjWwsLBfwv9fJbeEx68A='
 
@@ -154,10 +135,9 @@ class TestToken:
         tcex.app.token.register_token(
             key=self.thread_name,
             token=token,
-            # expire token immediately. Note this by itself does not expire the token. This merely
-            # tells the renewal monitor that the token is expired. The token used in this test is
-            # a very old token which is expired.
-            expires=int(time.time()) - 999,
+            # the token used in this test is a very old token which is expired. the expiration
+            # is outside the token window so the renewal monitor does not renew the token.
+            expires=int(time.time()) + 9_999,
         )
 
         # ensure token was registered
@@ -179,10 +159,6 @@ class TestToken:
         # get clean instance of tcex
         tcex = service_app().tcex
 
-        # Initialize Token module, which starts token renewal monitor and immediately kicks off
-        # first renewal cycle. Wait until initial cycle is finished before staging test token
-        await_token_renewal_cycle(tcex.app.token)
-
         token = 'JOB:3:ksKNpI:1567352558827:220:null:YPSaVFIGVbIkt1cfi4DzoG2bjWwsLBfwv9fJbeEx68A='
         # register expired token
         tcex.app.token.register_token(
@@ -194,12 +170,8 @@ class TestToken:
             expires=int(time.time()) - 999,
         )
 
-        # ensure token was registered
-        assert tcex.app.token.token is not None, 'Token should not be None'
-        assert tcex.app.token.token.value == token
-
         # await a renewal attempt. Should fail, as token is very old and cannot be renewed
-        await_token_renewal_cycle(tcex.app.token)
+        await_token_renewal(tcex.app.token, self.thread_name)
 
         # renewal failed, token removed from tokens module
         assert tcex.app.token.token is None
@@ -215,10 +187,6 @@ class TestToken:
 
         app = service_app()
 
-        # Initialize Token module, which starts token renewal monitor and immediately kicks off
-        # first renewal cycle. Wait until initial cycle is finished before staging test token
-        await_token_renewal_cycle(app.tcex.app.token)
-
         # get token from fixture
         tc_token = app.service_token
         # Token itself is valid, but we tell tokens.py that it is now expired
@@ -228,11 +196,8 @@ class TestToken:
             key=self.thread_name, token=tc_token, expires=tc_token_expires
         )
 
-        # "expired" token registered successfully.
-        assert app.tcex.app.token.token is not None, 'Token should not be None'
-        assert app.tcex.app.token.token.value == tc_token
-
-        await_token_renewal_cycle(app.tcex.app.token)
+        # the renewal of the "expired" token is scheduled immediately
+        await_token_renewal(app.tcex.app.token, self.thread_name)
 
         assert app.tcex.app.token.token.value != tc_token, 'Token not was not renewed'
         assert app.tcex.session.tc.get('/v2/owners').ok, 'API call failed after token renewal'
@@ -246,27 +211,20 @@ class TestToken:
         monkeypatch.setenv('TC_TOKEN_SLEEP_INTERVAL', '5')
 
         app = service_app()
-        # Initialize Token module, which starts token renewal monitor and immediately kicks off
-        # first renewal cycle. Wait until initial cycle is finished before intentionally
-        # corrupting monitor thread state. Otherwise, test executes too fast and the
-        # corrupted state is never used, as everything happens within the initial renewal cycle
-        await_token_renewal_cycle(app.tcex.app.token)
-        tc_token = app.service_token
-        tc_token_expires = int(time.time()) - 999
-        # stage token to give renewal monitor some work
-        app.tcex.app.token.register_token(
-            key=self.thread_name, token=tc_token, expires=tc_token_expires
-        )
 
         # set token_window to a value that is not an integer to cause an exception
         # within the renewal monitor on purpose
         app.tcex.app.token.token_window = 'not an integer'  # type: ignore
 
-        # wait until renewal monitor enters a renewal cycle. Monitor should enable the barrier
-        # but the exception will cause it to exit before it disables the barrier.
-        await_token_barrier_enabled(app.tcex.app.token)
+        # stage token to give renewal monitor some work, which wakes the monitor
+        tc_token = app.service_token
+        tc_token_expires = int(time.time()) - 999
+        app.tcex.app.token.register_token(
+            key=self.thread_name, token=tc_token, expires=tc_token_expires
+        )
+        app.tcex.app.token.monitor_thread.join(timeout=10)
 
-        # attempt to retrieve token. Barrier await timeout should expire. RuntimeError expected
+        # attempt to retrieve token. The monitor exited unexpectedly, RuntimeError expected
         with pytest.raises(RuntimeError):
             _ = app.tcex.app.token.token
 
@@ -295,17 +253,9 @@ class TestToken:
 
         app = service_app()
 
-        # Initialize Token module, which starts token renewal monitor and immediately kicks off
-        # first renewal cycle. Wait until initial cycle is finished before staging test token
-        await_token_renewal_cycle(app.tcex.app.token)
-
         # get new API token
         tc_token = Sensitive(app.service_token)
 
-        # register new token with expiration time in the past, so that renewal monitor
-        # renews this token upon next execution of token renewal logic
-        tc_token_expires = int(time.time()) - 999
-
         # The goal is to prepare a token header but wait until it is no longer valid before it is
         # used. The token header is no longer valid because the renewal monitor would have
         # renewed the token being used in the header, which causes the old token to not be valid
@@ -337,8 +287,14 @@ class TestToken:
                 # monitor has already renewed the staged token, which corrupts test state
                 assert tc_token.value in header, 'Original token has been unexpectedly renewed.'
 
-                # await for renewal cycle, which should renew the token
-                await_token_renewal_cycle(app.tcex.app.token)
+                # register the token with an expiration time in the past and await the
+                # renewal, which makes the token in the header stale
+                app.tcex.app.token.register_token(
+                    key=threading.current_thread().name,
+                    token=tc_token,
+                    expires=int(time.time()) - 999,
+                )
+                await_token_renewal(app.tcex.app.token, threading.current_thread().name)
 
                 # ensure token has been renewed
                 assert app.tcex.app.token.token is not None, 'Token was not renewed'
@@ -358,11 +314,10 @@ class TestToken:
 
         monkeypatch.setattr(app.tcex.session.tc.auth, '_token_header', mock_token_header)
 
-        # register "expired" token for the current thread. Note: Token is actually good,
-        # but we are setting a bad expiration time on the token service so that the
-        # renewal monitor knows to renew it.
+        # register the token for the current thread, the token is renewed by the mocked
+        # token header method after the header is generated
         app.tcex.app.token.register_token(
-            key=threading.current_thread().name, token=tc_token, expires=tc_token_expires
+            key=threading.current_thread().name, token=tc_token, expires=int(time.time()) + 9_999
         )
 
         # make request which should first use a stale token then should automatically retry
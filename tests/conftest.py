@@ -16,6 +16,8 @@ from _pytest.monkeypatch import MonkeyPatch
 
 # first-party
 from tcex import TcEx
+from tcex.api.tc.v3.object_cache import ObjectCache
+from tcex.api.tc.v3.options_cache import OptionsCache
 from tcex.app.key_value_store import RedisClient
 from tcex.app.playbook.playbook import Playbook
 from tcex.logger.trace_logger import TraceLogger
@@ -34,6 +36,8 @@ _logger: TraceLogger = logging.getLogger(__name__.split('.', maxsplit=1)[0])  #
 def _reset_modules():
     """Reset modules that cached_property, scoped_property and registry"""
     registry._reset()
+    ObjectCache().disable()
+    OptionsCache.clear()
     cached_property._reset()
     scoped_property._reset()
 
@@ -1,16 +1,52 @@
 """TcEx Framework Module"""
 
 # standard library
+import gzip
+import json
 import logging
+import threading
+import time
 from collections.abc import Callable
 
 # third-party
 import pytest
 
 # first-party
+from tcex.logger.api_handler import ApiHandler, ApiHandlerFormatter
 from tests.mock_app import MockApp
 
 
+class MockResponse:
+    """Mock of a requests Response."""
+
+    def __init__(self, status_code: int):
+        """Initialize instance properties."""
+        self.status_code = status_code
+
+    @property
+    def ok(self) -> bool:
+        """Return True if the status code is a success code."""
+        return self.status_code < 400
+
+
+class MockSession:
+    """Mock of the TC session that stores the posted log events."""
+
+    def __init__(self, status_codes: list[int] | None = None):
+        """Initialize instance properties."""
+        self.posted: list[list[dict]] = []
+        self.status_codes = status_codes or []
+        self.thread_names: set[str] = set()
+
+    def post(self, url: str, headers: dict, data: bytes) -> MockResponse:
+        """Store the posted log events."""
+        self.thread_names.add(threading.current_thread().name)
+        if headers.get('Content-Encoding') == 'gzip':
+            data = gzip.decompress(data)
+        self.posted.append(json.loads(data))
+        return MockResponse(self.status_codes.pop(0) if self.status_codes else 200)
+
+
 @pytest.mark.run(order=1)
 class TestApiHandler:
     """Test Module"""
@@ -44,3 +80,73 @@ class TestApiHandler:
         assert any(record.levelno == logging.INFO for record in caplog.records)
         assert any(record.levelno == logging.WARNING for record in caplog.records)
         assert any(record.levelno == logging.ERROR for record in caplog.records)
+
+
+class TestApiHandlerShipper:
+    """Test Module"""
+
+    @staticmethod
+    def _logger(handler: ApiHandler) -> logging.Logger:
+        """Return a logger with the api handler."""
+        handler.setFormatter(ApiHandlerFormatter())
+        log = logging.Logger('pytest-api-handler')
+        log.setLevel(logging.DEBUG)
+        log.addHandler(handler)
+        return log
+
+    def test_api_handler_batches(self):
+        """Test Case"""
+        session = MockSession()
+        handler = ApiHandler(session, flush_limit=10, compress=True)  # type: ignore
+        log = self._logger(handler)
+
+        # log from worker threads and the main thread
+        threads = [
+            threading.Thread(target=lambda: [log.info('info') for _ in range(10)])
+            for _ in range(3)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        log.debug('debug')
+        handler.close()
+
+        assert sum(len(batch) for batch in session.posted) == 31
+        assert all(len(batch) <= 10 for batch in session.posted)
+
+    def test_api_handler_error_wakes_shipper(self):
+        """Test Case"""
+        session = MockSession()
+        handler = ApiHandler(session, flush_interval=60)  # type: ignore
+        log = self._logger(handler)
+
+        log.error('error')
+        for _ in range(50):
+            if session.posted:
+                break
+            time.sleep(0.01)
+
+        assert [e['message'] for batch in session.posted for e in batch] == ['error']
+        assert session.thread_names == {'tcex-api-log-shipper'}
+        handler.close()
+
+    def test_api_handler_max_batch_bytes(self):
+        """Test Case"""
+        handler = ApiHandler(MockSession(), max_batch_bytes=250)  # type: ignore
+        entries = [{'timestamp': 0, 'message': 'x' * 50, 'level': 'INFO'} for _ in range(5)]
+
+        batches = handler._batches(entries)  # noqa: SLF001
+        assert [len(b) for b in batches] == [2, 2, 1]
+
+    def test_api_handler_retry(self):
+        """Test Case"""
+        session = MockSession(status_codes=[503, 429, 200, 400])
+        handler = ApiHandler(session, backoff_factor=0, max_retries=3)  # type: ignore
+
+        handler.log_to_api([{'timestamp': 0, 'message': 'retry', 'level': 'INFO'}])
+        assert len(session.posted) == 3
+
+        # client errors are not retried
+        handler.log_to_api([{'timestamp': 0, 'message': 'rejected', 'level': 'INFO'}])
+        assert len(session.posted) == 4
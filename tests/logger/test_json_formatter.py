@@ -0,0 +1,90 @@
+"""TcEx Framework Module"""
+
+# standard library
+import json
+import logging
+
+# first-party
+from tcex.logger.json_formatter import JsonFormatter
+from tcex.logger.sensitive_filter import SensitiveFilter
+from tcex.logger.trace_logger import TraceLogger
+
+
+class RecordHandler(logging.Handler):
+    """Logger handler that stores all formatted records."""
+
+    def __init__(self):
+        """Initialize instance properties."""
+        super().__init__()
+        self.messages: list[str] = []
+
+    def emit(self, record: logging.LogRecord):
+        """Store the formatted record."""
+        self.messages.append(self.format(record))
+
+
+class Unrendered:
+    """Value that fails the test if it is rendered."""
+
+    def __str__(self) -> str:
+        """Fail if rendered."""
+        raise AssertionError('value was rendered')
+
+
+class TestJsonFormatter:
+    """Test Module"""
+
+    def setup_method(self):
+        """Configure setup before each test."""
+        self.handler = RecordHandler()
+        self.handler.setFormatter(JsonFormatter(static_fields={'app-name': 'pytest'}))
+        self.log = TraceLogger('pytest-json-formatter')
+        self.log.setLevel(logging.INFO)
+        self.log.addHandler(self.handler)
+
+    def test_log_fields(self):
+        """Test Case"""
+        self.log.log_fields(logging.INFO, feature='token', event='renewed', count=3)
+
+        data = json.loads(self.handler.messages[0])
+        assert data['feature'] == 'token'
+        assert data['event'] == 'renewed'
+        assert data['count'] == 3
+        assert data['level'] == 'INFO'
+        assert data['app-name'] == 'pytest'
+        assert data['function'] == 'test_log_fields'
+        assert 'message' not in data
+
+    def test_log_fields_disabled_level(self):
+        """Test Case"""
+        self.log.log_fields(logging.DEBUG, feature='token', value=Unrendered())
+        assert self.handler.messages == []
+
+    def test_log_fields_text_formatter(self):
+        """Test Case"""
+        self.handler.setFormatter(logging.Formatter('%(message)s'))
+        self.log.log_fields(logging.INFO, feature='token', event='renewed')
+        assert self.handler.messages == ['feature=token, event=renewed']
+
+    def test_message(self):
+        """Test Case"""
+        try:
+            raise RuntimeError('error')  # noqa: TRY301
+        except RuntimeError:
+            self.log.exception('message %s', 'value')
+
+        data = json.loads(self.handler.messages[0])
+        assert data['message'] == 'message value'
+        assert 'RuntimeError: error' in data['exception']
+
+    def test_sensitive_fields(self):
+        """Test Case"""
+        sensitive_filter = SensitiveFilter()
+        sensitive_filter.add('secret-token')
+        self.log.addFilter(sensitive_filter)
+
+        self.log.log_fields(logging.INFO, feature='token', token='secret-token', count=1)
+
+        data = json.loads(self.handler.messages[0])
+        assert data['token'] == '***'
+        assert data['count'] == 1
@@ -51,6 +51,9 @@ class TestLogs:
         for _ in range(0, 500):
             tcex.log.info(f'A long random string {tcex.util.random_string(randint(200, 250))}')
 
+        # wait for the background compression of the rotated log file
+        tcex.logger.flush()
+
         # simple assert to ensure the log file was created
         assert os.path.exists(
             os.path.join(tcex.inputs.model.tc_log_path, tcex.inputs.model.tc_log_file)
@@ -0,0 +1,177 @@
+"""TcEx Framework Module"""
+
+# standard library
+import logging
+import queue
+import threading
+
+# third-party
+import pytest
+
+# first-party
+from tcex.logger.queue_handler_custom import QueueHandlerCustom, QueueListenerCustom
+
+
+class RecordHandler(logging.Handler):
+    """Logger handler that stores all records and the handling thread name."""
+
+    def __init__(self):
+        """Initialize instance properties."""
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+        self.thread_names: set[str] = set()
+
+    def emit(self, record: logging.LogRecord):
+        """Store the record."""
+        self.records.append(record)
+        self.thread_names.add(threading.current_thread().name)
+
+
+class UpperFilter(logging.Filter):
+    """Logger filter that upper cases the message."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Update the record message."""
+        record.msg = str(record.msg).upper()
+        return True
+
+
+class TestQueueHandler:
+    """Test Module"""
+
+    def setup_method(self):
+        """Configure setup before each test."""
+        self.handler = RecordHandler()
+        self.log = logging.Logger('pytest-queue-handler')
+        self.log.setLevel(logging.DEBUG)
+
+    def _queue_handler(self, maxsize: int = 0, **kwargs) -> tuple[queue.Queue, QueueHandlerCustom]:
+        """Return a queue and a queue handler added to the test logger."""
+        log_queue = queue.Queue(maxsize=maxsize)
+        qh = QueueHandlerCustom(log_queue, **kwargs)
+        self.log.addHandler(qh)
+        return log_queue, qh
+
+    def test_queue_listener(self):
+        """Test Case"""
+        log_queue, _ = self._queue_handler(maxsize=100)
+        listener = QueueListenerCustom(log_queue, self.handler)
+        listener.filters.append(UpperFilter())
+        listener.start()
+
+        args = {'key': 'value'}
+        self.log.info('message %s', args)
+        args['key'] = 'changed'
+        try:
+            raise RuntimeError('error')  # noqa: TRY301
+        except RuntimeError:
+            self.log.exception('exception')
+        listener.stop()
+
+        assert len(self.handler.records) == 2
+        assert self.handler.records[0].getMessage() == "MESSAGE {'KEY': 'VALUE'}"
+        assert self.handler.records[1].exc_info is None
+        assert 'RuntimeError: error' in (self.handler.records[1].exc_text or '')
+        assert self.handler.thread_names == {listener.thread_name}
+
+    def test_queue_listener_flush(self):
+        """Test Case"""
+        log_queue, _ = self._queue_handler(maxsize=10)
+        listener = QueueListenerCustom(log_queue)
+        listener.add_handler(self.handler)
+        listener.start()
+
+        for i in range(100):
+            self.log.info(f'message {i}')
+        assert listener.flush() is True
+
+        assert len(self.handler.records) == 100
+
+        listener.remove_handler(self.handler)
+        assert listener.handlers == ()
+        listener.stop()
+
+    def test_queue_listener_flush_concurrent_logging(self):
+        """Test Case"""
+        log_queue, _ = self._queue_handler(maxsize=10)
+        listener = QueueListenerCustom(log_queue, self.handler)
+        listener.start()
+        self.log.info('before flush')
+
+        # records logged during the flush don't extend the wait
+        stop = threading.Event()
+
+        def _log():
+            while not stop.is_set():
+                self.log.info('during flush')
+
+        t = threading.Thread(target=_log)
+        t.start()
+        try:
+            assert listener.flush(timeout=5) is True
+        finally:
+            stop.set()
+            t.join()
+        assert self.handler.records[0].getMessage() == 'before flush'
+        listener.stop()
+
+    def test_queue_listener_flush_timeout(self):
+        """Test Case"""
+        release = threading.Event()
+
+        class BlockingHandler(logging.Handler):
+            """Logger handler that blocks until released."""
+
+            def emit(self, record: logging.LogRecord):  # noqa: ARG002
+                """Wait for the release."""
+                release.wait()
+
+        log_queue, _ = self._queue_handler(maxsize=1)
+        listener = QueueListenerCustom(log_queue, BlockingHandler())
+        listener.start()
+        self.log.info('message 0')
+        self.log.info('message 1')
+
+        # the wait is bounded while the listener is blocked (e.g., a hung handler)
+        assert listener.flush(timeout=0.05) is False
+
+        release.set()
+        assert listener.flush() is True
+        listener.stop()
+
+    def test_queue_handler_drop_policy(self):
+        """Test Case"""
+        log_queue, qh = self._queue_handler(maxsize=2, full_policy='drop')
+
+        for i in range(5):
+            self.log.info(f'message {i}')
+        assert qh.dropped == 3
+
+        # once space is available the dropped count is reported
+        listener = QueueListenerCustom(log_queue, self.handler)
+        listener.start()
+        listener.flush()
+        self.log.info('message 5')
+        listener.stop()
+
+        messages = [r.getMessage() for r in self.handler.records]
+        assert messages == [
+            'message 0',
+            'message 1',
+            'message 5',
+            'feature=logger, event=records-dropped, count=3',
+        ]
+
+    def test_queue_handler_block_policy(self):
+        """Test Case"""
+        log_queue, qh = self._queue_handler(maxsize=1, block_timeout=0.01)
+
+        self.log.info('message 0')
+        self.log.info('message 1')
+        assert qh.dropped == 1
+        assert log_queue.qsize() == 1
+
+    def test_queue_handler_invalid_policy(self):
+        """Test Case"""
+        with pytest.raises(ValueError, match='Invalid full_policy'):
+            QueueHandlerCustom(queue.Queue(), full_policy='invalid')
@@ -0,0 +1,86 @@
+"""TcEx Framework Module"""
+
+# standard library
+import logging
+
+# first-party
+from tcex.logger.rate_limit_filter import RateLimitFilter
+
+
+class RecordHandler(logging.Handler):
+    """Logger handler that stores all records."""
+
+    def __init__(self):
+        """Initialize instance properties."""
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord):
+        """Store the record."""
+        self.records.append(record)
+
+
+class TestRateLimitFilter:
+    """Test Module"""
+
+    def setup_method(self):
+        """Configure setup before each test."""
+        self.handler = RecordHandler()
+        self.log = logging.getLogger('pytest-rate-limit-filter')
+        self.log.handlers = [self.handler]
+        self.log.filters = []
+        self.log.propagate = False
+        self.log.setLevel(logging.DEBUG)
+
+    def test_rate_limit(self):
+        """Test Case"""
+        rate_limit_filter = RateLimitFilter(rate=0, burst=5, summary_interval=3600)
+        self.log.addFilter(rate_limit_filter)
+
+        for i in range(100):
+            self.log.warning(f'bad record {i}')
+            self.log.info('processed %s items', i)
+        self.log.error('error')
+
+        messages = [r.getMessage() for r in self.handler.records]
+        assert messages[:10:2] == [f'bad record {i}' for i in range(5)]
+        assert messages[1:10:2] == [f'processed {i} items' for i in range(5)]
+        assert messages[10:] == ['error']
+
+        rate_limit_filter.emit_summaries()
+        messages = [r.getMessage() for r in self.handler.records[11:]]
+        assert messages == [
+            'feature=logger, event=suppressed-messages, count=95, message="bad record 0"',
+            'feature=logger, event=suppressed-messages, count=95, message="processed %s items"',
+        ]
+        assert self.handler.records[11].filename == 'test_rate_limit_filter.py'
+
+    def test_rate_limit_refill(self):
+        """Test Case"""
+        rate_limit_filter = RateLimitFilter(rate=1_000_000, burst=1)
+        self.log.addFilter(rate_limit_filter)
+
+        # the bucket refills faster than records are logged
+        for i in range(10):
+            self.log.info(f'message {i}')
+        assert len(self.handler.records) >= 2
+
+    def test_periodic_summary(self):
+        """Test Case"""
+        rate_limit_filter = RateLimitFilter(rate=0, burst=1, summary_interval=3600)
+        self.log.addFilter(rate_limit_filter)
+
+        for _ in range(2):
+            self.log.info('message')
+
+        # the summary is logged by the first record after the summary interval, the
+        # record is logged from another line (a different message template)
+        rate_limit_filter._next_summary = 0  # noqa: SLF001
+        self.log.info('message')
+
+        messages = [r.getMessage() for r in self.handler.records]
+        assert messages == [
+            'message',
+            'feature=logger, event=suppressed-messages, count=1, message="message"',
+            'message',
+        ]
@@ -0,0 +1,61 @@
+"""TcEx Framework Module"""
+
+# standard library
+import gzip
+import logging
+from pathlib import Path
+
+# first-party
+from tcex.logger.rotating_file_handler_custom import RotatingFileHandlerCustom
+
+
+class TestRotatingFileHandler:
+    """Test Module"""
+
+    @staticmethod
+    def _logger(handler: logging.Handler) -> logging.Logger:
+        """Return a logger with the provided handler."""
+        log = logging.Logger('pytest-rotating-file-handler')
+        log.setLevel(logging.INFO)
+        log.addHandler(handler)
+        return log
+
+    def test_rotate(self, tmp_path: Path):
+        """Test Case"""
+        filename = tmp_path / 'rotate.log'
+        handler = RotatingFileHandlerCustom(
+            str(filename), maxBytes=1_000, backupCount=2, compress_level=1
+        )
+        log = self._logger(handler)
+
+        for i in range(100):
+            log.info(f'message {i:03} {"x" * 50}')
+        handler.close()
+
+        # the backup count is enforced after compression
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            'rotate.log',
+            'rotate.log.1.gz',
+            'rotate.log.2.gz',
+        ]
+
+        # the most recent backup contains the log events written before the current log file
+        with gzip.open(tmp_path / 'rotate.log.1.gz', 'rt') as fh:
+            last_backup_message = fh.read().splitlines()[-1]
+        first_message = filename.read_text().splitlines()[0]
+        assert int(last_backup_message.split()[1]) + 1 == int(first_message.split()[1])
+
+    def test_rotate_compression_thread(self, tmp_path: Path):
+        """Test Case"""
+        filename = tmp_path / 'rotate.log'
+        handler = RotatingFileHandlerCustom(str(filename), maxBytes=100, backupCount=1)
+        log = self._logger(handler)
+
+        for i in range(5):
+            log.info(f'message {i:03} {"x" * 50}')
+        handler.wait_for_compression()
+
+        assert handler._compressor is not None  # noqa: SLF001
+        assert (tmp_path / 'rotate.log.1.gz').exists()
+        assert not list(tmp_path.glob('*.rotating'))
+        handler.close()
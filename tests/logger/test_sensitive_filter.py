@@ -0,0 +1,53 @@
+"""TcEx Framework Module"""
+
+# standard library
+import logging
+
+# first-party
+from tcex.logger.sensitive_filter import SensitiveFilter
+
+
+class TestSensitiveFilter:
+    """Test Module"""
+
+    def setup_method(self):
+        """Configure setup before each test."""
+        self.filter = SensitiveFilter(name='pytest-sensitive-filter')
+
+    def test_replace(self):
+        """Test Case"""
+        self.filter.add('secret')
+        self.filter.add('secret-token')
+        self.filter.add('a.b*c')
+        self.filter.add('')
+
+        assert self.filter.replace('token=secret-token') == 'token=***'
+        assert self.filter.replace('secret and secret') == '*** and ***'
+        assert self.filter.replace('pattern=a.b*c, other=axbbc') == 'pattern=***, other=axbbc'
+
+    def test_replace_after_add(self):
+        """Test Case"""
+        assert self.filter.replace('secret') == 'secret'
+
+        self.filter.add('secret')
+        assert self.filter.replace('secret') == '***'
+
+        # the pattern is rebuilt after a new value is added
+        self.filter.add('token')
+        assert self.filter.replace('secret token') == '*** ***'
+
+    def test_filter(self):
+        """Test Case"""
+        self.filter.add(12345)
+        record = logging.makeLogRecord({'msg': 'id=%s, name=%s', 'args': (12345, 'name')})
+
+        assert self.filter.filter(record) is True
+        assert record.getMessage() == 'id=***, name=name'
+
+    def test_filter_no_values(self):
+        """Test Case"""
+        record = logging.makeLogRecord({'msg': 'id=%s', 'args': (12345,)})
+
+        assert self.filter.filter(record) is True
+        assert record.msg == 'id=%s'
+        assert record.getMessage() == 'id=12345'
@@ -0,0 +1,72 @@
+"""TcEx Framework Module"""
+
+# standard library
+import inspect
+import logging
+
+# first-party
+from tcex.logger.trace_logger import TraceLogger
+
+
+class RecordHandler(logging.Handler):
+    """Logger handler that stores all records."""
+
+    def __init__(self):
+        """Initialize instance properties."""
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord):
+        """Store the record."""
+        self.records.append(record)
+
+
+class TestTraceLogger:
+    """Test Module"""
+
+    def setup_method(self):
+        """Configure setup before each test."""
+        self.handler = RecordHandler()
+        self.log = TraceLogger('pytest-trace-logger')
+        self.log.setLevel(logging.TRACE)  # type: ignore
+        self.log.addHandler(self.handler)
+
+    def test_find_caller(self):
+        """Test Case"""
+        line_number = inspect.currentframe().f_lineno + 1  # type: ignore
+        self.log.debug('debug')
+
+        record = self.handler.records[0]
+        assert record.funcName == 'test_find_caller'
+        assert record.filename == 'test_trace_logger.py'
+        assert record.lineno == line_number
+
+    def test_find_caller_levels(self):
+        """Test Case"""
+        self.log.trace('trace')
+        self.log.debug('debug')
+        self.log.info('info')
+        self.log.log(logging.WARNING, 'warning')
+        try:
+            raise RuntimeError('error')  # noqa: TRY301
+        except RuntimeError:
+            self.log.exception('exception')
+
+        assert len(self.handler.records) == 5
+        for record in self.handler.records:
+            assert record.funcName == 'test_find_caller_levels', record.getMessage()
+            assert record.filename == 'test_trace_logger.py'
+
+    def test_find_caller_stacklevel(self):
+        """Test Case"""
+
+        def log_wrapper(message: str):
+            self.log.info(message, stacklevel=2)
+
+        log_wrapper('stacklevel')
+        assert self.handler.records[0].funcName == 'test_find_caller_stacklevel'
+
+    def test_find_caller_stack_info(self):
+        """Test Case"""
+        self.log.info('stack info', stack_info=True)
+        assert 'test_find_caller_stack_info' in (self.handler.records[0].stack_info or '')
@@ -0,0 +1,99 @@
+"""TcEx Framework Module"""
+
+# standard library
+import logging
+import threading
+from pathlib import Path
+
+# first-party
+from tcex.logger.trigger_file_handler import TriggerFileHandler
+
+
+class TestTriggerFileHandler:
+    """Test Module"""
+
+    @staticmethod
+    def _log_from_trigger(log: logging.Logger, trigger_id: str | None, message: str):
+        """Log a message from a thread with the provided trigger id."""
+
+        def _target():
+            log.info(message)
+
+        t = threading.Thread(target=_target)
+        t.trigger_id = trigger_id  # type: ignore
+        t.start()
+        t.join()
+
+    @staticmethod
+    def _logger(handler: logging.Handler) -> logging.Logger:
+        """Return a logger with the provided handler."""
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        log = logging.Logger('pytest-trigger-file-handler')
+        log.setLevel(logging.INFO)
+        log.addHandler(handler)
+        return log
+
+    def test_routing(self, tmp_path: Path):
+        """Test Case"""
+        handler = TriggerFileHandler(tmp_path)
+        log = self._logger(handler)
+
+        self._log_from_trigger(log, '1', 'trigger 1 message')
+        self._log_from_trigger(log, '2', 'trigger 2 message')
+        self._log_from_trigger(log, 'None', 'service thread message')
+        log.info('main thread message')
+        handler.close()
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            'trigger-id-1.log',
+            'trigger-id-2.log',
+        ]
+        assert (tmp_path / 'trigger-id-1.log').read_text() == 'trigger 1 message\n'
+        assert (tmp_path / 'trigger-id-2.log').read_text() == 'trigger 2 message\n'
+
+    def test_lru_handlers(self, tmp_path: Path):
+        """Test Case"""
+        handler = TriggerFileHandler(tmp_path, max_open=2)
+        log = self._logger(handler)
+
+        for trigger_id in ['1', '2', '3', '1']:
+            self._log_from_trigger(log, trigger_id, f'message {trigger_id}')
+
+        # trigger 2 was the least recently used handler
+        assert list(handler._handlers) == ['3', '1']  # noqa: SLF001
+
+        handler.close_trigger('1')
+        assert list(handler._handlers) == ['3']  # noqa: SLF001
+        handler.close()
+
+        # the evicted handler was reopened in append mode
+        assert (tmp_path / 'trigger-id-1.log').read_text() == 'message 1\nmessage 1\n'
+
+    def test_record_trigger_id(self, tmp_path: Path):
+        """Test Case"""
+        handler = TriggerFileHandler(tmp_path)
+        handler.setFormatter(logging.Formatter('%(message)s'))
+
+        # records handled in a queue listener thread carry the trigger id of the logging thread
+        record = logging.makeLogRecord({'msg': 'queued message', 'trigger_id': '5'})
+        handler.handle(record)
+        handler.close()
+
+        assert (tmp_path / 'trigger-id-5.log').read_text() == 'queued message\n'
+
+    def test_rotation(self, tmp_path: Path):
+        """Test Case"""
+        handler = TriggerFileHandler(tmp_path, max_bytes=64, backup_count=2)
+        log = self._logger(handler)
+
+        for i in range(20):
+            self._log_from_trigger(log, '1', f'trigger 1 message {i:02}')
+        handler.close()
+
+        # the trigger logfile is rotated and the backups are limited to backup_count
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            'trigger-id-1.log',
+            'trigger-id-1.log.1.gz',
+            'trigger-id-1.log.2.gz',
+        ]
+        assert (tmp_path / 'trigger-id-1.log').stat().st_size <= handler.max_bytes
@@ -1,16 +1,22 @@
 """TcEx Framework Module"""
 
 # standard library
+from datetime import timedelta
 from typing import cast
 from unittest.mock import patch
 
 # third-party
+import pytest
 from requests import PreparedRequest, Response, Session
 from urllib3.util.retry import Retry
 
 # first-party
 from tcex import TcEx
-from tcex.requests_external.external_session import CustomAdapter, default_too_many_requests_handler
+from tcex.requests_external.external_session import (
+    CurlLog,
+    CustomAdapter,
+    default_too_many_requests_handler,
+)
 from tcex.requests_external.rate_limit_handler import RateLimitHandler
 
 # set max backoff seconds
@@ -136,6 +142,57 @@ class TestUtils:
 
         assert response.status_code == 429
 
+    @staticmethod
+    def test_log_curl_sampling(tcex: TcEx):
+        """Test sampling and latency threshold of curl logging."""
+        s = tcex.session.external
+        s.log_curl = True
+        s.log_curl_sample_rate = 3
+
+        def _response(status_code: int, elapsed: float) -> Response:
+            response = Response()
+            response.status_code = status_code
+            response.elapsed = timedelta(seconds=elapsed)
+            response.request = PreparedRequest()
+            response.request.prepare(method='GET', url='https://www.google.com')
+            return response
+
+        with patch.object(CurlLog, '__str__', return_value='curl'):
+            # every 3rd successful request is logged
+            logged = [s._should_log_curl(_response(200, 0.1)) for _ in range(6)]
+            assert logged == [False, False, True, False, False, True]
+
+            # failed requests are logged when slower than the latency threshold
+            s.log_curl_latency_threshold = 1.0
+            assert s._should_log_curl(_response(500, 0.5)) is False
+            assert s._should_log_curl(_response(500, 1.5)) is True
+
+            # the session get path logs the sampled curl commands (the counter is at 7)
+            with (
+                patch.object(s.log, 'isEnabledFor', return_value=True),
+                patch.object(s.log, 'debug') as mock_debug,
+            ):
+                with patch.object(Session, 'request', return_value=_response(200, 0.1)):
+                    for _ in range(3):
+                        s.get('https://www.google.com')
+                curl_logs = [
+                    c for c in mock_debug.call_args_list if isinstance(c.args[-1], CurlLog)
+                ]
+                assert len(curl_logs) == 1
+
+                # failed requests faster than the latency threshold are not logged
+                mock_debug.reset_mock()
+                with patch.object(Session, 'request', return_value=_response(500, 0.5)):
+                    s.get('https://www.google.com')
+                curl_logs = [
+                    c for c in mock_debug.call_args_list if isinstance(c.args[-1], CurlLog)
+                ]
+                assert not curl_logs
+                assert mock_debug.call_count == 1
+
+        with pytest.raises(ValueError, match='Invalid sample rate'):
+            s.log_curl_sample_rate = 0
+
     # @staticmethod
     # def test_session_external_500_retry(tcex_proxy):
     #     """Test tc.session.external property."""